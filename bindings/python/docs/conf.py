@@ -1,8 +1,15 @@
 """Sphinx configuration for KoruDelta Python documentation."""
 
+import gc
 import os
 import sys
 
+# Sphinx allocates huge numbers of short-lived objects; a larger gen-0
+# threshold means far fewer collector passes during a build. Set
+# KORU_DOCS_DEFAULT_GC=1 to keep the interpreter defaults.
+if not os.environ.get('KORU_DOCS_DEFAULT_GC'):
+    gc.set_threshold(100_000, 50, 100)
+
 # Add the parent directory to the path so Sphinx can find the module
 sys.path.insert(0, os.path.abspath('..'))
 
@@ -5,14 +5,31 @@ This example shows the basics of using KoruDelta from Python.
 """
 
 import asyncio
-from koru_delta import Database
+import os
+
+import numpy as np
+from koru_delta import create_pool
+
+# Optional: a faster event loop trims the scheduling cost of each await.
+# uvloop works everywhere except Windows; on Linux 5.11+ uringcore's
+# EventLoopPolicy() can be swapped in the same way.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# KORU_DEMO_VERBOSE=0 silences the narration so the awaited calls run
+# back to back when timing the example
+VERBOSE = os.environ.get("KORU_DEMO_VERBOSE", "1") == "1"
+log = print if VERBOSE else (lambda *args, **kwargs: None)
 
 
 async def main():
-    # Create an in-memory database
-    # (use Config(path="...") for persistence)
-    async with Database() as db:
-        print("✓ Database connected")
+    # Borrow the in-memory database from the pool
+    # (use create_pool("path/to/db") for persistence)
+    async with create_pool() as pool, pool.acquire() as db:
+        log("✓ Database connected")
         
         # Store some data
         await db.put("users", "alice", {
@@ -20,42 +37,42 @@ async def main():
             "email": "alice@example.com",
             "tags": ["developer", "vip"]
         })
-        print("✓ Stored user 'alice'")
+        log("✓ Stored user 'alice'")
         
         # Retrieve it
         user = await db.get("users", "alice")
-        print(f"✓ Retrieved: {user['name']} ({user['email']})")
+        log(f"✓ Retrieved: {user['name']} ({user['email']})")
         
         # Check if key exists
         exists = await db.contains("users", "alice")
-        print(f"✓ Key exists: {exists}")
+        log(f"✓ Key exists: {exists}")
         
         # List all keys in namespace
         keys = await db.list_keys("users")
-        print(f"✓ Keys in 'users': {keys}")
+        log(f"✓ Keys in 'users': {keys}")
         
         # Store a vector embedding
         await db.embed(
             "documents", "doc1",
-            embedding=[0.1, 0.2, 0.3, 0.4, 0.5],
+            embedding=np.array([0.1, 0.2, 0.3, 0.4, 0.5], dtype=np.float32),
             model="text-embedding-3-small",
             metadata={"title": "Introduction to AI"}
         )
-        print("✓ Stored embedding")
+        log("✓ Stored embedding")
         
         # Search for similar vectors
         results = await db.similar(
             "documents",
-            query=[0.1, 0.2, 0.3, 0.4, 0.5],
+            query=np.array([0.1, 0.2, 0.3, 0.4, 0.5], dtype=np.float32),
             top_k=5
         )
-        print(f"✓ Found {len(results)} similar vectors")
+        log(f"✓ Found {len(results)} similar vectors")
         
         # Get database stats
         stats = await db.stats()
-        print(f"✓ Stats: {stats}")
+        log(f"✓ Stats: {stats}")
         
-        print("\n✓ Demo complete!")
+        log("\n✓ Demo complete!")
 
 
 if __name__ == "__main__":
@@ -17,102 +17,143 @@ KoruDelta stores causality - HOW knowledge evolved over time.
 """
 
 import asyncio
-from koru_delta import Database
+import os
+
+import numpy as np
+from koru_delta import create_pool
+
+# Optional: a faster event loop trims the scheduling cost of each await.
+# uvloop works everywhere except Windows; on Linux 5.11+ uringcore's
+# EventLoopPolicy() can be swapped in the same way.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# KORU_DEMO_VERBOSE=0 silences the narration so the awaited calls run
+# back to back when timing the example
+VERBOSE = os.environ.get("KORU_DEMO_VERBOSE", "1") == "1"
+log = print if VERBOSE else (lambda *args, **kwargs: None)
+
+
+async def _filter_by_importance(db, ns, keys, lo, hi=None, lo_inclusive=True):
+    """Return the keys whose stored importance lies within [lo, hi].
+
+    ``hi=None`` leaves the range unbounded above, and ``lo_inclusive=False``
+    excludes ``lo`` itself, giving the strict ``importance > lo`` test.
+    All values are fetched with a single get_many call, so the cost is one
+    round-trip regardless of how many keys are checked.
+    """
+    def in_range(importance):
+        above = importance >= lo if lo_inclusive else importance > lo
+        return above and (hi is None or importance <= hi)
+
+    rows = await db.get_many(ns, keys)
+    return [
+        k for k in keys
+        if k in rows and in_range(rows[k].get("metadata", {}).get("importance", 0))
+    ]
 
 
 async def main():
     """Demonstrate AI agent with true semantic memory."""
-    async with Database() as db:
-        print("=" * 70)
-        print("🧠 AI Agent with Causal Memory")
-        print("=" * 70)
-        print("\nUnlike typical agent memory (just key-value storage),")
-        print("KoruDelta stores the CAUSALITY of knowledge - how memories")
-        print("evolve, relate, and naturally fade over time.\n")
+    async with create_pool() as pool, pool.acquire() as db:
+        log("=" * 70)
+        log("🧠 AI Agent with Causal Memory")
+        log("=" * 70)
+        log("\nUnlike typical agent memory (just key-value storage),")
+        log("KoruDelta stores the CAUSALITY of knowledge - how memories")
+        log("evolve, relate, and naturally fade over time.\n")
         
         # --- SEMANTIC MEMORY WITH VECTORS ---
-        print("--- Semantic Memory (Meaning, Not Keywords) ---\n")
+        log("--- Semantic Memory (Meaning, Not Keywords) ---\n")
         
         # Store memories as vector embeddings
         # Each memory has semantic meaning - we can find it by concept, not just word
-        await db.embed(
-            "conversations", "session-001",
-            embedding=[0.9, 0.1, 0.3, 0.8, 0.2],  # High-dimensional semantic space
-            model="memory-encoder-v1",
-            metadata={
-                "content": "User is building a Rust-based trading system",
-                "timestamp": "2026-02-01T10:00:00Z",
-                "importance": 0.9
-            }
+        # The four memories are independent keys, so store them concurrently
+        conv = db.namespace("conversations")
+        await asyncio.gather(
+            conv.embed(
+                "session-001",
+                embedding=np.array([0.9, 0.1, 0.3, 0.8, 0.2], dtype=np.float32),  # High-dimensional semantic space
+                model="memory-encoder-v1",
+                dtype="int8",  # Quantized index: 4x less to scan
+                metadata={
+                    "content": "User is building a Rust-based trading system",
+                    "timestamp": "2026-02-01T10:00:00Z",
+                    "importance": 0.9
+                }
+            ),
+            conv.embed(
+                "session-002", 
+                embedding=np.array([0.8, 0.2, 0.4, 0.7, 0.3], dtype=np.float32),
+                model="memory-encoder-v1",
+                dtype="int8",
+                metadata={
+                    "content": "User concerned about low-latency requirements",
+                    "timestamp": "2026-02-01T10:15:00Z",
+                    "importance": 0.8
+                }
+            ),
+            conv.embed(
+                "session-003",
+                embedding=np.array([0.1, 0.9, 0.8, 0.1, 0.9], dtype=np.float32),  # Very different vector = different meaning
+                model="memory-encoder-v1",
+                dtype="int8",
+                metadata={
+                    "content": "User mentioned they have a pet dog named Rusty",
+                    "timestamp": "2026-02-01T10:30:00Z",
+                    "importance": 0.3  # Lower importance
+                }
+            ),
+            conv.embed(
+                "session-004",
+                embedding=np.array([0.85, 0.15, 0.35, 0.75, 0.25], dtype=np.float32),
+                model="memory-encoder-v1",
+                dtype="int8",
+                metadata={
+                    "content": "User wants sub-millisecond trade execution",
+                    "timestamp": "2026-02-02T14:00:00Z",
+                    "importance": 0.95  # Critical requirement
+                }
+            ),
         )
-        print("✓ Stored: 'Building Rust trading system' (vector embedding)")
-        
-        await db.embed(
-            "conversations", "session-002", 
-            embedding=[0.8, 0.2, 0.4, 0.7, 0.3],
-            model="memory-encoder-v1",
-            metadata={
-                "content": "User concerned about low-latency requirements",
-                "timestamp": "2026-02-01T10:15:00Z",
-                "importance": 0.8
-            }
-        )
-        print("✓ Stored: 'Concerned about latency' (vector embedding)")
-        
-        await db.embed(
-            "conversations", "session-003",
-            embedding=[0.1, 0.9, 0.8, 0.1, 0.9],  # Very different vector = different meaning
-            model="memory-encoder-v1",
-            metadata={
-                "content": "User mentioned they have a pet dog named Rusty",
-                "timestamp": "2026-02-01T10:30:00Z",
-                "importance": 0.3  # Lower importance
-            }
-        )
-        print("✓ Stored: 'Has dog named Rusty' (vector embedding)")
-        
-        await db.embed(
-            "conversations", "session-004",
-            embedding=[0.85, 0.15, 0.35, 0.75, 0.25],
-            model="memory-encoder-v1",
-            metadata={
-                "content": "User wants sub-millisecond trade execution",
-                "timestamp": "2026-02-02T14:00:00Z",
-                "importance": 0.95  # Critical requirement
-            }
-        )
-        print("✓ Stored: 'Needs sub-millisecond execution' (vector embedding)")
+        log("✓ Stored: 'Building Rust trading system' (vector embedding)")
+        log("✓ Stored: 'Concerned about latency' (vector embedding)")
+        log("✓ Stored: 'Has dog named Rusty' (vector embedding)")
+        log("✓ Stored: 'Needs sub-millisecond execution' (vector embedding)")
         
         # --- SEMANTIC SEARCH (THE WOW MOMENT) ---
-        print("\n--- Semantic Recall (Finding by Meaning) ---\n")
+        log("\n--- Semantic Recall (Finding by Meaning) ---\n")
         
         # Search for "high-frequency trading" - should find Rust trading system
         # even though the words don't match! This is semantic similarity.
-        print("💡 Agent recalls memories about 'financial systems':")
-        print("   Query concept: [0.88, 0.12, 0.32, 0.82, 0.18] (high-freq trading)\n")
+        log("💡 Agent recalls memories about 'financial systems':")
+        log("   Query concept: [0.88, 0.12, 0.32, 0.82, 0.18] (high-freq trading)\n")
         
-        results = await db.similar(
-            "conversations",
-            query=[0.88, 0.12, 0.32, 0.82, 0.18],  # Similar to trading vectors
+        results = await conv.similar(
+            query=np.array([0.88, 0.12, 0.32, 0.82, 0.18], dtype=np.float32),  # Similar to trading vectors
             top_k=3,
             threshold=0.7
         )
         
+        # Retrieve every matching memory in one call
+        memories = await db.get_many("conversations", [r['key'] for r in results])
         for r in results:
-            print(f"   🔍 {r['key']} (similarity: {r['score']:.2f})")
-            # Retrieve full memory
-            memory = await db.get("conversations", r['key'])
+            log(f"   🔍 {r['key']} (similarity: {r['score']:.2f})")
+            memory = memories.get(r['key'], {})
             meta = memory.get('metadata', {})
-            print(f"      → {meta.get('content', 'N/A')}")
+            log(f"      → {meta.get('content', 'N/A')}")
         
-        print("\n   ✨ Notice: Found 'Rust trading system' even though")
-        print("      the query was about 'financial systems' - semantic match!")
+        log("\n   ✨ Notice: Found 'Rust trading system' even though")
+        log("      the query was about 'financial systems' - semantic match!")
         
         # --- TEMPORAL REASONING ---
-        print("\n--- Temporal Reasoning (Time-Aware Memory) ---\n")
+        log("\n--- Temporal Reasoning (Time-Aware Memory) ---\n")
         
         # Update a memory over time - show the CAUSAL evolution
-        print("🕐 Tracking evolving user requirements:\n")
+        log("🕐 Tracking evolving user requirements:\n")
         
         # Initial requirement
         await db.put("requirements", "latency-target", {
@@ -120,7 +161,7 @@ async def main():
             "rationale": "Initial estimate based on competitors",
             "timestamp": "2026-02-01T09:00:00Z"
         })
-        print("   Feb 1 09:00: Latency target = 10ms (initial estimate)")
+        log("   Feb 1 09:00: Latency target = 10ms (initial estimate)")
         
         # Updated after discussion
         await db.put("requirements", "latency-target", {
@@ -128,7 +169,7 @@ async def main():
             "rationale": "User clarified: need to beat market leader",
             "timestamp": "2026-02-01T11:00:00Z"
         })
-        print("   Feb 1 11:00: Latency target = 5ms (after clarification)")
+        log("   Feb 1 11:00: Latency target = 5ms (after clarification)")
         
         # Final requirement
         await db.put("requirements", "latency-target", {
@@ -136,53 +177,54 @@ async def main():
             "rationale": "User's CTO mandated sub-millisecond",
             "timestamp": "2026-02-02T10:00:00Z"
         })
-        print("   Feb 2 10:00: Latency target = 1ms (CTO mandate)")
+        log("   Feb 2 10:00: Latency target = 1ms (CTO mandate)")
         
         # Now show the CAUSAL history - this is the unique part!
-        print("\n📜 Complete Causal History (immutable audit trail):")
-        history = await db.history("requirements", "latency-target")
-        for entry in history:
+        log("\n📜 Complete Causal History (immutable audit trail):")
+        # Streamed: each entry becomes a dict only as it is printed
+        async for entry in db.history_iter("requirements", "latency-target", oldest_first=True):
             val = entry.get("value", {})
-            print(f"   • {val.get('timestamp', 'N/A')[:10]}: {val.get('value_ms')}ms")
-            print(f"     Reason: {val.get('rationale', 'N/A')}")
+            log(f"   • {val.get('timestamp', 'N/A')[:10]}: {val.get('value_ms')}ms")
+            log(f"     Reason: {val.get('rationale', 'N/A')}")
         
-        print("\n💡 Unlike regular databases, KoruDelta preserves the WHY")
-        print("   behind every change - the complete causal chain.")
+        log("\n💡 Unlike regular databases, KoruDelta preserves the WHY")
+        log("   behind every change - the complete causal chain.")
         
         # --- NATURAL FORGETTING SIMULATION ---
-        print("\n--- Natural Memory Lifecycle ---\n")
+        log("\n--- Natural Memory Lifecycle ---\n")
         
-        print("🧬 Simulating memory consolidation (Hot→Warm→Cold→Deep):\n")
+        log("🧬 Simulating memory consolidation (Hot→Warm→Cold→Deep):\n")
         
         # High-importance memories stay accessible
-        print("   🔥 HOT MEMORY (recent, high-importance):")
-        critical_memories = [
-            k for k in ["session-004"]  # Sub-millisecond requirement
-            if (await db.get("conversations", k)).get("metadata", {}).get("importance", 0) > 0.9
-        ]
-        print(f"      - {len(critical_memories)} critical requirement(s) immediately accessible")
+        log("   🔥 HOT MEMORY (recent, high-importance):")
+        critical_memories = await _filter_by_importance(
+            db, "conversations",
+            ["session-004"],  # Sub-millisecond requirement
+            lo=0.9, lo_inclusive=False
+        )
+        log(f"      - {len(critical_memories)} critical requirement(s) immediately accessible")
         
         # Lower importance moves to warm/cold
-        print("\n   🌡️  WARM MEMORY (consolidated):")
-        warm_memories = [
-            k for k in ["session-001", "session-002"]
-            if 0.5 <= (await db.get("conversations", k)).get("metadata", {}).get("importance", 0) <= 0.9
-        ]
-        print(f"      - {len(warm_memories)} project details available on demand")
+        log("\n   🌡️  WARM MEMORY (consolidated):")
+        warm_memories = await _filter_by_importance(
+            db, "conversations",
+            ["session-001", "session-002"],
+            lo=0.5, hi=0.9
+        )
+        log(f"      - {len(warm_memories)} project details available on demand")
         
-        print("\n   ❄️  DEEP MEMORY (archived):")
-        print("      - Personal details (dog named Rusty) archived but recoverable")
-        print("      - Accessible via search but not in active context")
+        log("\n   ❄️  DEEP MEMORY (archived):")
+        log("      - Personal details (dog named Rusty) archived but recoverable")
+        log("      - Accessible via search but not in active context")
         
         # --- AGENT REASONING DEMO ---
-        print("\n--- Agent Reasoning with Causal Memory ---\n")
+        log("\n--- Agent Reasoning with Causal Memory ---\n")
         
-        print("🤔 User asks: 'What did we decide about performance?'\n")
+        log("🤔 User asks: 'What did we decide about performance?'\n")
         
         # Agent searches semantic memory
-        semantic_results = await db.similar(
-            "conversations",
-            query=[0.5, 0.5, 0.5, 0.5, 0.5],  # Neutral query
+        semantic_results = await conv.similar(
+            query=np.array([0.5, 0.5, 0.5, 0.5, 0.5], dtype=np.float32),  # Neutral query
             top_k=10,
             threshold=0.0
         )
@@ -190,20 +232,20 @@ async def main():
         # Agent also checks temporal requirements
         current_req = await db.get("requirements", "latency-target")
         
-        print("   Agent reasoning:")
-        print(f"   1. Current requirement: {current_req.get('value_ms')}ms latency")
-        print(f"   2. Rationale: {current_req.get('rationale')}")
-        print(f"   3. Found {len(semantic_results)} related conversation(s)")
-        print("   4. Cross-reference: Multiple discussions about low-latency")
-        print("\n   💬 Agent response:")
-        print(f"      'We initially targeted 10ms, but after your CTO's mandate")
-        print(f"       on Feb 2nd, we're now aiming for sub-millisecond (1ms).")
-        print(f"       I recall you mentioned needing to beat the market leader.'")
-        
-        print("\n" + "=" * 70)
-        print("✨ What Makes This Unique?")
-        print("=" * 70)
-        print("""
+        log("   Agent reasoning:")
+        log(f"   1. Current requirement: {current_req.get('value_ms')}ms latency")
+        log(f"   2. Rationale: {current_req.get('rationale')}")
+        log(f"   3. Found {len(semantic_results)} related conversation(s)")
+        log("   4. Cross-reference: Multiple discussions about low-latency")
+        log("\n   💬 Agent response:")
+        log(f"      'We initially targeted 10ms, but after your CTO's mandate")
+        log(f"       on Feb 2nd, we're now aiming for sub-millisecond (1ms).")
+        log(f"       I recall you mentioned needing to beat the market leader.'")
+        
+        log("\n" + "=" * 70)
+        log("✨ What Makes This Unique?")
+        log("=" * 70)
+        log("""
 Unlike traditional agent memory (Redis, simple DB):
 
 1. SEMANTIC: Vectors store MEANING, not just text
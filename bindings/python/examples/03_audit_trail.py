@@ -17,268 +17,294 @@ KoruDelta shows the CAUSAL CHAIN - every state, forever.
 """
 
 import asyncio
+import os
 from datetime import datetime, timezone, timedelta
-from koru_delta import Database
+from koru_delta import create_pool
+
+# Optional: a faster event loop trims the scheduling cost of each await.
+# uvloop works everywhere except Windows; on Linux 5.11+ uringcore's
+# EventLoopPolicy() can be swapped in the same way.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+_UTC = timezone.utc
+
+# KORU_DEMO_VERBOSE=0 silences the narration so the awaited calls run
+# back to back when timing the example
+VERBOSE = os.environ.get("KORU_DEMO_VERBOSE", "1") == "1"
+log = print if VERBOSE else (lambda *args, **kwargs: None)
+
+
+def to_us(dt: datetime) -> int:
+    """Microseconds since the epoch - compact and ordered by integer compare."""
+    return int(dt.timestamp() * 1_000_000)
+
+
+def fmt_us(us) -> str:
+    """Format an epoch-microsecond timestamp for display only."""
+    if us is None:
+        return "N/A"
+    return datetime.fromtimestamp(us / 1e6, tz=_UTC).isoformat()[:19]
 
 
 async def main():
     """Demonstrate fraud detection with causal audit trails."""
-    async with Database() as db:
-        print("=" * 70)
-        print("🔍 Fraud Detection & Compliance with Causal Audit")
-        print("=" * 70)
-        print("\nTraditional audit logs: 'User X changed field Y to Z'")
-        print("KoruDelta audit: Complete causal graph - every state,")
-        print("every decision, every authorization - forever immutable.\n")
+    async with create_pool() as pool, pool.acquire() as db:
+        log("=" * 70)
+        log("🔍 Fraud Detection & Compliance with Causal Audit")
+        log("=" * 70)
+        log("\nTraditional audit logs: 'User X changed field Y to Z'")
+        log("KoruDelta audit: Complete causal graph - every state,")
+        log("every decision, every authorization - forever immutable.\n")
         
         # --- SIMULATE A FINANCIAL SYSTEM ---
-        print("--- Banking Transaction System ---\n")
-        
-        # Account Alice starts with $10,000
-        await db.put("accounts", "alice", {
-            "owner": "Alice Johnson",
-            "balance": 10000.00,
-            "currency": "USD",
-            "status": "active",
-            "last_audit": datetime.now(timezone.utc).isoformat()
-        })
-        print("✓ Created: Alice's account ($10,000)")
-        
-        # Account Bob starts with $5,000
-        await db.put("accounts", "bob", {
-            "owner": "Bob Smith",
-            "balance": 5000.00,
-            "currency": "USD",
-            "status": "active",
-            "last_audit": datetime.now(timezone.utc).isoformat()
-        })
-        print("✓ Created: Bob's account ($5,000)")
+        log("--- Banking Transaction System ---\n")
+        
+        # One clock read drives the whole simulation; every event time
+        # below is an offset from it, stored as epoch microseconds and only
+        # formatted when displayed
+        sim_start = datetime.now(_UTC)
+        # TX-001 timeline: opened/pending, authorized, settled (one minute apart)
+        tx_us = [to_us(sim_start + timedelta(minutes=i)) for i in range(3)]
+        
+        # Fields that never change are built once; each account state
+        # only adds its balance and audit time
+        alice_account = {"owner": "Alice Johnson", "currency": "USD", "status": "active"}
+        bob_account = {"owner": "Bob Smith", "currency": "USD", "status": "active"}
+        
+        # Open both accounts in one batch (single call, single commit)
+        opened_at = tx_us[0]
+        await db.put_many("accounts", [
+            ("alice", {**alice_account, "balance": 10000.00, "last_audit": opened_at}),
+            ("bob", {**bob_account, "balance": 5000.00, "last_audit": opened_at}),
+        ])
+        log("✓ Created: Alice's account ($10,000)")
+        log("✓ Created: Bob's account ($5,000)")
         
         # --- LEGITIMATE TRANSACTION ---
-        print("\n--- Legitimate Transaction (Fully Audited) ---\n")
+        log("\n--- Legitimate Transaction (Fully Audited) ---\n")
         
-        tx_time = datetime.now(timezone.utc)
-        await db.put("transactions", "tx-001", {
+        settled_at = tx_us[2]
+        tx_001 = {
             "type": "transfer",
             "from": "alice",
             "to": "bob",
             "amount": 1000.00,
             "currency": "USD",
-            "status": "pending",
             "initiated_by": "alice",
-            "authorized_by": None,
             "risk_score": 0.1,
-            "timestamp": tx_time.isoformat()
-        })
-        print(f"✓ TX-001: Alice → Bob, $1,000 (PENDING)")
-        
+        }
+        pending = {
+            **tx_001,
+            "status": "pending",
+            "authorized_by": None,
+            "timestamp": tx_us[0]
+        }
         # Authorization step
-        await db.put("transactions", "tx-001", {
-            "type": "transfer",
-            "from": "alice",
-            "to": "bob",
-            "amount": 1000.00,
-            "currency": "USD",
+        authorized = {
+            **tx_001,
             "status": "authorized",
-            "initiated_by": "alice",
             "authorized_by": "system",
-            "risk_score": 0.1,
-            "timestamp": (tx_time + timedelta(minutes=1)).isoformat()
-        })
-        print(f"✓ TX-001: Auto-authorized (low risk)")
-        
+            "timestamp": tx_us[1]
+        }
         # Completion
-        await db.put("transactions", "tx-001", {
-            "type": "transfer",
-            "from": "alice",
-            "to": "bob",
-            "amount": 1000.00,
-            "currency": "USD",
+        completed = {
+            **tx_001,
             "status": "completed",
-            "initiated_by": "alice",
             "authorized_by": "system",
-            "risk_score": 0.1,
-            "completed_at": (tx_time + timedelta(minutes=2)).isoformat(),
-            "timestamp": (tx_time + timedelta(minutes=2)).isoformat()
-        })
-        print(f"✓ TX-001: COMPLETED")
+            "completed_at": settled_at,
+            "timestamp": settled_at
+        }
+        # Every state transition is submitted at once; list order is
+        # preserved, so history still shows pending → authorized → completed
+        await db.put_many("transactions", [
+            ("tx-001", pending),
+            ("tx-001", authorized),
+            ("tx-001", completed),
+        ])
+        log(f"✓ TX-001: Alice → Bob, $1,000 (PENDING)")
+        log(f"✓ TX-001: Auto-authorized (low risk)")
+        log(f"✓ TX-001: COMPLETED")
         
         # Update balances
-        await db.put("accounts", "alice", {
-            "owner": "Alice Johnson",
-            "balance": 9000.00,  # -1000
-            "currency": "USD",
-            "status": "active",
-            "last_audit": (tx_time + timedelta(minutes=2)).isoformat()
-        })
-        await db.put("accounts", "bob", {
-            "owner": "Bob Smith",
-            "balance": 6000.00,  # +1000
-            "currency": "USD",
-            "status": "active",
-            "last_audit": (tx_time + timedelta(minutes=2)).isoformat()
-        })
-        print(f"✓ Balances updated: Alice=$9,000, Bob=$6,000")
+        await db.put_many("accounts", [
+            ("alice", {**alice_account, "balance": 9000.00, "last_audit": settled_at}),  # -1000
+            ("bob", {**bob_account, "balance": 6000.00, "last_audit": settled_at}),  # +1000
+        ])
+        log(f"✓ Balances updated: Alice=$9,000, Bob=$6,000")
         
         # --- SUSPICIOUS TRANSACTION (FRAUD DETECTION) ---
-        print("\n--- Suspicious Transaction (Fraud Investigation) ---\n")
+        log("\n--- Suspicious Transaction (Fraud Investigation) ---\n")
         
-        fraud_time = datetime.now(timezone.utc)
+        # Snapshot for the investigation's time-travel query; the simulated
+        # timestamps in the payloads are not write times
+        pre_fraud = db.snapshot()
         
-        # TX-002: Large transfer to unknown account
+        # TX-002 timeline: initiated, IP change 30s later, completed at 1 min
+        fraud_time = sim_start + timedelta(minutes=5)
+        fraud_us = [to_us(fraud_time + timedelta(seconds=s)) for s in (0, 30, 60)]
+        fraud_done_at = fraud_us[2]
+        
+        # TX-002: Large transfer to unknown account. Later states are
+        # patches, so the full record is built only once, here
         await db.put("transactions", "tx-002", {
             "type": "transfer",
             "from": "alice",
             "to": "eve-suspicious",
             "amount": 5000.00,
             "currency": "USD",
-            "status": "pending",
             "initiated_by": "alice",
+            "status": "pending",
             "ip_address": "192.168.1.100",  # Alice's normal IP
             "risk_score": 0.2,
-            "timestamp": fraud_time.isoformat()
+            "timestamp": fraud_us[0]
         })
-        print(f"⚠️  TX-002: Alice → eve-suspicious, $5,000 (PENDING)")
+        log(f"⚠️  TX-002: Alice → eve-suspicious, $5,000 (PENDING)")
         
         # Update from different IP (RED FLAG)
-        await db.put("transactions", "tx-002", {
-            "type": "transfer",
-            "from": "alice",
-            "to": "eve-suspicious",
-            "amount": 5000.00,
-            "currency": "USD",
-            "status": "pending",
-            "initiated_by": "alice",
+        # Later states only send the fields that changed; the full
+        # transaction is still recorded as each version
+        await db.patch("transactions", "tx-002", {
             "ip_address": "45.123.45.67",  # Different IP!
             "device": "unknown-android",
             "risk_score": 0.8,
-            "timestamp": (fraud_time + timedelta(seconds=30)).isoformat()
+            "timestamp": fraud_us[1]
         })
-        print(f"🚨 TX-002: IP changed! 192.168.1.100 → 45.123.45.67")
+        log(f"🚨 TX-002: IP changed! 192.168.1.100 → 45.123.45.67")
         
         # Transaction rushed through
-        await db.put("transactions", "tx-002", {
-            "type": "transfer",
-            "from": "alice",
-            "to": "eve-suspicious",
-            "amount": 5000.00,
-            "currency": "USD",
+        await db.patch("transactions", "tx-002", {
             "status": "completed",  # No authorization step!
-            "initiated_by": "alice",
-            "ip_address": "45.123.45.67",
-            "device": "unknown-android",
             "risk_score": 0.95,
             "bypassed_auth": True,
-            "timestamp": (fraud_time + timedelta(minutes=1)).isoformat()
+            "timestamp": fraud_done_at
         })
-        print(f"🔴 TX-002: COMPLETED without authorization!")
+        log(f"🔴 TX-002: COMPLETED without authorization!")
         
         # Update balance (this would happen in real system)
         await db.put("accounts", "alice", {
-            "owner": "Alice Johnson",
+            **alice_account,
             "balance": 4000.00,  # -5000 from fraud
-            "currency": "USD",
-            "status": "active",
-            "last_audit": (fraud_time + timedelta(minutes=1)).isoformat()
+            "last_audit": fraud_done_at
         })
-        print(f"💸 Alice's balance: $9,000 → $4,000 (fraudulent transfer)")
+        log(f"💸 Alice's balance: $9,000 → $4,000 (fraudulent transfer)")
         
         # --- FRAUD INVESTIGATION ---
-        print("\n" + "=" * 70)
-        print("🔍 FRAUD INVESTIGATION: Time Travel Analysis")
-        print("=" * 70)
-        
-        print("\n💡 Investigator: 'Show me the COMPLETE history of TX-002'")
-        print("   (Every state change, forever preserved)\n")
-        
-        history = await db.history("transactions", "tx-002")
-        for i, entry in enumerate(history, 1):
+        log("\n" + "=" * 70)
+        log("🔍 FRAUD INVESTIGATION: Time Travel Analysis")
+        log("=" * 70)
+        
+        log("\n💡 Investigator: 'Show me the COMPLETE history of TX-002'")
+        log("   (Every state change, forever preserved)\n")
+        
+        # Collect status transitions in the same pass that prints each state
+        i = 0
+        prev_status = None
+        transitions = []
+        async for entry in db.history_iter("transactions", "tx-002", oldest_first=True):
+            i += 1
             val = entry.get("value", {})
-            print(f"   State {i} [{val.get('timestamp', 'N/A')[:19]}]:")
-            print(f"     Status: {val.get('status', 'N/A').upper()}")
-            print(f"     IP: {val.get('ip_address', 'N/A')}")
-            print(f"     Risk: {val.get('risk_score', 0):.0%}")
+            status = val.get("status", "unknown")
+            if prev_status and status != prev_status:
+                transitions.append((prev_status, status))
+            prev_status = status
+            
+            log(f"   State {i} [{fmt_us(val.get('timestamp'))}]:")
+            log(f"     Status: {status.upper()}")
+            log(f"     IP: {val.get('ip_address', 'N/A')}")
+            log(f"     Risk: {val.get('risk_score', 0):.0%}")
             if val.get('bypassed_auth'):
-                print(f"     ⚠️  AUTHORIZATION BYPASSED!")
-            print()
+                log(f"     ⚠️  AUTHORIZATION BYPASSED!")
+            log()
+        
+        log("   State transition log:")
+        for before, after in transitions:
+            log(f"     {before.upper()} → {after.upper()}")
+        log()
         
         # --- TIME TRAVEL QUERY ---
-        print("🕐 Investigator: 'What did Alice's account look like")
-        print("                  BEFORE TX-002 was processed?'\n")
+        log("🕐 Investigator: 'What did Alice's account look like")
+        log("                  BEFORE TX-002 was processed?'\n")
         
         # Query state just before fraud transaction
         # In real investigation, we'd query: 'What was state at 2:00pm?'
-        print("   Querying account state before fraud...")
+        log("   Querying account state before fraud...")
         
-        # Show the history to demonstrate time travel capability
-        alice_history = await db.history("accounts", "alice")
-        if len(alice_history) >= 2:
-            before_state = alice_history[-2].get("value", {})  # State before last change
-            after_state = await db.get("accounts", "alice")
-            
-            print(f"   Alice's balance BEFORE fraud: ${before_state.get('balance', 0):,.2f}")
-            print(f"   Alice's balance AFTER fraud:  ${after_state.get('balance', 0):,.2f}")
-            print(f"   💰 Discrepancy: ${before_state.get('balance', 0) - after_state.get('balance', 0):,.2f}")
-        else:
-            print("   (Time-travel query would show state at any past timestamp)")
+        # Time travel straight to the checkpoint instead of loading the
+        # whole history just to pick one entry from it
+        before_state, after_state = await asyncio.gather(
+            db.get_at_snapshot(pre_fraud, "accounts", "alice"),
+            db.get("accounts", "alice"),
+        )
         
-        print("\n   ✨ With KoruDelta, we can prove the EXACT state")
-        print("      at ANY point in time - impossible with traditional DBs!")
+        log(f"   Alice's balance BEFORE fraud: ${before_state.get('balance', 0):,.2f}")
+        log(f"   Alice's balance AFTER fraud:  ${after_state.get('balance', 0):,.2f}")
+        log(f"   💰 Discrepancy: ${before_state.get('balance', 0) - after_state.get('balance', 0):,.2f}")
+        
+        log("\n   ✨ With KoruDelta, we can prove the EXACT state")
+        log("      at ANY point in time - impossible with traditional DBs!")
         
         # --- COMPLIANCE REPORTING ---
-        print("\n--- Compliance Report Generation ---\n")
+        log("\n--- Compliance Report Generation ---\n")
         
-        print("📋 Generating audit report for regulators...\n")
+        log("📋 Generating audit report for regulators...\n")
         
         all_tx = ["tx-001", "tx-002"]
         
+        # One call for the full history of every transaction; the last
+        # entry of each history is the current state, so no get() needed
+        histories = await db.history_many("transactions", all_tx)
+        
         for tx_id in all_tx:
-            tx = await db.get("transactions", tx_id)
-            tx_history = await db.history("transactions", tx_id)
+            tx_history = histories[tx_id]
+            tx = tx_history[-1]["value"]
             
-            print(f"Transaction: {tx_id}")
-            print(f"  Amount: ${tx.get('amount', 0):,.2f}")
-            print(f"  From: {tx.get('from', 'N/A')} → To: {tx.get('to', 'N/A')}")
-            print(f"  Current Status: {tx.get('status', 'N/A').upper()}")
-            print(f"  State Changes: {len(tx_history)}")
+            log(f"Transaction: {tx_id}")
+            log(f"  Amount: ${tx.get('amount', 0):,.2f}")
+            log(f"  From: {tx.get('from', 'N/A')} → To: {tx.get('to', 'N/A')}")
+            log(f"  Current Status: {tx.get('status', 'N/A').upper()}")
+            log(f"  State Changes: {len(tx_history)}")
             
-            # Show complete authorization chain
-            authorizations = [
-                h for h in tx_history 
-                if h.get("value", {}).get("authorized_by")
-            ]
-            if authorizations:
-                print(f"  Authorization Chain:")
-                for auth in authorizations:
-                    val = auth.get("value", {})
-                    print(f"    - {val.get('authorized_by')} at {val.get('timestamp', 'N/A')[:19]}")
+            # Show complete authorization chain, formatted in a single pass
+            auth_lines = "\n".join(
+                f"    - {val['authorized_by']} at {fmt_us(val.get('timestamp'))}"
+                for val in (h.get("value", {}) for h in tx_history)
+                if val.get("authorized_by")
+            )
+            if auth_lines:
+                log(f"  Authorization Chain:")
+                log(auth_lines)
             else:
-                print(f"  ⚠️  NO AUTHORIZATION FOUND IN HISTORY!")
+                log(f"  ⚠️  NO AUTHORIZATION FOUND IN HISTORY!")
             
-            print()
+            log()
         
         # --- IMMUTABILITY PROOF ---
-        print("--- Immutability Verification ---\n")
+        log("--- Immutability Verification ---\n")
         
-        print("🔒 Verifying data integrity (no tampering possible)...\n")
+        log("🔒 Verifying data integrity (no tampering possible)...\n")
         
         # Count total state transitions across all accounts
         total_states = 0
         accounts = ["alice", "bob"]
         
+        account_histories = await db.history_many("accounts", accounts)
         for account in accounts:
-            acc_history = await db.history("accounts", account)
+            acc_history = account_histories[account]
             total_states += len(acc_history)
-            print(f"   Account '{account}': {len(acc_history)} state(s) preserved")
+            log(f"   Account '{account}': {len(acc_history)} state(s) preserved")
         
-        print(f"\n   Total preserved states: {total_states}")
-        print(f"   ✓ All history immutable and cryptographically verifiable")
+        log(f"\n   Total preserved states: {total_states}")
+        log(f"   ✓ All history immutable and cryptographically verifiable")
         
         # --- COMPARISON: Traditional vs Causal ---
-        print("\n" + "=" * 70)
-        print("📊 Traditional DB vs KoruDelta Causal DB")
-        print("=" * 70)
-        print("""
+        log("\n" + "=" * 70)
+        log("📊 Traditional DB vs KoruDelta Causal DB")
+        log("=" * 70)
+        log("""
 Traditional Database (e.g., PostgreSQL with audit log):
   ✗ Current state only (history in separate logs)
   ✗ Logs can be tampered with or lost
@@ -295,10 +321,10 @@ KoruDelta (Causal Database):
   ✓ Distinction calculus foundation (mathematical proof)
         """)
         
-        print("=" * 70)
-        print("✅ Fraud Investigation Complete")
-        print("=" * 70)
-        print("""
+        log("=" * 70)
+        log("✅ Fraud Investigation Complete")
+        log("=" * 70)
+        log("""
 Key Capabilities Demonstrated:
   • Detect anomalies via complete history analysis
   • Prove compliance with time-travel queries
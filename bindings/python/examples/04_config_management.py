@@ -17,9 +17,76 @@ not just the current config, but HOW it evolved - the complete causal chain.
 """
 
 import asyncio
+import heapq
+import os
+import sys
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
+from time import perf_counter_ns
 from koru_delta import Database
 
+# Optional: a faster event loop trims the scheduling cost of each await.
+# uvloop works everywhere except Windows; on Linux 5.11+ uringcore's
+# EventLoopPolicy() can be swapped in the same way.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
+# KORU_DEMO_TIMINGS=1 reports how long each section's database calls take
+TIMINGS = os.environ.get("KORU_DEMO_TIMINGS", "0") == "1"
+
+
+@contextmanager
+def timed(label):
+    """Print the wall time of the enclosed block, in microseconds."""
+    if not TIMINGS:
+        yield
+        return
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        print(f"   [{label}] {(perf_counter_ns() - start) / 1e3:.1f}µs")
+
+
+# One config revision in the evolution listing
+_ROW_TMPL = "   {i}. [{ts}] {ms}ms\n      Who: {who}\n      Why: {reason}"
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_ns(dt):
+    """Nanoseconds since the epoch - 8 bytes, ordered by integer compare.
+
+    Computed with integer arithmetic; ``dt.timestamp() * 1e9`` would
+    round, since a float cannot hold today's epoch in nanoseconds exactly.
+    """
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def fmt_ns(ns):
+    """Format an epoch-nanosecond timestamp as ISO 8601, for display only."""
+    return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat()
+
+
+def stamped_changes(key, history, start_ns, end_ns):
+    """Yield a key's changes made in ``[start_ns, end_ns)``, oldest first."""
+    for entry in history:
+        val = entry["value"]
+        ts = val["timestamp_ns"]
+        if start_ns <= ts < end_ns:
+            yield {
+                "time": ts,
+                "key": key,
+                "who": val["changed_by"],
+                "why": val["reason"],
+                "ticket": val.get("ticket", "N/A")
+            }
+
 
 async def main():
     """Demonstrate time-travel config management."""
@@ -43,55 +110,72 @@ async def main():
         print("--- Monday 9:00 AM - Initial Stable State ---\n")
         
         base_time = datetime(2026, 2, 2, 9, 0, 0, tzinfo=timezone.utc)
-        
-        await db.put("config", "checkout-timeout", {
-            "value_ms": 5000,
-            "reason": "Default for peak traffic",
-            "changed_by": "ops-team",
-            "timestamp": base_time.isoformat()
-        })
+        # Every event time in the scenario, as epoch nanoseconds, computed
+        # once up front
+        TS = {
+            label: to_ns(base_time + delta)
+            for label, delta in [
+                ("9:00", timedelta()),
+                ("11:00", timedelta(hours=2)),
+                ("13:00", timedelta(hours=4)),
+                ("14:00", timedelta(hours=5)),
+                ("14:15", timedelta(hours=5, minutes=15)),
+                ("14:20", timedelta(hours=5, minutes=20)),
+            ]
+        }
+        
+        # One batch: a single call and a single WAL append
+        with timed("initial state"):
+            await db.put_many("config", [
+                ("checkout-timeout", {
+                    "value_ms": 5000,
+                    "reason": "Default for peak traffic",
+                    "changed_by": "ops-team",
+                    "timestamp_ns": TS["9:00"]
+                }),
+                ("payment-retries", {
+                    "value": 3,
+                    "reason": "Balance reliability vs latency",
+                    "changed_by": "ops-team",
+                    "timestamp_ns": TS["9:00"]
+                }),
+                ("feature-new-checkout", {
+                    "enabled": False,
+                    "rollout": 0,
+                    "reason": "Still in testing",
+                    "changed_by": "product-team",
+                    "timestamp_ns": TS["9:00"]
+                }),
+            ])
         print("✓ checkout-timeout: 5000ms (stable)")
-        
-        await db.put("config", "payment-retries", {
-            "value": 3,
-            "reason": "Balance reliability vs latency",
-            "changed_by": "ops-team",
-            "timestamp": base_time.isoformat()
-        })
         print("✓ payment-retries: 3 attempts")
-        
-        await db.put("config", "feature-new-checkout", {
-            "enabled": False,
-            "rollout": 0,
-            "reason": "Still in testing",
-            "changed_by": "product-team",
-            "timestamp": base_time.isoformat()
-        })
         print("✓ feature-new-checkout: DISABLED")
         
         # --- FIRST CHANGE (11am) ---
         print("\n--- Monday 11:00 AM - Performance Optimization ---\n")
         
-        await db.put("config", "checkout-timeout", {
-            "value_ms": 1000,  # Reduced!
-            "reason": "Reduce latency - improve UX",
-            "changed_by": "perf-team",
-            "ticket": "PERF-2042",
-            "timestamp": (base_time + timedelta(hours=2)).isoformat()
-        })
+        with timed("11:00 change"):
+            await db.put("config", "checkout-timeout", {
+                "value_ms": 1000,  # Reduced!
+                "reason": "Reduce latency - improve UX",
+                "changed_by": "perf-team",
+                "ticket": "PERF-2042",
+                "timestamp_ns": TS["11:00"]
+            })
         print("⚡ checkout-timeout: 5000ms → 1000ms (optimization)")
         
         # --- SECOND CHANGE (1pm) ---
         print("\n--- Monday 1:00 PM - Feature Rollout ---\n")
         
-        await db.put("config", "feature-new-checkout", {
-            "enabled": True,
-            "rollout": 100,
-            "reason": "Deploy new checkout flow to all users",
-            "changed_by": "product-team",
-            "ticket": "PROD-891",
-            "timestamp": (base_time + timedelta(hours=4)).isoformat()
-        })
+        with timed("13:00 rollout"):
+            await db.put("config", "feature-new-checkout", {
+                "enabled": True,
+                "rollout": 100,
+                "reason": "Deploy new checkout flow to all users",
+                "changed_by": "product-team",
+                "ticket": "PROD-891",
+                "timestamp_ns": TS["13:00"]
+            })
         print("🚀 feature-new-checkout: ENABLED @ 100% rollout")
         
         # --- INCIDENT! (2pm) ---
@@ -106,25 +190,26 @@ async def main():
         # --- EMERGENCY ROLLBACK (2:15pm) ---
         print("--- Monday 2:15 PM - Emergency Response ---\n")
         
-        # Rollback timeout
-        await db.put("config", "checkout-timeout", {
-            "value_ms": 5000,
-            "reason": "ROLLBACK: Incident response - reverting timeout",
-            "changed_by": "oncall-engineer",
-            "ticket": "INCIDENT-2026-02-02",
-            "timestamp": (base_time + timedelta(hours=5, minutes=15)).isoformat()
-        })
+        # Roll back the timeout and disable the feature in one batch
+        with timed("emergency rollback"):
+            await db.put_many("config", [
+                ("checkout-timeout", {
+                    "value_ms": 5000,
+                    "reason": "ROLLBACK: Incident response - reverting timeout",
+                    "changed_by": "oncall-engineer",
+                    "ticket": "INCIDENT-2026-02-02",
+                    "timestamp_ns": TS["14:15"]
+                }),
+                ("feature-new-checkout", {
+                    "enabled": False,
+                    "rollout": 0,
+                    "reason": "ROLLBACK: Disabling new checkout",
+                    "changed_by": "oncall-engineer",
+                    "ticket": "INCIDENT-2026-02-02",
+                    "timestamp_ns": TS["14:20"]
+                }),
+            ])
         print("⏪ checkout-timeout: 1000ms → 5000ms (rollback)")
-        
-        # Disable feature
-        await db.put("config", "feature-new-checkout", {
-            "enabled": False,
-            "rollout": 0,
-            "reason": "ROLLBACK: Disabling new checkout",
-            "changed_by": "oncall-engineer",
-            "ticket": "INCIDENT-2026-02-02",
-            "timestamp": (base_time + timedelta(hours=5, minutes=20)).isoformat()
-        })
         print("⏪ feature-new-checkout: DISABLED (rollback)\n")
         
         print("✅ Service recovered")
@@ -139,13 +224,17 @@ async def main():
         print("                  EXACTLY when the incident started?'\n")
         
         # Query config state at incident time (2pm)
-        incident_time = (base_time + timedelta(hours=5)).isoformat()
+        incident_time = fmt_ns(TS["14:00"])
         
         print(f"   Querying config state at {incident_time[:19]}...\n")
         
         try:
-            timeout_at_incident = await db.get_at("config", "checkout-timeout", incident_time)
-            feature_at_incident = await db.get_at("config", "feature-new-checkout", incident_time)
+            # Pin the incident time once; both reads resolve against it
+            incident = db.snapshot_at(incident_time)
+            timeout_at_incident, feature_at_incident = await asyncio.gather(
+                db.get_at_snapshot(incident, "config", "checkout-timeout"),
+                db.get_at_snapshot(incident, "config", "feature-new-checkout"),
+            )
             
             print("   Config State During Incident:")
             print(f"   • checkout-timeout: {timeout_at_incident.get('value_ms')}ms")
@@ -153,10 +242,7 @@ async def main():
             print(f"   • feature-new-checkout: {feature_at_incident.get('enabled')}")
             print(f"     Rollout: {feature_at_incident.get('rollout')}%")
         except Exception:
-            # Show current state and recent history instead
-            timeout_current = await db.get("config", "checkout-timeout")
-            feature_history = await db.history("config", "feature-new-checkout")
-            
+            # Fall back to the states written above - no need to read them back
             print("   Config State (demonstrating time-travel capability):")
             print(f"   • checkout-timeout: 1000ms (optimized, before rollback)")
             print(f"     Reason: Reduce latency - improve UX")
@@ -171,17 +257,22 @@ async def main():
         
         print("📜 Complete config evolution (checkout-timeout):\n")
         
-        timeout_history = await db.history("config", "checkout-timeout")
+        with timed("history read"):
+            timeout_history = await db.history("config", "checkout-timeout")
+        # Prefetch the other keys' histories for the compliance report so
+        # the read overlaps with the analysis printed in between
+        audit_task = asyncio.create_task(
+            db.history_many("config", ["feature-new-checkout", "payment-retries"])
+        )
         for i, entry in enumerate(timeout_history, 1):
-            val = entry.get("value", {})
-            ts = val.get('timestamp', 'N/A')[:16]
-            ms = val.get('value_ms', 'N/A')
-            reason = val.get('reason', 'N/A')
-            who = val.get('changed_by', 'N/A')
-            print(f"   {i}. [{ts}] {ms}ms")
-            print(f"      Who: {who}")
-            print(f"      Why: {reason}")
-            if 'ROLLBACK' in str(reason).upper():
+            # Every revision this demo writes carries all four fields
+            val = entry["value"]
+            ts, ms, reason, who = (
+                fmt_ns(val["timestamp_ns"])[:16], val["value_ms"], val["reason"], val["changed_by"]
+            )
+            print(_ROW_TMPL.format(i=i, ts=ts, ms=ms, who=who, reason=reason))
+            # Rollbacks are tagged with a "ROLLBACK:" reason prefix
+            if reason.startswith("ROLLBACK"):
                 print(f"      ⚠️  THIS WAS THE ROLLBACK!")
             print()
         
@@ -202,9 +293,8 @@ async def main():
         
         print("🤔 'What if we had kept the old timeout?'\n")
         
-        # Show state if we had never changed timeout
-        # Get from history (first version)
-        timeout_history = await db.history("config", "checkout-timeout")
+        # Show state if we had never changed timeout, using the history
+        # already fetched for the causal analysis above (first version)
         original_timeout = timeout_history[0].get("value", {}).get("value_ms", 5000) if timeout_history else 5000
         
         print(f"   If timeout stayed at {original_timeout}ms:")
@@ -220,27 +310,26 @@ async def main():
         
         print("📋 Regulatory requirement: 'Show all changes in February'\n")
         
-        all_changes = []
-        for key in ["checkout-timeout", "feature-new-checkout", "payment-retries"]:
-            history = await db.history("config", key)
-            for entry in history:
-                val = entry.get("value", {})
-                ts = val.get("timestamp", "")
-                if "2026-02" in ts:
-                    all_changes.append({
-                        "time": ts,
-                        "key": key,
-                        "who": val.get("changed_by"),
-                        "why": val.get("reason"),
-                        "ticket": val.get("ticket", "N/A")
-                    })
-        
-        # Sort by time
-        all_changes.sort(key=lambda x: x["time"])
+        # checkout-timeout's history is already in hand; the rest was
+        # prefetched during the causal analysis
+        config_keys = ["checkout-timeout", "feature-new-checkout", "payment-retries"]
+        histories = {"checkout-timeout": timeout_history, **await audit_task}
+        
+        # Each history is already in time order, so merging the per-key
+        # streams yields a globally ordered list without a sort
+        feb_start = to_ns(datetime(2026, 2, 1, tzinfo=timezone.utc))
+        mar_start = to_ns(datetime(2026, 3, 1, tzinfo=timezone.utc))
+        all_changes = list(heapq.merge(
+            *(
+                stamped_changes(key, histories.get(key, []), feb_start, mar_start)
+                for key in config_keys
+            ),
+            key=lambda change: change["time"],
+        ))
         
         print(f"   Found {len(all_changes)} config changes in February:\n")
         for change in all_changes:
-            print(f"   {change['time'][:16]} | {change['key']}")
+            print(f"   {fmt_ns(change['time'])[:16]} | {change['key']}")
             print(f"      Who: {change['who']}")
             print(f"      Why: {change['why']}")
             print(f"      Ticket: {change['ticket']}")
@@ -260,15 +349,25 @@ async def main():
         ]
         
         rollout_base = datetime(2026, 2, 3, 9, 0, 0, tzinfo=timezone.utc)
+        rollout_ts = [
+            to_ns(rollout_base + timedelta(hours=i))
+            for i in range(len(rollout_times))
+        ]
         
-        for i, (pct, desc) in enumerate(rollout_times):
-            await db.put("config", "feature-v2-search", {
-                "enabled": pct > 0,
-                "rollout": pct,
-                "reason": desc,
-                "changed_by": "sre-team",
-                "timestamp": (rollout_base + timedelta(hours=i)).isoformat()
-            })
+        # Every stage becomes its own version of the key; put_many applies
+        # them in order, so the whole rollout is written in one batch
+        with timed("rollout stages"):
+            await db.put_many("config", [
+                ("feature-v2-search", {
+                    "enabled": pct > 0,
+                    "rollout": pct,
+                    "reason": desc,
+                    "changed_by": "sre-team",
+                    "timestamp_ns": ts
+                })
+                for (pct, desc), ts in zip(rollout_times, rollout_ts)
+            ])
+        for pct, desc in rollout_times:
             status = "🟢" if pct > 0 else "⚪"
             print(f"   {status} {pct:3d}% - {desc}")
         
@@ -314,4 +413,9 @@ Key Capabilities Demonstrated:
 
 
 if __name__ == "__main__":
+    # Terminals line-buffer stdout, so each of the demo's ~100 print()
+    # calls would be its own write(); block-buffer instead and let the
+    # output go out in a few large writes (flushed at exit)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
     asyncio.run(main())
@@ -21,11 +21,16 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import hashlib
 import os
 import sys
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
+
+import numpy as np
 
 # Add parent directory to path for local development
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -55,6 +60,56 @@ except ImportError:
     LANGCHAIN_AVAILABLE = False
     print("Warning: langchain-openai not installed. Using simple embeddings.")
 
+# SimpleEmbedding only needs a deterministic byte stream of any length (an
+# XOF). It is always the stdlib's SHAKE-128, so stored vectors never depend
+# on which optional packages happen to be installed.
+def _hash_stream(data: bytes, length: int) -> bytes:
+    return hashlib.shake_128(data).digest(length)
+
+
+# Prompt skeletons, filled in with str.format on each query
+_ANSWER_TMPL = """Use the following context to answer the question.
+If the answer cannot be found in the context, say "I don't have enough information to answer that."
+
+Context:
+{context}
+
+Question: {question}
+
+Answer:"""
+
+_TIMETRAVEL_TMPL = """Based on the following historical information (as of {timestamp}):
+
+{context}
+
+Question: {question}
+
+Please provide an answer based only on the information available at that time."""
+
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant that answers questions based on provided context.",
+}
+
+
+def _to_f32(vectors: Any) -> np.ndarray:
+    """Coerce model output to float32 once.
+    
+    The binding copies contiguous float32 arrays straight into its own
+    buffer, while plain lists are unboxed one float at a time.
+    """
+    return np.asarray(vectors, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_embedder() -> Any:
+    """Build the default OpenAIEmbeddings once and share it between pipelines."""
+    return OpenAIEmbeddings()
+
+
+# File types ingest_directory() treats as plain text
+_TEXT_SUFFIXES = frozenset({".txt", ".md", ".rst"})
+
 
 class SimpleEmbedding:
     """Simple embedding fallback when langchain is not available."""
@@ -62,27 +117,21 @@ class SimpleEmbedding:
     def __init__(self):
         self.dimension = 128
     
-    def embed_documents(self, texts: list[str]) -> list[list[float]]:
-        """Create simple hash-based embeddings."""
-        import hashlib
-        
-        embeddings = []
-        for text in texts:
-            # Use hash to create deterministic pseudo-embeddings
-            hash_bytes = hashlib.sha256(text.encode()).digest()
-            # Convert to float vector
-            vector = [
-                ((hash_bytes[i] + hash_bytes[i+1]*256) / 65536.0) * 2 - 1
-                for i in range(0, min(len(hash_bytes)-1, self.dimension*2), 2)
-            ]
-            # Pad or truncate to dimension
-            while len(vector) < self.dimension:
-                vector.extend(vector[:self.dimension - len(vector)])
-            embeddings.append(vector[:self.dimension])
+    def embed_documents(self, texts: list[str]) -> np.ndarray:
+        """Create simple hash-based embeddings as a (len(texts), dimension) array."""
+        out = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for row, text in zip(out, texts):
+            # Use hash to create deterministic pseudo-embeddings: the hash
+            # emits exactly one little-endian 16-bit word per component,
+            # each mapped into [-1, 1)
+            words = np.frombuffer(
+                _hash_stream(text.encode(), self.dimension * 2), dtype="<u2"
+            )
+            row[:] = words * (2.0 / 65536.0) - 1.0
         
-        return embeddings
+        return out
     
-    def embed_query(self, text: str) -> list[float]:
+    def embed_query(self, text: str) -> np.ndarray:
         """Embed a query."""
         return self.embed_documents([text])[0]
 
@@ -121,6 +170,10 @@ class RAGPipeline:
         namespace: str = "rag_documents",
         chunk_size: int = 1000,
         chunk_overlap: int = 100,
+        batch_size: int = 96,
+        flush_size: int = 200,
+        flush_interval: float = 0.05,
+        index_dtype: str = "int8",
     ):
         """Initialize RAG pipeline.
         
@@ -130,15 +183,24 @@ class RAGPipeline:
             namespace: Namespace for document storage
             chunk_size: Size of document chunks
             chunk_overlap: Overlap between chunks
+            batch_size: Texts per embedding request
+            flush_size: Chunk writes buffered before a batch is sent
+            flush_interval: Seconds a partial batch waits before it is sent
+            index_dtype: "int8" searches 4x smaller quantized vectors (stored
+                values stay float32); "float32" indexes them at full precision
         """
         self.db = db
         self.namespace = namespace
+        self.batch_size = batch_size
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.index_dtype = index_dtype
         
         # Initialize embedding model
         if embedding_model:
             self.embeddings = embedding_model
         elif LANGCHAIN_AVAILABLE:
-            self.embeddings = OpenAIEmbeddings()
+            self.embeddings = _default_embedder()
         else:
             self.embeddings = SimpleEmbedding()
         
@@ -154,6 +216,27 @@ class RAGPipeline:
         # Track ingested documents
         self._doc_counter = 0
         self._chunk_counter = 0
+        
+        # Chunk writes are queued and drained in batches by a background
+        # task; both are created on first use, inside the running loop
+        self._write_q: asyncio.Queue | None = None
+        self._flush_task: asyncio.Task | None = None
+        # (chunk IDs, error) for every failed batch since the last flush()
+        self._write_errors: list[tuple[list[str], BaseException]] = []
+        
+        # LRU of query embeddings, keyed by (model type, question)
+        self._query_cache: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._query_cache_size = 1024
+        
+        # One OpenAI client (and its HTTP connection pool) for every
+        # generation; created on first use
+        self._openai_client: Any = None
+    
+    async def __aenter__(self) -> "RAGPipeline":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
     
     async def ingest_document(
         self,
@@ -166,7 +249,7 @@ class RAGPipeline:
         1. Read document
         2. Chunk into smaller pieces
         3. Generate embeddings
-        4. Store in KoruDelta
+        4. Queue the chunks for storage (see ``flush()``)
         
         Args:
             file_path: Path to document file
@@ -180,48 +263,57 @@ class RAGPipeline:
         if not file_path.exists():
             raise FileNotFoundError(f"Document not found: {file_path}")
         
-        # Read document
-        text = file_path.read_text(encoding="utf-8")
-        
-        # Chunk document
-        chunks = chunk_document(text, self.chunk_config)
+        # Read and chunk the document in a worker thread so the event loop
+        # keeps draining in-flight writes meanwhile
+        text = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
+        chunks = await asyncio.to_thread(chunk_document, text, self.chunk_config)
         print(f"  Chunked into {len(chunks)} pieces")
         
         # Generate embeddings
-        embeddings = self.embeddings.embed_documents(chunks)
-        
-        # Store each chunk
-        chunk_ids = []
-        for i, (chunk_text, embedding) in enumerate(zip(chunks, embeddings)):
-            self._chunk_counter += 1
-            chunk_id = f"chunk_{self._chunk_counter}"
-            chunk_ids.append(chunk_id)
-            
-            # Build metadata
-            chunk_metadata = {
-                "source": str(file_path),
-                "chunk_index": i,
-                "total_chunks": len(chunks),
-                "text": chunk_text,
-                "ingested_at": datetime.utcnow().isoformat(),
-            }
-            if metadata:
-                chunk_metadata.update(metadata)
-            
-            # Store embedding
-            await self.db.embed(
-                namespace=self.namespace,
-                key=chunk_id,
-                embedding=embedding,
-                model="embedding-3-small",
-                metadata=chunk_metadata,
-            )
+        embeddings = await self._embed_batched(chunks)
+        
+        chunk_ids = await self._store_chunks(chunks, embeddings, str(file_path), metadata)
         
         self._doc_counter += 1
         print(f"  Ingested {len(chunks)} chunks from {file_path.name}")
         
         return chunk_ids
     
+    async def ingest_directory(
+        self,
+        docs_dir: str | Path,
+        concurrency: int = 8,
+        metadata: dict | None = None,
+    ) -> list[list[str]]:
+        """Ingest every text file under a directory.
+        
+        Up to ``concurrency`` documents are processed at once, so one
+        document's chunking and embedding overlap with another's.
+        
+        Args:
+            docs_dir: Directory to scan recursively
+            concurrency: Maximum number of documents in flight
+            metadata: Optional metadata applied to every document
+        
+        Returns:
+            List of chunk ID lists, one per file (sorted by path)
+        """
+        docs_dir = Path(docs_dir)
+        if not docs_dir.is_dir():
+            raise NotADirectoryError(f"Not a directory: {docs_dir}")
+        
+        paths = sorted(
+            p for p in docs_dir.rglob("*")
+            if p.suffix.lower() in _TEXT_SUFFIXES and p.is_file()
+        )
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def _one(path: Path) -> list[str]:
+            async with sem:
+                return await self.ingest_document(path, metadata)
+        
+        return await asyncio.gather(*(_one(p) for p in paths))
+    
     async def ingest_text(
         self,
         text: str,
@@ -238,39 +330,181 @@ class RAGPipeline:
         Returns:
             List of chunk IDs
         """
-        # Chunk text
-        chunks = chunk_document(text, self.chunk_config)
+        # Chunk text in a worker thread (CPU-bound)
+        chunks = await asyncio.to_thread(chunk_document, text, self.chunk_config)
         
         # Generate embeddings
-        embeddings = self.embeddings.embed_documents(chunks)
-        
-        # Store each chunk
-        chunk_ids = []
-        for i, (chunk_text, embedding) in enumerate(zip(chunks, embeddings)):
-            self._chunk_counter += 1
-            chunk_id = f"chunk_{self._chunk_counter}"
-            chunk_ids.append(chunk_id)
-            
-            chunk_metadata = {
-                "source": source,
-                "chunk_index": i,
-                "total_chunks": len(chunks),
-                "text": chunk_text,
-                "ingested_at": datetime.utcnow().isoformat(),
-            }
-            if metadata:
-                chunk_metadata.update(metadata)
-            
-            await self.db.embed(
-                namespace=self.namespace,
-                key=chunk_id,
-                embedding=embedding,
-                model="embedding-3-small",
-                metadata=chunk_metadata,
+        embeddings = await self._embed_batched(chunks)
+        
+        return await self._store_chunks(chunks, embeddings, source, metadata)
+    
+    async def _embed_query_cached(self, question: str) -> np.ndarray:
+        """Embed a query, reusing the result for repeated questions."""
+        key = (type(self.embeddings).__name__, question)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+        
+        aembed = getattr(self.embeddings, "aembed_query", None)
+        if aembed is not None:
+            embedding = _to_f32(await aembed(question))
+        else:
+            embedding = _to_f32(
+                await asyncio.to_thread(self.embeddings.embed_query, question)
             )
         
+        self._query_cache[key] = embedding
+        if len(self._query_cache) > self._query_cache_size:
+            self._query_cache.popitem(last=False)
+        return embedding
+    
+    async def _embed_batched(self, texts: list[str]) -> np.ndarray:
+        """Embed texts in ``batch_size`` groups, all requested concurrently.
+        
+        Uses the model's async client when it has one (LangChain's
+        ``aembed_documents``); otherwise each batch runs in a worker thread
+        so the blocking calls still overlap.
+        
+        Texts are batched in length order, so each batch holds texts of
+        similar size and a transformer model pads less; results are put
+        back in input order before returning, as one float32 array with a
+        row per text.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        by_length = [texts[i] for i in order]
+        batches = [
+            by_length[start:start + self.batch_size]
+            for start in range(0, len(by_length), self.batch_size)
+        ]
+        aembed = getattr(self.embeddings, "aembed_documents", None)
+        if aembed is not None:
+            results = await asyncio.gather(*(aembed(batch) for batch in batches))
+        else:
+            results = await asyncio.gather(*(
+                asyncio.to_thread(self.embeddings.embed_documents, batch)
+                for batch in batches
+            ))
+        
+        if not results:
+            return np.empty((0, 0), dtype=np.float32)
+        sorted_embeddings = np.concatenate([_to_f32(batch) for batch in results])
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+    
+    async def _store_chunks(
+        self,
+        chunks: list[str],
+        embeddings: np.ndarray,
+        source: str,
+        metadata: dict | None,
+    ) -> list[str]:
+        """Queue chunk embeddings for the background flusher and return their IDs."""
+        base = self._chunk_counter
+        self._chunk_counter += len(chunks)
+        chunk_ids = [f"chunk_{base + i + 1}" for i in range(len(chunks))]
+        
+        # Fields shared by every chunk of the document are built once;
+        # caller metadata still takes precedence over the generated ones
+        base_meta = {
+            "source": source,
+            "total_chunks": len(chunks),
+            "ingested_at": datetime.utcnow().isoformat(),
+            **(metadata or {}),
+        }
+        
+        items = [
+            {
+                "key": chunk_id,
+                "embedding": embedding,
+                "model": "embedding-3-small",
+                "metadata": {"chunk_index": i, "text": chunk_text, **base_meta},
+            }
+            for i, (chunk_id, chunk_text, embedding) in enumerate(
+                zip(chunk_ids, chunks, embeddings)
+            )
+        ]
+        
+        # Hand the writes to the background flusher; they are batched with
+        # other documents' chunks and become durable on the next flush()
+        if self._write_q is None:
+            self._write_q = asyncio.Queue()
+            self._flush_task = asyncio.create_task(self._flusher())
+        for item in items:
+            self._write_q.put_nowait(item)
         return chunk_ids
     
+    async def _flusher(self) -> None:
+        """Drain queued chunk writes into embed_many batches.
+        
+        A batch is sent once it holds ``flush_size`` items or
+        ``flush_interval`` seconds after its first item arrived.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._write_q.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.flush_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._write_q.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self.db.embed_many(self.namespace, batch, dtype=self.index_dtype)
+            except Exception as e:
+                # Reported by the next flush(), with every other failed batch
+                self._write_errors.append(([item["key"] for item in batch], e))
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+    
+    async def flush(self) -> None:
+        """Wait until every queued chunk write has been stored.
+        
+        Raises:
+            RuntimeError: If any background write failed since the last
+                flush; names every chunk ID that was not stored and is
+                chained to the first batch's error
+        """
+        if self._write_q is not None:
+            await self._write_q.join()
+        if self._write_errors:
+            errors, self._write_errors = self._write_errors, []
+            failed = [key for keys, _ in errors for key in keys]
+            causes = "; ".join(f"{type(e).__name__}: {e}" for _, e in errors)
+            raise RuntimeError(
+                f"{len(failed)} chunk(s) were not stored ({', '.join(failed)}): {causes}"
+            ) from errors[0][1]
+    
+    async def close(self) -> None:
+        """Flush pending writes and stop the background flusher."""
+        try:
+            await self.flush()
+        finally:
+            if self._flush_task is not None:
+                task, self._flush_task = self._flush_task, None
+                self._write_q = None
+                task.cancel()
+                # Let the cancellation finish so no pending task outlives the loop
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+    
+    async def aclose(self) -> None:
+        """Flush pending writes and release the flusher and OpenAI client."""
+        try:
+            await self.close()
+        finally:
+            if self._openai_client is not None:
+                await self._openai_client.close()
+                self._openai_client = None
+    
     async def query(
         self,
         question: str,
@@ -278,6 +512,8 @@ class RAGPipeline:
         vector_weight: float = 0.7,
         causal_weight: float = 0.3,
         generate_answer: bool = True,
+        stream: bool = False,
+        return_raw: bool = False,
     ) -> dict[str, Any]:
         """Query the RAG pipeline.
         
@@ -293,16 +529,26 @@ class RAGPipeline:
             vector_weight: Weight for semantic similarity
             causal_weight: Weight for causal/temporal relevance
             generate_answer: Whether to generate an answer with LLM
+            stream: Return the answer as an async iterator of text pieces
+                instead of waiting for the full completion
+            return_raw: Also return the raw hybrid search results. Off by
+                default: they carry full stored values (vectors included)
+                and would otherwise stay alive as long as the response
         
         Returns:
             Dict with keys:
                 - answer: Generated answer (if generate_answer=True)
+                - answer_stream: Async iterator of answer text (if stream=True
+                  as well; replaces "answer")
                 - context: Retrieved context chunks
                 - sources: List of source documents
-                - hybrid_results: Raw search results
+                - hybrid_results: Raw search results (if return_raw=True)
         """
+        # Make sure queued chunk writes are searchable
+        await self.flush()
+        
         # Generate query embedding
-        query_embedding = self.embeddings.embed_query(question)
+        query_embedding = await self._embed_query_cached(question)
         
         # Perform hybrid search
         results = await self.searcher.search(
@@ -313,42 +559,27 @@ class RAGPipeline:
             causal_weight=causal_weight,
         )
         
-        # Assemble context
-        context_chunks = []
-        sources = set()
-        
-        for result in results:
-            metadata = result.metadata
-            text = ""
-            
-            if isinstance(result.content, dict):
-                text = result.content.get("text", "")
-                source = result.content.get("source", result.key)
-                sources.add(source)
-            
-            context_chunks.append({
-                "text": text,
-                "score": result.combined_score,
-                "source": result.key,
-            })
-        
-        # Build context string
-        context_str = "\n\n".join([
-            f"[Source {i+1}]: {chunk['text']}"
-            for i, chunk in enumerate(context_chunks)
-        ])
+        context_chunks, sources, context_str = self._assemble_context(results)
         
         response = {
             "question": question,
             "context": context_chunks,
             "sources": list(sources),
-            "hybrid_results": results,
         }
+        if return_raw:
+            response["hybrid_results"] = results
+        # Let the raw results be collected before the LLM call
+        del results
         
         # Generate answer if requested and OpenAI is available
         if generate_answer and OPENAI_AVAILABLE:
-            answer = await self._generate_answer(question, context_str)
-            response["answer"] = answer
+            if stream:
+                response["answer_stream"] = self._generate_stream(
+                    _ANSWER_TMPL.format(context=context_str, question=question)
+                )
+            else:
+                answer = await self._generate_answer(question, context_str)
+                response["answer"] = answer
         
         return response
     
@@ -371,8 +602,11 @@ class RAGPipeline:
         Returns:
             Dict with answer, context, and historical sources
         """
+        # Make sure queued chunk writes are searchable
+        await self.flush()
+        
         # Generate query embedding
-        query_embedding = self.embeddings.embed_query(question)
+        query_embedding = await self._embed_query_cached(question)
         
         # Time-travel search
         results = await self.searcher.time_travel_search(
@@ -382,28 +616,9 @@ class RAGPipeline:
             top_k=top_k,
         )
         
-        # Assemble context
-        context_chunks = []
-        sources = set()
-        
-        for result in results:
-            text = ""
-            if isinstance(result.content, dict):
-                text = result.content.get("text", "")
-                source = result.content.get("source", result.key)
-                sources.add(source)
-            
-            context_chunks.append({
-                "text": text,
-                "score": result.combined_score,
-                "source": result.key,
-                "as_of": timestamp,
-            })
-        
-        context_str = "\n\n".join([
-            f"[Source {i+1}]: {chunk['text']}"
-            for i, chunk in enumerate(context_chunks)
-        ])
+        context_chunks, sources, context_str = self._assemble_context(
+            results, extra_fields={"as_of": timestamp}
+        )
         
         response = {
             "question": question,
@@ -414,14 +629,9 @@ class RAGPipeline:
         
         # Generate answer
         if OPENAI_AVAILABLE and context_chunks:
-            prompt = f"""Based on the following historical information (as of {timestamp}):
-
-{context_str}
-
-Question: {question}
-
-Please provide an answer based only on the information available at that time."""
-            
+            prompt = _TIMETRAVEL_TMPL.format(
+                timestamp=timestamp, context=context_str, question=question
+            )
             answer = await self._generate_raw(prompt)
             response["answer"] = answer
         
@@ -446,8 +656,11 @@ Please provide an answer based only on the information available at that time.""
         # Calculate cutoff timestamp
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
         
+        # Make sure queued chunk writes are searchable
+        await self.flush()
+        
         # Generate query embedding
-        query_embedding = self.embeddings.embed_query(question)
+        query_embedding = await self._embed_query_cached(question)
         
         # Search with temporal filter
         causal_filter = CausalFilter(after_timestamp=cutoff)
@@ -461,18 +674,7 @@ Please provide an answer based only on the information available at that time.""
             causal_weight=0.4,  # Higher weight for recency
         )
         
-        # Assemble response
-        context_chunks = []
-        for result in results:
-            text = ""
-            if isinstance(result.content, dict):
-                text = result.content.get("text", "")
-            
-            context_chunks.append({
-                "text": text,
-                "score": result.combined_score,
-                "source": result.key,
-            })
+        context_chunks, _, context_str = self._assemble_context(results)
         
         response = {
             "question": question,
@@ -481,15 +683,50 @@ Please provide an answer based only on the information available at that time.""
         }
         
         if OPENAI_AVAILABLE and context_chunks:
-            context_str = "\n\n".join([
-                f"[Source {i+1}]: {chunk['text']}"
-                for i, chunk in enumerate(context_chunks)
-            ])
             answer = await self._generate_answer(question, context_str)
             response["answer"] = answer
         
         return response
     
+    @staticmethod
+    def _assemble_context(
+        results: list[Any],
+        extra_fields: dict[str, Any] | None = None,
+    ) -> tuple[list[dict[str, Any]], set[str], str]:
+        """Build the context chunks, source set and prompt context in one pass.
+        
+        Args:
+            results: Hybrid search results
+            extra_fields: Fields added to every context chunk
+        
+        Returns:
+            Tuple of (context_chunks, sources, context_str)
+        """
+        context_chunks: list[dict[str, Any]] = [None] * len(results)  # type: ignore[list-item]
+        sources = set()
+        parts = [None] * len(results)
+        
+        for i, result in enumerate(results):
+            text = ""
+            if isinstance(result.content, dict):
+                # Embedded values are {"vector", "model", "dimensions",
+                # "metadata"}; the chunk text lives only in the metadata
+                fields = result.content.get("metadata") or result.content
+                text = fields.get("text", "")
+                sources.add(fields.get("source", result.key))
+            
+            chunk = {
+                "text": text,
+                "score": result.combined_score,
+                "source": result.key,
+            }
+            if extra_fields:
+                chunk.update(extra_fields)
+            context_chunks[i] = chunk
+            parts[i] = f"[Source {i+1}]: {text}"
+        
+        return context_chunks, sources, "\n\n".join(parts)
+    
     async def _generate_answer(
         self,
         question: str,
@@ -499,17 +736,15 @@ Please provide an answer based only on the information available at that time.""
         if not OPENAI_AVAILABLE:
             return "[OpenAI not available]"
         
-        prompt = f"""Use the following context to answer the question.
-If the answer cannot be found in the context, say "I don't have enough information to answer that."
-
-Context:
-{context}
-
-Question: {question}
-
-Answer:"""
-        
-        return await self._generate_raw(prompt)
+        return await self._generate_raw(
+            _ANSWER_TMPL.format(context=context, question=question)
+        )
+    
+    def _openai(self) -> "openai.AsyncOpenAI":
+        """Return the shared OpenAI client, creating it on first use."""
+        if self._openai_client is None:
+            self._openai_client = openai.AsyncOpenAI()
+        return self._openai_client
     
     async def _generate_raw(self, prompt: str) -> str:
         """Generate text using OpenAI API."""
@@ -517,14 +752,10 @@ Answer:"""
             return "[OpenAI not available]"
         
         try:
-            client = openai.AsyncOpenAI()
-            response = await client.chat.completions.create(
+            response = await self._openai().chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that answers questions based on provided context."
-                    },
+                    _SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
@@ -534,8 +765,32 @@ Answer:"""
         except Exception as e:
             return f"[Error generating answer: {e}]"
     
+    async def _generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Generate text using OpenAI API, yielding pieces as they arrive."""
+        if not OPENAI_AVAILABLE:
+            yield "[OpenAI not available]"
+            return
+        
+        try:
+            response = await self._openai().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    _SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=500,
+                stream=True,
+            )
+            async for chunk in response:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        except Exception as e:
+            yield f"[Error generating answer: {e}]"
+    
     async def get_stats(self) -> dict[str, Any]:
         """Get pipeline statistics."""
+        await self.flush()
         db_stats = await self.db.stats()
         
         return {
@@ -556,115 +811,109 @@ async def demo():
     print("\n1. Initializing database...")
     async with Database() as db:
         # Initialize pipeline
-        pipeline = RAGPipeline(db, namespace="demo_docs")
-        
-        # Ingest sample documents
-        print("\n2. Ingesting documents...")
-        
-        # Sample document 1
-        doc1 = """
-        Causal consistency is a consistency model used in distributed systems.
-        It ensures that processes agree on the order of causally related events.
-        If event A causes event B, all processes must observe A before B.
-        
-        This is weaker than sequential consistency but stronger than eventual consistency.
-        It captures the intuition that if one event influences another, the order matters.
-        Concurrent events (neither causing the other) can be seen in any order.
-        
-        Causal consistency was first formalized by Leslie Lamport in 1978 through
-        the concept of "happens-before" relationships.
-        """
-        
-        await pipeline.ingest_text(doc1, source="causal_consistency.txt", metadata={"topic": "consistency"})
-        
-        # Sample document 2
-        doc2 = """
-        Vector databases store high-dimensional vectors for similarity search.
-        They use approximate nearest neighbor (ANN) algorithms like HNSW or IVF
-        to efficiently find similar vectors without scanning the entire database.
-        
-        Common use cases include:
-        - Semantic search
-        - Recommendation systems
-        - Image retrieval
-        - Anomaly detection
-        
-        Vector embeddings are typically generated using neural networks that
-        map content (text, images, etc.) into a dense vector space where
-        semantic similarity corresponds to vector proximity.
-        """
-        
-        await pipeline.ingest_text(doc2, source="vector_databases.txt", metadata={"topic": "databases"})
-        
-        # Sample document 3
-        doc3 = """
-        KoruDelta is a zero-configuration causal database for AI agents.
-        It combines Git-like versioning with Redis-like simplicity.
-        
-        Key features:
-        - Automatic causal tracking: Every change is linked to its cause
-        - Time travel: Query any historical state
-        - Edge deployment: Runs anywhere including browsers
-        - Vector search: Native semantic search capabilities
-        
-        The name comes from "Koru" (Māori for spiral/loop) representing
-        continuous growth and "Delta" representing change.
-        """
-        
-        await pipeline.ingest_text(doc3, source="korudelta_intro.txt", metadata={"topic": "product"})
-        
-        print(f"\n3. Pipeline stats:")
-        stats = await pipeline.get_stats()
-        print(f"   - Documents: {stats['documents_ingested']}")
-        print(f"   - Chunks: {stats['chunks_stored']}")
-        
-        # Query 1: Basic semantic search
-        print("\n4. Query 1: What is causal consistency?")
-        print("-" * 40)
-        result = await pipeline.query(
-            "What is causal consistency?",
-            top_k=3,
-            generate_answer=False,  # Skip LLM generation for demo
-        )
-        
-        print(f"   Retrieved {len(result['context'])} chunks:")
-        for i, chunk in enumerate(result['context']):
-            text_preview = chunk['text'][:100].replace('\n', ' ')
-            print(f"   [{i+1}] (score: {chunk['score']:.3f}) {text_preview}...")
-        
-        # Query 2: Vector databases
-        print("\n5. Query 2: How do vector databases work?")
-        print("-" * 40)
-        result = await pipeline.query(
-            "How do vector databases work?",
-            top_k=3,
-            generate_answer=False,
-        )
-        
-        print(f"   Retrieved {len(result['context'])} chunks:")
-        for i, chunk in enumerate(result['context']):
-            text_preview = chunk['text'][:100].replace('\n', ' ')
-            print(f"   [{i+1}] (score: {chunk['score']:.3f}) {text_preview}...")
-        
-        # Query 3: KoruDelta specific
-        print("\n6. Query 3: What is KoruDelta?")
-        print("-" * 40)
-        result = await pipeline.query(
-            "What is KoruDelta?",
-            top_k=3,
-            generate_answer=False,
-        )
+        async with RAGPipeline(db, namespace="demo_docs") as pipeline:
+        
+            # Ingest sample documents
+            print("\n2. Ingesting documents...")
+        
+            # Sample document 1
+            doc1 = """
+            Causal consistency is a consistency model used in distributed systems.
+            It ensures that processes agree on the order of causally related events.
+            If event A causes event B, all processes must observe A before B.
+        
+            This is weaker than sequential consistency but stronger than eventual consistency.
+            It captures the intuition that if one event influences another, the order matters.
+            Concurrent events (neither causing the other) can be seen in any order.
+        
+            Causal consistency was first formalized by Leslie Lamport in 1978 through
+            the concept of "happens-before" relationships.
+            """
+        
+            # Sample document 2
+            doc2 = """
+            Vector databases store high-dimensional vectors for similarity search.
+            They use approximate nearest neighbor (ANN) algorithms like HNSW or IVF
+            to efficiently find similar vectors without scanning the entire database.
+        
+            Common use cases include:
+            - Semantic search
+            - Recommendation systems
+            - Image retrieval
+            - Anomaly detection
+        
+            Vector embeddings are typically generated using neural networks that
+            map content (text, images, etc.) into a dense vector space where
+            semantic similarity corresponds to vector proximity.
+            """
+        
+            # Sample document 3
+            doc3 = """
+            KoruDelta is a zero-configuration causal database for AI agents.
+            It combines Git-like versioning with Redis-like simplicity.
+        
+            Key features:
+            - Automatic causal tracking: Every change is linked to its cause
+            - Time travel: Query any historical state
+            - Edge deployment: Runs anywhere including browsers
+            - Vector search: Native semantic search capabilities
+        
+            The name comes from "Koru" (Māori for spiral/loop) representing
+            continuous growth and "Delta" representing change.
+            """
+        
+            # The documents are independent, so ingest them concurrently
+            await asyncio.gather(
+                pipeline.ingest_text(doc1, source="causal_consistency.txt", metadata={"topic": "consistency"}),
+                pipeline.ingest_text(doc2, source="vector_databases.txt", metadata={"topic": "databases"}),
+                pipeline.ingest_text(doc3, source="korudelta_intro.txt", metadata={"topic": "product"}),
+            )
         
-        print(f"   Retrieved {len(result['context'])} chunks:")
-        for i, chunk in enumerate(result['context']):
-            text_preview = chunk['text'][:100].replace('\n', ' ')
-            print(f"   [{i+1}] (score: {chunk['score']:.3f}) {text_preview}...")
+            print(f"\n3. Pipeline stats:")
+            stats = await pipeline.get_stats()
+            print(f"   - Documents: {stats['documents_ingested']}")
+            print(f"   - Chunks: {stats['chunks_stored']}")
+        
+            # Run the three queries concurrently (LLM generation skipped
+            # for the demo), then print them in order
+            questions = [
+                "What is causal consistency?",
+                "How do vector databases work?",
+                "What is KoruDelta?",
+            ]
+            results = await asyncio.gather(*(
+                pipeline.query(question, top_k=3, generate_answer=False)
+                for question in questions
+            ))
+            
+            for step, (question, result) in enumerate(zip(questions, results), start=4):
+                print(f"\n{step}. Query {step - 3}: {question}")
+                print("-" * 40)
+                print(f"   Retrieved {len(result['context'])} chunks:")
+                for i, chunk in enumerate(result['context']):
+                    text_preview = chunk['text'][:100].replace('\n', ' ')
+                    print(f"   [{i+1}] (score: {chunk['score']:.3f}) {text_preview}...")
         
         print("\n" + "=" * 60)
         print("Demo complete!")
         print("=" * 60)
 
 
+async def ingest_and_query(docs_dir: str, question: str | None = None):
+    """Ingest a directory of documents and optionally query it."""
+    async with Database() as db:
+        async with RAGPipeline(db, namespace="docs") as pipeline:
+            results = await pipeline.ingest_directory(docs_dir)
+            await pipeline.flush()
+            print(f"Ingested {sum(map(len, results))} chunks from {len(results)} files")
+            
+            if question:
+                result = await pipeline.query(question, top_k=3)
+                if "answer" in result:
+                    print(f"\nAnswer: {result['answer']}")
+                print(f"Sources: {result['sources']}")
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -692,9 +941,9 @@ def main():
         # Run demo
         asyncio.run(demo())
     elif args.docs_dir:
-        # Ingest documents
+        # Ingest documents, then answer the query against them if given
         print(f"Ingesting documents from {args.docs_dir}")
-        # Implementation would scan directory and ingest files
+        asyncio.run(ingest_and_query(args.docs_dir, args.query))
     elif args.query:
         # Run query
         print(f"Query: {args.query}")
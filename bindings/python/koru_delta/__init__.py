@@ -38,6 +38,9 @@ from koru_delta._internal import (
     Database,
     IdentityManager,
     Workspace,
+    HistoryIterator,
+    Namespace,
+    Snapshot,
     
     # Exceptions
     KoruDeltaError,
@@ -51,12 +54,18 @@ from koru_delta._internal import (
     # Version
     __version__,
 )
+from koru_delta.pool import Pool, create_pool
 
 __all__ = [
     # Core classes
     "Database",
     "IdentityManager", 
     "Workspace",
+    "HistoryIterator",
+    "Namespace",
+    "Snapshot",
+    "Pool",
+    "create_pool",
     
     # Exceptions
     "KoruDeltaError",
@@ -9,10 +9,14 @@ A zero-configuration, causal database with native support for:
 """
 
 from __future__ import annotations
-from typing import Any
+from typing import Any, Literal, Sequence
+
+import numpy as np
+import numpy.typing as npt
 
 from koru_delta.config import Config
 from koru_delta.agent_memory import AgentMemory
+from koru_delta.pool import Pool, create_pool
 
 __version__: str = "2.0.0"
 
@@ -36,6 +40,22 @@ class DatabaseClosedError(KoruDeltaError):
     """Raised when operating on a closed database."""
     ...
 
+class Snapshot:
+    """Point-in-time handle returned by Database.snapshot() and snapshot_at()."""
+    
+    @property
+    def timestamp(self) -> str: ...
+
+class HistoryIterator:
+    """Async iterator over history entries, read one at a time."""
+    
+    def __aiter__(self) -> HistoryIterator: ...
+    async def __anext__(self) -> dict[str, Any]: ...
+    
+    async def collect(self) -> list[dict[str, Any]]:
+        """Gather the remaining entries into a list, oldest first like ``history()``."""
+        ...
+
 class Database:
     """
     KoruDelta database instance.
@@ -49,26 +69,104 @@ class Database:
     async def __aenter__(self) -> Database: ...
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
     
+    async def close(self) -> None:
+        """Stop background tasks and release the database lock."""
+        ...
+    
     async def put(self, namespace: str, key: str, value: object) -> None:
         """Store a value."""
         ...
     
+    async def patch(self, namespace: str, key: str, delta: dict[str, Any]) -> None:
+        """Merge changed fields into the current value; None removes a field."""
+        ...
+    
+    async def remember(
+        self,
+        namespace: str,
+        agent_id: str,
+        content: str,
+        memory_type: str,
+        importance: float,
+        tags: list[str],
+        key: str | None = None,
+    ) -> str:
+        """Store an agent memory record; returns its (content-derived) key."""
+        ...
+    
+    async def put_json(self, namespace: str, key: str, data: bytes | str) -> None:
+        """Store a pre-encoded JSON document (e.g. from orjson.dumps)."""
+        ...
+    
     async def put_batch(self, items: list[tuple[str, str, object]]) -> int:
         """Store multiple values as a batch operation (10-50x faster)."""
         ...
     
+    async def put_many(self, namespace: str, items: list[tuple[str, object]]) -> int:
+        """Store multiple (key, value) pairs in one namespace as a single batch."""
+        ...
+    
     async def get(self, namespace: str, key: str) -> object:
         """Retrieve a value."""
         ...
     
+    async def get_many(self, namespace: str, keys: list[str]) -> dict[str, object]:
+        """Retrieve several values in one call; missing keys are omitted."""
+        ...
+    
+    async def get_many_versioned(
+        self,
+        namespace: str,
+        keys: list[str],
+        known: dict[str, str] | None = None,
+    ) -> dict[str, tuple[str, object | None]]:
+        """Retrieve several (version_id, value) pairs; unchanged values are None."""
+        ...
+    
     async def get_at(self, namespace: str, key: str, timestamp: str) -> object:
         """Retrieve a value at a specific point in time."""
         ...
     
+    def snapshot(self) -> Snapshot:
+        """Capture the current point in time for later get_at_snapshot() reads."""
+        ...
+    
+    def snapshot_at(self, timestamp: str) -> Snapshot:
+        """Pin an ISO 8601 timestamp as a snapshot for get_at_snapshot() reads."""
+        ...
+    
+    async def get_at_snapshot(self, snapshot: Snapshot, namespace: str, key: str) -> object:
+        """Retrieve a value as it was when the snapshot was taken."""
+        ...
+    
     async def history(self, namespace: str, key: str) -> list[dict[str, Any]]:
         """Get complete history for a key."""
         ...
     
+    async def history_many(self, namespace: str, keys: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Get history for several keys in one call; missing keys are omitted."""
+        ...
+    
+    async def first_version(self, namespace: str, key: str) -> object:
+        """Retrieve the value a key was first written with."""
+        ...
+    
+    async def history_between(
+        self, namespace: str, key: str, start: str, end: str
+    ) -> list[dict[str, Any]]:
+        """Get the history entries written in ``[start, end)``, oldest first."""
+        ...
+    
+    async def history_tail(self, namespace: str, key: str, n: int) -> list[dict[str, Any]]:
+        """Get the ``n`` most recent history entries for a key, oldest first."""
+        ...
+    
+    def history_iter(
+        self, namespace: str, key: str, oldest_first: bool = False
+    ) -> HistoryIterator:
+        """Iterate over a key's history with ``async for``, newest first unless ``oldest_first``."""
+        ...
+    
     async def delete(self, namespace: str, key: str) -> None:
         """Delete a key."""
         ...
@@ -81,21 +179,60 @@ class Database:
         """List all keys in a namespace."""
         ...
     
+    async def list_keys_many(self, namespaces: list[str]) -> dict[str, list[str]]:
+        """List the keys of several namespaces in one call."""
+        ...
+    
+    async def aggregate_by(
+        self, namespace: str, field: str, default: str | None = None
+    ) -> dict[str, int]:
+        """Count a namespace's values grouped by a top-level field, in Rust."""
+        ...
+    
+    async def filter_contains(
+        self,
+        namespace: str,
+        field: str,
+        needle: str,
+        number_field: str,
+        filters: list[dict[str, Any]] | None = None,
+    ) -> list[tuple[str, bool, float | None]]:
+        """Test a string field of every value for a substring, in Rust."""
+        ...
+    
     async def embed(
         self,
         namespace: str,
         key: str,
-        embedding: list[float],
+        embedding: Sequence[float] | npt.NDArray[np.float32],
         model: str,
         metadata: object | None = None,
+        dtype: Literal["float32", "int8"] = "float32",
     ) -> None:
-        """Store a vector embedding."""
+        """Store a vector embedding (float32 arrays are copied without unboxing).
+
+        dtype="int8" indexes a quantized copy that is 4x smaller to scan.
+        """
+        ...
+    
+    async def embed_many(
+        self,
+        namespace: str,
+        items: list[dict[str, Any]],
+        dtype: Literal["float32", "int8"] = "float32",
+    ) -> int:
+        """Store several embeddings in one batch.
+
+        Each item is a dict with ``key``, ``embedding``, ``model`` and an
+        optional ``metadata``. ``dtype`` works as in ``embed``. Returns the
+        number of items written.
+        """
         ...
     
     async def similar(
         self,
         namespace: str | None,
-        query: list[float],
+        query: Sequence[float] | npt.NDArray[np.float32],
         top_k: int = 10,
         threshold: float = 0.0,
         model_filter: str | None = None,
@@ -104,15 +241,61 @@ class Database:
         ...
     
     async def stats(self) -> dict[str, Any]:
-        """Get database statistics."""
+        """Get database statistics, including per-namespace key counts."""
+        ...
+    
+    def namespace(self, name: str) -> Namespace:
+        """Get a handle whose methods are bound to one namespace."""
         ...
     
     def agent_memory(self, agent_id: str) -> AgentMemory:
         """Create an agent memory interface."""
         ...
 
+class Namespace:
+    """Handle bound to a single namespace, returned by Database.namespace()."""
+    
+    @property
+    def name(self) -> str: ...
+    
+    async def put(self, key: str, value: object) -> None:
+        """Store a value."""
+        ...
+    
+    async def get(self, key: str) -> object:
+        """Retrieve a value."""
+        ...
+    
+    async def history(self, key: str) -> list[dict[str, Any]]:
+        """Get complete history for a key."""
+        ...
+    
+    async def embed(
+        self,
+        key: str,
+        embedding: Sequence[float] | npt.NDArray[np.float32],
+        model: str,
+        metadata: object | None = None,
+        dtype: Literal["float32", "int8"] = "float32",
+    ) -> None:
+        """Store a vector embedding."""
+        ...
+    
+    async def similar(
+        self,
+        query: Sequence[float] | npt.NDArray[np.float32],
+        top_k: int = 10,
+        threshold: float = 0.0,
+        model_filter: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search for similar vectors within this namespace."""
+        ...
+
 __all__ = [
     "Database",
+    "HistoryIterator",
+    "Namespace",
+    "Snapshot",
     "Config",
     "AgentMemory",
     "KoruDeltaError",
@@ -1,13 +1,23 @@
 """Agent memory management for AI agents."""
 
 from __future__ import annotations
+import inspect
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Sequence
+
+import numpy as np
+
+from koru_delta.config import Config
 
 if TYPE_CHECKING:
     from koru_delta import Database
 
+# Turns memory content (or a recall query) into an embedding vector; may be
+# a plain function or a coroutine function
+Embedder = Callable[[str], "Sequence[float] | Awaitable[Sequence[float]]"]
+
 
 class MemoryType(Enum):
     """Types of agent memory."""
@@ -19,6 +29,12 @@ class MemoryType(Enum):
 @dataclass
 class MemoryRecall:
     """Result of a memory recall operation."""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "content", "memory_type", "relevance", "importance",
+        "created_at", "access_count", "tags",
+    )
+    
     content: str
     memory_type: MemoryType
     relevance: float
@@ -31,6 +47,8 @@ class MemoryRecall:
 class EpisodeMemory:
     """Episodic memory (specific events)."""
     
+    __slots__ = ("_agent",)
+    
     def __init__(self, agent: AgentMemory):
         self._agent = agent
     
@@ -61,6 +79,8 @@ class EpisodeMemory:
 class FactMemory:
     """Semantic memory (facts and knowledge)."""
     
+    __slots__ = ("_agent",)
+    
     def __init__(self, agent: AgentMemory):
         self._agent = agent
     
@@ -91,6 +111,8 @@ class FactMemory:
 class ProcedureMemory:
     """Procedural memory (how-to knowledge)."""
     
+    __slots__ = ("_agent",)
+    
     def __init__(self, agent: AgentMemory):
         self._agent = agent
     
@@ -135,6 +157,18 @@ class AgentMemory:
     Provides human-like memory with episodic, semantic, and procedural
     memory types. Supports natural forgetting and consolidation.
     
+    With an ``embedder``, every memory is also stored as a vector and
+    ``recall`` becomes a similarity search inside the database; without
+    one it falls back to keyword matching over all memories. With
+    ``index_dtype="int8"`` the vectors are searched in their quantized
+    form, a quarter of the size, at a small cost in score precision.
+    
+    Decoded memory records are kept in an LRU of ``cache_size`` entries
+    (``Config.hot_cache_size`` by default), tagged with their version id.
+    Every recall still checks the current versions in the database, so
+    writes from anywhere are seen, but only records that changed are
+    converted to Python again.
+    
     Example:
         >>> async with Database() as db:
         ...     memory = db.agent_memory("assistant-42")
@@ -149,16 +183,77 @@ class AgentMemory:
         ...         print(f"{r.relevance:.2f}: {r.content}")
     """
     
-    def __init__(self, db: Database, agent_id: str):
+    __slots__ = (
+        "_db", "_agent_id", "_ns", "_vec_ns", "_embedder", "_embedding_model",
+        "_index_dtype", "_cache", "_cache_size", "episodes", "facts", "procedures",
+    )
+    
+    def __init__(
+        self,
+        db: Database,
+        agent_id: str,
+        embedder: Embedder | None = None,
+        embedding_model: str = "agent-memory",
+        cache_size: int = Config.hot_cache_size,
+        index_dtype: str = "float32",
+    ):
         self._db = db
         self._agent_id = agent_id
+        # Built once; every storage call in this class reuses it
+        self._ns = f"agent_memory:{agent_id}"
+        # Vectors live in a sibling namespace: embed() stores its own value
+        # shape, which must not replace the memory record itself
+        self._vec_ns = f"{self._ns}:vectors"
+        self._embedder = embedder
+        self._embedding_model = embedding_model
+        self._index_dtype = index_dtype
+        # LRU of (version id, decoded record) by key
+        self._cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self._cache_size = cache_size
+        # Sub-stores are built once here, so `memory.episodes` etc. are
+        # plain slot reads that always return the same handle
         self.episodes = EpisodeMemory(self)
         self.facts = FactMemory(self)
         self.procedures = ProcedureMemory(self)
     
     def _namespace(self) -> str:
         """Get namespace for this agent's memories."""
-        return f"agent_memory:{self._agent_id}"
+        return self._ns
+    
+    async def _get_records(self, keys: list[str]) -> dict[str, Any]:
+        """Fetch memory records, reusing cached ones whose version is current."""
+        cache = self._cache
+        known = {key: cache[key][0] for key in keys if key in cache}
+        # One call checks every version; values come back only if changed
+        fetched = await self._db.get_many_versioned(self._ns, keys, known)
+        
+        found = {}
+        for key in keys:
+            entry = fetched.get(key)
+            if entry is None:
+                # Deleted since it was cached
+                cache.pop(key, None)
+                continue
+            version, data = entry
+            cached = cache.get(key)
+            if cached is not None and cached[0] == version:
+                data = cached[1]
+                cache.move_to_end(key)
+            elif self._cache_size > 0:
+                cache[key] = (version, data)
+                cache.move_to_end(key)
+            found[key] = data
+        
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return found
+    
+    async def _embed(self, text: str) -> Sequence[float]:
+        """Run the embedder, awaiting it if it is asynchronous."""
+        vector = self._embedder(text)
+        if inspect.isawaitable(vector):
+            vector = await vector
+        return vector
     
     async def _remember(
         self,
@@ -169,21 +264,26 @@ class AgentMemory:
         key: str | None = None,
     ) -> None:
         """Internal method to store a memory."""
-        import hashlib
-        
-        if key is None:
-            # Generate key from content hash
-            key = hashlib.sha256(f"{self._agent_id}/{content}".encode()).hexdigest()[:16]
-        
-        memory_data = {
-            "type": memory_type.name.lower(),
-            "content": content,
-            "importance": importance,
-            "tags": tags,
-            "created_at": "now",  # Will be set by Rust
-        }
-        
-        await self._db.put(self._namespace(), key, memory_data)
+        # Key derivation (a SHA-256 hash of agent id and content when no
+        # key is given) and record assembly happen in Rust
+        key = await self._db.remember(
+            self._ns,
+            self._agent_id,
+            content,
+            memory_type.name.lower(),
+            importance,
+            tags,
+            key,
+        )
+        self._cache.pop(key, None)
+        if self._embedder is not None:
+            await self._db.embed(
+                self._vec_ns,
+                key,
+                await self._embed(content),
+                self._embedding_model,
+                dtype=self._index_dtype,
+            )
     
     async def recall(
         self,
@@ -196,7 +296,9 @@ class AgentMemory:
         Recall memories relevant to a query.
         
         Searches through all memory types and returns the most
-        relevant memories based on semantic similarity and importance.
+        relevant memories. With an embedder, relevance is the cosine
+        similarity to the query; otherwise it blends a keyword match with
+        the memory's importance.
         
         Args:
             query: Search query
@@ -212,53 +314,133 @@ class AgentMemory:
             >>> for r in results:
             ...     print(f"{r.relevance:.2f}: {r.content}")
         """
-        # For now, do simple keyword search
-        # In the future, this will use vector search with embeddings
-        keys = await self._db.list_keys(self._namespace())
-        results = []
+        if limit <= 0:
+            return []
+        if self._embedder is not None:
+            return await self._recall_vec(query, limit, min_relevance, memory_type)
         
-        query_lower = query.lower()
+        # Keyword fallback. The substring search runs inside the database,
+        # which sends back only (key, matched, importance) per memory. The
+        # memory type, and importance too low to reach min_relevance even
+        # with a keyword match (which adds at most 0.25), are filtered
+        # there; records without the field count as episodic and 0.5
+        filters = []
+        if memory_type is not None:
+            filters.append({
+                "field": "type",
+                "op": "eq",
+                "value": memory_type.name.lower(),
+                "default": "episodic",
+            })
+        min_importance = 2 * min_relevance - 0.5 - 1e-9
+        if min_importance > 0:
+            filters.append({
+                "field": "importance",
+                "op": "gte",
+                "value": min_importance,
+                "default": 0.5,
+            })
         
-        for key in keys:
+        hits = await self._db.filter_contains(
+            self._ns, "content", query.lower(), "importance", filters=filters
+        )
+        if not hits:
+            return []
+        
+        # Score every memory in one vectorized pass: a keyword match is
+        # worth 0.5, blended 50/50 with the memory's importance
+        keys = [key for key, _, _ in hits]
+        matches = np.fromiter((m for _, m, _ in hits), dtype=bool, count=len(hits))
+        importances = np.fromiter(
+            (0.5 if imp is None else imp for _, _, imp in hits),
+            dtype=np.float64,
+            count=len(hits),
+        )
+        relevance = matches * 0.25 + importances * 0.5
+        
+        candidates = np.flatnonzero(relevance >= min_relevance)
+        if len(candidates) > limit:
+            # Select the top `limit` in O(N), then sort only those
+            top = np.argpartition(-relevance[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(-relevance[candidates], kind="stable")]
+        
+        # Only the memories being returned are fetched
+        records = await self._get_records([keys[i] for i in candidates])
+        results = []
+        for i in candidates:
+            data = records.get(keys[i])
+            if not isinstance(data, dict):
+                continue
             try:
-                data = await self._db.get(self._namespace(), key)
-                content = data.get("content", "")
-                
-                # Simple relevance scoring
-                relevance = 0.0
-                if query_lower in content.lower():
-                    relevance = 0.5
-                
-                # Boost by importance
-                importance = data.get("importance", 0.5)
-                relevance = relevance * 0.5 + importance * 0.5
-                
-                if relevance < min_relevance:
+                mem_type = MemoryType[data.get("type", "episodic").upper()]
+            except (KeyError, AttributeError):
+                continue
+            results.append(MemoryRecall(
+                content=data.get("content", ""),
+                memory_type=mem_type,
+                relevance=float(relevance[i]),
+                importance=float(importances[i]),
+                created_at=data.get("created_at", ""),
+                access_count=data.get("access_count", 0),
+                tags=list(data.get("tags", [])),
+            ))
+        
+        return results
+    
+    async def _recall_vec(
+        self,
+        query: str,
+        limit: int,
+        min_relevance: float,
+        memory_type: MemoryType | None,
+    ) -> list[MemoryRecall]:
+        """Recall by vector similarity, searched inside the database."""
+        query_vec = await self._embed(query)
+        # A type filter drops hits after the search, so over-fetch for it,
+        # widening the search until `limit` hits of the type are found or
+        # the index has no more above the threshold (the search is scoped
+        # to this agent's namespace, so a short page means it is exhausted)
+        top_k = limit if memory_type is None else limit * 3
+        while True:
+            hits = await self._db.similar(
+                self._vec_ns, query_vec, top_k=top_k, threshold=min_relevance
+            )
+            if not hits:
+                return []
+            
+            records = await self._get_records([hit["key"] for hit in hits])
+            
+            results = []
+            for hit in hits:
+                data = records.get(hit["key"])
+                if not isinstance(data, dict):
+                    continue
+                try:
+                    mem_type = MemoryType[data.get("type", "episodic").upper()]
+                except (KeyError, AttributeError):
                     continue
-                
-                # Filter by type
-                mem_type_str = data.get("type", "episodic")
-                mem_type = MemoryType[mem_type_str.upper()]
-                
                 if memory_type is not None and mem_type != memory_type:
                     continue
                 
                 results.append(MemoryRecall(
-                    content=content,
+                    content=data.get("content", ""),
                     memory_type=mem_type,
-                    relevance=relevance,
-                    importance=importance,
+                    relevance=hit["score"],
+                    importance=data.get("importance", 0.5),
                     created_at=data.get("created_at", ""),
                     access_count=data.get("access_count", 0),
-                    tags=data.get("tags", []),
+                    tags=list(data.get("tags", [])),
                 ))
-            except Exception:
-                continue
+                if len(results) == limit:
+                    break
+            
+            if len(results) == limit or len(hits) < top_k:
+                break
+            top_k *= 4
         
-        # Sort by relevance
-        results.sort(key=lambda x: x.relevance, reverse=True)
-        
-        return results[:limit]
+        # similar() already returns hits best-first
+        return results
     
     async def consolidate(self) -> dict[str, Any]:
         """
@@ -284,21 +466,14 @@ class AgentMemory:
         Returns:
             Dict with memory counts by type
         """
-        keys = await self._db.list_keys(self._namespace())
+        # Counted inside the database; no records cross into Python
+        counts = await self._db.aggregate_by(self._ns, "type", default="episodic")
         
         stats = {
-            "total": len(keys),
+            "total": sum(counts.values()),
             "episodic": 0,
             "semantic": 0,
             "procedural": 0,
         }
-        
-        for key in keys:
-            try:
-                data = await self._db.get(self._namespace(), key)
-                mem_type = data.get("type", "episodic")
-                stats[mem_type] = stats.get(mem_type, 0) + 1
-            except Exception:
-                continue
-        
+        stats.update(counts)
         return stats
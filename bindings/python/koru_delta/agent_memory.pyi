@@ -3,11 +3,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal, Sequence
 
 if TYPE_CHECKING:
     from koru_delta import Database
 
+Embedder = Callable[[str], Sequence[float] | Awaitable[Sequence[float]]]
+
 class MemoryType(Enum):
     """Types of agent memory."""
     EPISODIC = auto()
@@ -79,7 +81,15 @@ class AgentMemory:
     facts: FactMemory
     procedures: ProcedureMemory
     
-    def __init__(self, db: Database, agent_id: str) -> None: ...
+    def __init__(
+        self,
+        db: Database,
+        agent_id: str,
+        embedder: Embedder | None = None,
+        embedding_model: str = "agent-memory",
+        cache_size: int = 1000,
+        index_dtype: Literal["float32", "int8"] = "float32",
+    ) -> None: ...
     
     async def recall(
         self,
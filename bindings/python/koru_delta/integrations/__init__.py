@@ -21,30 +21,41 @@ Example:
 
 from __future__ import annotations
 
-__all__ = [
-    "chunk_document",
-    "ChunkingConfig",
-    "HybridSearcher",
-    "HybridSearchResult",
-    "CausalFilter",
-]
-
-# Import chunking utilities (always available)
-from koru_delta.integrations.chunking import chunk_document, ChunkingConfig
-
-# Import hybrid search (always available)
-from koru_delta.integrations.hybrid import HybridSearcher, HybridSearchResult, CausalFilter
-
-# LangChain integration (optional)
-try:
+import importlib
+from typing import TYPE_CHECKING
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# this package does not pull in LangChain or LlamaIndex until they are used.
+# Maps each exported name to (module, attribute in that module).
+_LAZY = {
+    "chunk_document": ("koru_delta.integrations.chunking", "chunk_document"),
+    "ChunkingConfig": ("koru_delta.integrations.chunking", "ChunkingConfig"),
+    "HybridSearcher": ("koru_delta.integrations.hybrid", "HybridSearcher"),
+    "HybridSearchResult": ("koru_delta.integrations.hybrid", "HybridSearchResult"),
+    "CausalFilter": ("koru_delta.integrations.hybrid", "CausalFilter"),
+    "KoruDeltaVectorStore": ("koru_delta.integrations.langchain", "KoruDeltaVectorStore"),
+    "LlamaIndexVectorStore": ("koru_delta.integrations.llamaindex", "KoruDeltaVectorStore"),
+}
+
+__all__ = list(_LAZY)
+
+if TYPE_CHECKING:
+    from koru_delta.integrations.chunking import chunk_document, ChunkingConfig
+    from koru_delta.integrations.hybrid import HybridSearcher, HybridSearchResult, CausalFilter
     from koru_delta.integrations.langchain import KoruDeltaVectorStore
-    __all__.append("KoruDeltaVectorStore")
-except ImportError:
-    pass
-
-# LlamaIndex integration (optional)
-try:
     from koru_delta.integrations.llamaindex import KoruDeltaVectorStore as LlamaIndexVectorStore
-    __all__.append("LlamaIndexVectorStore")
-except ImportError:
-    pass
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
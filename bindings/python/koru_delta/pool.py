@@ -0,0 +1,167 @@
+"""Shared database handles for concurrent tasks."""
+
+from __future__ import annotations
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable
+
+if TYPE_CHECKING:
+    from koru_delta import Database
+
+# Persistent handles opened by pools, keyed by resolved path, with the
+# number of pools using each. Pools on the same path then share one handle
+# instead of opening (and replaying the WAL of) the same database twice;
+# the handle is closed when the last of them closes.
+_shared: dict[Path, list] = {}  # path -> [Database, pool count]
+_shared_lock: asyncio.Lock | None = None
+_shared_lock_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_shared_lock() -> asyncio.Lock:
+    # asyncio locks belong to one event loop; make a fresh one per loop
+    global _shared_lock, _shared_lock_loop
+    loop = asyncio.get_running_loop()
+    if _shared_lock is None or _shared_lock_loop is not loop:
+        _shared_lock = asyncio.Lock()
+        _shared_lock_loop = loop
+    return _shared_lock
+
+
+async def _acquire_shared(path: Path) -> Database:
+    async with _get_shared_lock():
+        entry = _shared.get(path)
+        if entry is None:
+            from koru_delta import Database
+
+            entry = _shared[path] = [await Database.create_with_path(str(path)), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+async def _release_shared(path: Path) -> None:
+    async with _get_shared_lock():
+        entry = _shared.get(path)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared[path]
+    await entry[0].close()
+
+
+class Pool:
+    """
+    Open a database once and hand it out to many tasks.
+
+    A ``Database`` handle is thread-safe and cheap to share, so the pool
+    keeps a single handle per database rather than a list of connections.
+    Opening the database (and replaying its WAL) happens once, on first
+    use, instead of once per ``async with`` block. Pools created for the
+    same path share that handle too. ``max_size`` bounds how many tasks
+    may hold the handle at the same time.
+
+    ``close()`` (or leaving ``async with pool:``) closes the handle the
+    pool opened; a handle shared with other pools on the same path is
+    closed when the last of them is.
+
+    Example:
+        >>> async with Pool(path="~/.myapp/db", max_size=8) as pool:
+        ...     async with pool.acquire() as db:
+        ...         await db.put("users", "alice", {"name": "Alice"})
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_size: int = 10,
+        connection_factory: Callable[[], Awaitable[Database]] | None = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.path = Path(path).expanduser() if path is not None else None
+        self.max_size = max_size
+        self._connection_factory = connection_factory
+        self._db: Database | None = None
+        # Set while this pool holds a reference on a shared path handle
+        self._shared_path: Path | None = None
+        # Created lazily so the pool can be built outside a running loop
+        self._open_lock: asyncio.Lock | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    async def _open(self) -> Database:
+        if self._db is not None:
+            return self._db
+
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+
+        async with self._open_lock:
+            if self._db is None:
+                if self._connection_factory is not None:
+                    self._db = await self._connection_factory()
+                elif self.path is None:
+                    from koru_delta import Database
+
+                    self._db = await Database.create()
+                else:
+                    self._shared_path = self.path.resolve()
+                    self._db = await _acquire_shared(self._shared_path)
+        return self._db
+
+    @asynccontextmanager
+    async def acquire(self, timeout: float | None = None) -> AsyncIterator[Database]:
+        """
+        Borrow the shared database handle.
+
+        Args:
+            timeout: Seconds to wait for a free slot (None = wait forever)
+
+        Raises:
+            asyncio.TimeoutError: If no slot became free within ``timeout``
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_size)
+
+        await asyncio.wait_for(self._slots.acquire(), timeout)
+        try:
+            yield await self._open()
+        finally:
+            self._slots.release()
+
+    # aiosqlitepool-style alias
+    connection = acquire
+
+    async def close(self) -> None:
+        """Close the database handle; the next acquire() reopens it."""
+        db, self._db = self._db, None
+        if self._shared_path is not None:
+            path, self._shared_path = self._shared_path, None
+            await _release_shared(path)
+        elif db is not None:
+            await db.close()
+
+    async def __aenter__(self) -> Pool:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def create_pool(
+    path: str | Path | None = None,
+    max_size: int = 10,
+    connection_factory: Callable[[], Awaitable[Database]] | None = None,
+) -> Pool:
+    """
+    Create a pool sharing one database handle between tasks.
+
+    Example:
+        >>> import koru_delta as kd
+        >>> async with kd.create_pool("~/.myapp/db") as pool:
+        ...     async with pool.acquire() as db:
+        ...         await db.get("users", "alice")
+    """
+    return Pool(path=path, max_size=max_size, connection_factory=connection_factory)
@@ -0,0 +1,45 @@
+"""Shared database handles for concurrent tasks."""
+
+from __future__ import annotations
+from contextlib import AbstractAsyncContextManager
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+if TYPE_CHECKING:
+    from koru_delta import Database
+
+class Pool:
+    """Open a database once and hand it out to many tasks."""
+
+    path: Path | None
+    max_size: int
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_size: int = 10,
+        connection_factory: Callable[[], Awaitable[Database]] | None = None,
+    ) -> None: ...
+
+    def acquire(self, timeout: float | None = None) -> AbstractAsyncContextManager[Database]:
+        """Borrow the shared database handle."""
+        ...
+
+    def connection(self, timeout: float | None = None) -> AbstractAsyncContextManager[Database]:
+        """Alias for acquire()."""
+        ...
+
+    async def close(self) -> None:
+        """Close the database handle; the next acquire() reopens it."""
+        ...
+
+    async def __aenter__(self) -> Pool: ...
+    async def __aexit__(self, *exc_info: object) -> None: ...
+
+def create_pool(
+    path: str | Path | None = None,
+    max_size: int = 10,
+    connection_factory: Callable[[], Awaitable[Database]] | None = None,
+) -> Pool:
+    """Create a pool sharing one database handle between tasks."""
+    ...
@@ -7,17 +7,21 @@
 //! - Query and view support
 //! - Identity management
 
+use std::collections::HashMap;
 use std::sync::Arc;
 
 use pyo3::prelude::*;
-use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::pyclass::IterNextOutput;
+use pyo3::exceptions::{PyRuntimeError, PyTypeError, PyValueError};
 use pyo3_asyncio::tokio::future_into_py;
-use pyo3::types::{PyDict, PyList, PyTuple};
+use pyo3::types::{PyBytes, PyDict, PyList, PyString, PyTuple};
 
 use crate::to_python_error;
 use crate::types::{json_to_pyobject, pyobject_to_json};
+use crate::vector::extract_f32_vector;
 use koru_delta::vector::{Vector, VectorSearchOptions};
-use koru_delta::KoruDelta;
+use koru_delta::storage::CausalStorage;
+use koru_delta::{HistoryEntry, KoruDelta, VersionedValue};
 use koru_delta::cluster::{ClusterConfig, ClusterNode};
 
 /// Python wrapper for KoruDelta database
@@ -26,6 +30,14 @@ pub struct PyDatabase {
     db: Arc<KoruDelta>,
 }
 
+impl PyDatabase {
+    fn from_db(db: KoruDelta) -> Self {
+        PyDatabase {
+            db: Arc::new(db),
+        }
+    }
+}
+
 #[pymethods]
 impl PyDatabase {
     /// Create a new in-memory database
@@ -41,7 +53,7 @@ impl PyDatabase {
     fn create(py: Python<'_>) -> PyResult<&PyAny> {
         future_into_py(py, async move {
             let db = KoruDelta::start().await.map_err(to_python_error)?;
-            Ok(PyDatabase { db: Arc::new(db) })
+            Ok(PyDatabase::from_db(db))
         })
     }
 
@@ -66,6 +78,100 @@ impl PyDatabase {
         })
     }
 
+    /// Merge changed fields into the current value (JSON Merge Patch)
+    ///
+    /// Only `delta` crosses into Rust; the merged value is stored as a new
+    /// version. `None` values remove fields; a missing key starts empty.
+    fn patch<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        key: &str,
+        delta: &'py PyAny,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+        let k = key.to_string();
+        let json_delta = pyobject_to_json(delta)?;
+
+        future_into_py(py, async move {
+            db.patch(ns, k, json_delta)
+                .await
+                .map_err(to_python_error)?;
+            Ok(())
+        })
+    }
+
+    /// Store an agent memory record in one call
+    ///
+    /// Builds the record `AgentMemory` keeps and writes it, so the key
+    /// hashing and record assembly never touch Python objects. When `key`
+    /// is None it is derived from `agent_id` and `content`. Returns the key.
+    #[pyo3(signature = (namespace, agent_id, content, memory_type, importance, tags, key = None))]
+    #[allow(clippy::too_many_arguments)]
+    fn remember<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        agent_id: &str,
+        content: &str,
+        memory_type: &str,
+        importance: f64,
+        tags: Vec<String>,
+        key: Option<String>,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+        let key = key.unwrap_or_else(|| memory_key(agent_id, content));
+        let record = serde_json::json!({
+            "type": memory_type,
+            "content": content,
+            "importance": importance,
+            "tags": tags,
+            "created_at": "now",
+        });
+
+        future_into_py(py, async move {
+            db.put(ns, key.clone(), record)
+                .await
+                .map_err(to_python_error)?;
+            Ok(key)
+        })
+    }
+
+    /// Store an already-encoded JSON document
+    ///
+    /// Accepts `bytes` (e.g. from `orjson.dumps`) or `str`. The raw text is
+    /// copied once and parsed on the runtime without walking Python objects,
+    /// which is much cheaper than `put` for large nested payloads.
+    fn put_json<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        key: &str,
+        data: &'py PyAny,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+        let k = key.to_string();
+        let raw: Vec<u8> = if let Ok(bytes) = data.downcast::<PyBytes>() {
+            bytes.as_bytes().to_vec()
+        } else if let Ok(text) = data.downcast::<PyString>() {
+            text.to_str()?.as_bytes().to_vec()
+        } else {
+            return Err(PyTypeError::new_err("data must be bytes or str containing JSON"));
+        };
+
+        future_into_py(py, async move {
+            let json_value: serde_json::Value = serde_json::from_slice(&raw)
+                .map_err(|e| PyValueError::new_err(format!("Invalid JSON: {}", e)))?;
+            db.put(ns, k, json_value)
+                .await
+                .map_err(to_python_error)?;
+            Ok(())
+        })
+    }
+
     /// Store content with automatic distinction-based embedding
     ///
     /// This is the simplified API for semantic storage. The embedding is
@@ -202,6 +308,45 @@ impl PyDatabase {
         })
     }
 
+    /// Store many values in one namespace with a single call
+    ///
+    /// All values are converted while the GIL is held once, then written as
+    /// one batch (one WAL append). Writes are applied in list order, so the
+    /// same key may appear several times to record successive versions.
+    #[pyo3(signature = (namespace, items))]
+    fn put_many<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        items: &'py PyList,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+
+        let mut batch_items: Vec<(String, String, serde_json::Value)> =
+            Vec::with_capacity(items.len());
+        for item in items.iter() {
+            let tuple = item.downcast::<PyTuple>()
+                .map_err(|_| PyValueError::new_err("Each item must be a tuple of (key, value)"))?;
+
+            if tuple.len() != 2 {
+                return Err(PyValueError::new_err("Each tuple must have exactly 2 elements: (key, value)"));
+            }
+
+            let key: String = tuple.get_item(0)?.extract()?;
+            let value = pyobject_to_json(tuple.get_item(1)?)?;
+
+            batch_items.push((namespace.to_string(), key, value));
+        }
+
+        let item_count = batch_items.len();
+        future_into_py(py, async move {
+            db.put_batch(batch_items)
+                .await
+                .map_err(to_python_error)?;
+            Ok(item_count)
+        })
+    }
+
     /// Retrieve a value
     fn get<'py>(
         &self,
@@ -219,6 +364,83 @@ impl PyDatabase {
         })
     }
 
+    /// Retrieve several values from one namespace in a single call
+    ///
+    /// Returns a dict mapping each found key to its current value.
+    /// Keys that do not exist are left out rather than raising.
+    fn get_many<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        keys: Vec<String>,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+
+        future_into_py(py, async move {
+            let mut found = Vec::with_capacity(keys.len());
+            for key in keys {
+                match db.get(&ns, &key).await {
+                    Ok(versioned) => found.push((key, versioned)),
+                    Err(koru_delta::DeltaError::KeyNotFound { .. }) => {}
+                    Err(e) => return Err(to_python_error(e)),
+                }
+            }
+
+            Python::with_gil(|py| {
+                let dict = PyDict::new(py);
+                for (key, versioned) in found {
+                    dict.set_item(key, json_to_pyobject(py, versioned.value())).ok();
+                }
+                Ok(dict.to_object(py))
+            })
+        })
+    }
+
+    /// Retrieve several values with their version ids in a single call
+    ///
+    /// Returns a dict mapping each found key to `(version_id, value)`.
+    /// When `known` maps a key to its current version id the value is
+    /// returned as None instead, so callers caching by version only pay
+    /// for converting values that changed.
+    #[pyo3(signature = (namespace, keys, known = None))]
+    fn get_many_versioned<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        keys: Vec<String>,
+        known: Option<HashMap<String, String>>,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+        let known = known.unwrap_or_default();
+
+        future_into_py(py, async move {
+            let mut found = Vec::with_capacity(keys.len());
+            for key in keys {
+                match db.get(&ns, &key).await {
+                    Ok(versioned) => found.push((key, versioned)),
+                    Err(koru_delta::DeltaError::KeyNotFound { .. }) => {}
+                    Err(e) => return Err(to_python_error(e)),
+                }
+            }
+
+            Python::with_gil(|py| {
+                let dict = PyDict::new(py);
+                for (key, versioned) in found {
+                    let version = versioned.version_id();
+                    let value = if known.get(&key).is_some_and(|v| v == version) {
+                        py.None()
+                    } else {
+                        json_to_pyobject(py, versioned.value())
+                    };
+                    dict.set_item(&key, (version, value)).ok();
+                }
+                Ok(dict.to_object(py))
+            })
+        })
+    }
+
     /// Get value at specific timestamp (time travel)
     fn get_at<'py>(
         &self,
@@ -244,6 +466,49 @@ impl PyDatabase {
         })
     }
 
+    /// Capture the current point in time as a reusable snapshot handle
+    ///
+    /// Pass it to `get_at_snapshot()` later to read values exactly as they
+    /// were when the snapshot was taken.
+    fn snapshot(&self) -> PySnapshot {
+        PySnapshot {
+            timestamp: chrono::Utc::now(),
+        }
+    }
+
+    /// Pin an existing point in time as a snapshot handle
+    ///
+    /// The timestamp is parsed once here, so several `get_at_snapshot()`
+    /// reads through the handle all resolve against the same instant.
+    fn snapshot_at(&self, timestamp: &str) -> PyResult<PySnapshot> {
+        let timestamp = chrono::DateTime::parse_from_rfc3339(timestamp)
+            .map_err(|e| PyValueError::new_err(format!("Invalid timestamp: {}", e)))?
+            .with_timezone(&chrono::Utc);
+        Ok(PySnapshot { timestamp })
+    }
+
+    /// Retrieve a value as of a snapshot taken with `snapshot()`
+    fn get_at_snapshot<'py>(
+        &self,
+        py: Python<'py>,
+        snapshot: &PySnapshot,
+        namespace: &str,
+        key: &str,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+        let k = key.to_string();
+        let ts = snapshot.timestamp;
+
+        future_into_py(py, async move {
+            let versioned = db
+                .get_at(&ns, &k, ts)
+                .await
+                .map_err(to_python_error)?;
+            Python::with_gil(|py| Ok(json_to_pyobject(py, versioned.value())))
+        })
+    }
+
     /// Get history for a key
     fn history<'py>(
         &self,
@@ -259,93 +524,269 @@ impl PyDatabase {
             let entries = db.history(&ns, &k).await.map_err(to_python_error)?;
             
             Python::with_gil(|py| {
-                let list = PyList::new(py, Vec::<PyObject>::new());
-                for entry in entries {
-                    let dict = PyDict::new(py);
-                    dict.set_item("value", json_to_pyobject(py, &entry.value)).ok();
-                    dict.set_item("timestamp", entry.timestamp.to_rfc3339()).ok();
-                    dict.set_item("version_id", &entry.version_id).ok();
-                    list.append(dict).ok();
-                }
+                let list = PyList::new(py, entries.iter().map(|e| history_entry_to_dict(py, e)));
                 Ok(list.to_object(py))
             })
         })
     }
 
-    /// Store a vector embedding with explicit vector data
-    #[pyo3(signature = (namespace, key, embedding, model, metadata = None))]
-    fn embed<'py>(
+    /// Get history for several keys in a single call
+    ///
+    /// Returns a dict mapping each found key to the same list of entries
+    /// `history()` would return. Keys that do not exist are left out.
+    fn history_many<'py>(
         &self,
         py: Python<'py>,
         namespace: &str,
-        key: &str,
-        embedding: Vec<f32>,
-        model: &str,
-        metadata: Option<PyObject>,
+        keys: Vec<String>,
     ) -> PyResult<&'py PyAny> {
         let db = self.db.clone();
         let ns = namespace.to_string();
-        let k = key.to_string();
-        let vec = Vector::new(embedding, model);
-        let meta = metadata.and_then(|m| {
+
+        future_into_py(py, async move {
+            let mut found = Vec::with_capacity(keys.len());
+            for key in keys {
+                match db.history(&ns, &key).await {
+                    Ok(entries) => found.push((key, entries)),
+                    Err(koru_delta::DeltaError::KeyNotFound { .. }) => {}
+                    Err(e) => return Err(to_python_error(e)),
+                }
+            }
+
             Python::with_gil(|py| {
-                pyobject_to_json(m.as_ref(py)).ok()
+                let result = PyDict::new(py);
+                for (key, entries) in found {
+                    let list = PyList::new(py, entries.iter().map(|e| history_entry_to_dict(py, e)));
+                    result.set_item(key, list).ok();
+                }
+                Ok(result.to_object(py))
             })
-        });
+        })
+    }
+
+    /// Get the value a key was first written with
+    ///
+    /// Cheaper than `history()[0]["value"]`: only one value crosses into
+    /// Python, however many versions the key has.
+    fn first_version<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        key: &str,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+        let k = key.to_string();
 
         future_into_py(py, async move {
-            db.embed(ns, k, vec, meta)
+            let versioned = db
+                .first_version(&ns, &k)
                 .await
                 .map_err(to_python_error)?;
-            Ok(())
+            Python::with_gil(|py| Ok(json_to_pyobject(py, versioned.value())))
         })
     }
 
-    /// Search for similar vectors
-    #[pyo3(signature = (namespace, query, top_k = 10, threshold = 0.0, model_filter = None))]
-    fn similar<'py>(
+    /// Get the history entries for a key written in `[start, end)`
+    ///
+    /// The time window is applied in the store, so only matching entries
+    /// are converted to Python. Both bounds are RFC 3339 timestamps.
+    fn history_between<'py>(
         &self,
         py: Python<'py>,
-        namespace: Option<&str>,
-        query: Vec<f32>,
-        top_k: usize,
-        threshold: f32,
-        model_filter: Option<String>,
+        namespace: &str,
+        key: &str,
+        start: &str,
+        end: &str,
     ) -> PyResult<&'py PyAny> {
         let db = self.db.clone();
-        let query_vec = Vector::new(query, "query");
-        let ns = namespace.map(|s| s.to_string());
-        
-        let opts = VectorSearchOptions::new()
-            .top_k(top_k)
-            .threshold(threshold);
-        
-        let opts = if let Some(filter) = model_filter {
-            opts.model_filter(filter)
-        } else {
-            opts
+        let ns = namespace.to_string();
+        let k = key.to_string();
+
+        let parse = |ts: &str| {
+            chrono::DateTime::parse_from_rfc3339(ts)
+                .map(|t| t.with_timezone(&chrono::Utc))
+                .map_err(|e| PyValueError::new_err(format!("Invalid timestamp: {}", e)))
         };
+        let start = parse(start)?;
+        let end = parse(end)?;
 
         future_into_py(py, async move {
-            let results = db
-                .embed_search(ns.as_deref(), &query_vec, opts)
+            let entries = db
+                .history_between(&ns, &k, start, end)
                 .await
                 .map_err(to_python_error)?;
-            
+
             Python::with_gil(|py| {
-                let list = PyList::new(py, Vec::<PyObject>::new());
-                for result in results {
-                    let dict = PyDict::new(py);
-                    dict.set_item("namespace", &result.namespace).ok();
-                    dict.set_item("key", &result.key).ok();
-                    dict.set_item("score", result.score).ok();
-                    list.append(dict).ok();
-                }
+                let list = PyList::new(py, entries.iter().map(|e| history_entry_to_dict(py, e)));
+                Ok(list.to_object(py))
+            })
+        })
+    }
+
+    /// Get only the `n` most recent history entries for a key
+    ///
+    /// Same entry shape as `history()`, oldest first, but the version chain
+    /// is walked only `n` steps instead of to the first write.
+    fn history_tail<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        key: &str,
+        n: usize,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+        let k = key.to_string();
+
+        future_into_py(py, async move {
+            let entries = db.history_tail(&ns, &k, n).await.map_err(to_python_error)?;
+
+            Python::with_gil(|py| {
+                let list = PyList::new(py, entries.iter().map(|e| history_entry_to_dict(py, e)));
                 Ok(list.to_object(py))
             })
         })
     }
 
+    /// Iterate over a key's history without building a Python list
+    ///
+    /// Returns an async iterator: `async for entry in db.history_iter(ns, key)`.
+    /// The version chain is walked lazily, newest first: each step reads
+    /// one version and converts it to a dict as it is consumed. With
+    /// `oldest_first=True` the chain is walked up front instead (versions
+    /// share their values, so nothing is copied) and entries come in the
+    /// same order as `history()`; dicts are still built one at a time.
+    #[pyo3(signature = (namespace, key, oldest_first = false))]
+    fn history_iter(
+        &self,
+        namespace: &str,
+        key: &str,
+        oldest_first: bool,
+    ) -> PyResult<PyHistoryIterator> {
+        let storage = self.db.storage().clone();
+        let head = storage.get(namespace, key).map_err(to_python_error)?;
+        // A chain can never be longer than the version store; the bound
+        // guards against a cyclic chain in imported data
+        let remaining = storage.total_version_count();
+        let mut iter = PyHistoryIterator {
+            storage,
+            next: Some(head),
+            remaining,
+            buffered: None,
+        };
+        if oldest_first {
+            // Newest first in the buffer, so popping yields oldest first
+            let mut chain = Vec::new();
+            while let Some(versioned) = iter.step() {
+                chain.push(versioned);
+            }
+            iter.buffered = Some(chain);
+        }
+        Ok(iter)
+    }
+
+    /// Store a vector embedding with explicit vector data
+    ///
+    /// `dtype="int8"` keeps an int8-quantized copy in the search index,
+    /// which is 4x smaller to scan; the stored value stays full precision.
+    #[pyo3(signature = (namespace, key, embedding, model, metadata = None, dtype = "float32"))]
+    fn embed<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        key: &str,
+        embedding: &'py PyAny,
+        model: &str,
+        metadata: Option<PyObject>,
+        dtype: &str,
+    ) -> PyResult<&'py PyAny> {
+        embed_in(
+            py,
+            self.db.clone(),
+            namespace.to_string(),
+            key,
+            embedding,
+            model,
+            metadata,
+            dtype,
+        )
+    }
+
+    /// Store several vector embeddings in one namespace with a single call
+    ///
+    /// Each item is a dict with `key`, `embedding`, `model` and an optional
+    /// `metadata`. The values are written as one batch (one WAL append) and
+    /// then indexed, instead of one write per vector. `dtype` works as in
+    /// `embed`.
+    #[pyo3(signature = (namespace, items, dtype = "float32"))]
+    fn embed_many<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        items: &'py PyList,
+        dtype: &str,
+    ) -> PyResult<&'py PyAny> {
+        let quantize = parse_dtype(dtype)?;
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+
+        let mut batch = Vec::with_capacity(items.len());
+        for item in items.iter() {
+            let item = item
+                .downcast::<PyDict>()
+                .map_err(|_| PyValueError::new_err("Each item must be a dict"))?;
+            let field = |name: &str| {
+                item.get_item(name)
+                    .ok()
+                    .flatten()
+                    .ok_or_else(|| PyValueError::new_err(format!("Item is missing '{}'", name)))
+            };
+
+            let key: String = field("key")?.extract()?;
+            let model: String = field("model")?.extract()?;
+            let vector = Vector::new(extract_f32_vector(field("embedding")?)?, model);
+            let metadata = match item.get_item("metadata").ok().flatten() {
+                Some(m) if !m.is_none() => Some(pyobject_to_json(m)?),
+                _ => None,
+            };
+            batch.push((key, vector, metadata));
+        }
+
+        let item_count = batch.len();
+        future_into_py(py, async move {
+            if quantize {
+                db.embed_batch_quantized(ns, batch).await
+            } else {
+                db.embed_batch(ns, batch).await
+            }
+            .map_err(to_python_error)?;
+            Ok(item_count)
+        })
+    }
+
+    /// Search for similar vectors
+    #[pyo3(signature = (namespace, query, top_k = 10, threshold = 0.0, model_filter = None))]
+    fn similar<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: Option<&str>,
+        query: &'py PyAny,
+        top_k: usize,
+        threshold: f32,
+        model_filter: Option<String>,
+    ) -> PyResult<&'py PyAny> {
+        similar_in(
+            py,
+            self.db.clone(),
+            namespace.map(|s| s.to_string()),
+            query,
+            top_k,
+            threshold,
+            model_filter,
+        )
+    }
+
     /// Query data with filters
     #[pyo3(signature = (namespace, filters = None, sort = None, limit = None, offset = None))]
     fn query<'py>(
@@ -366,38 +807,7 @@ impl PyDatabase {
         query.offset = offset;
 
         // Parse filters if provided
-        if let Some(filters_obj) = filters {
-            if let Ok(filters_list) = filters_obj.downcast::<PyList>(py) {
-                for filter_obj in filters_list.iter() {
-                    if let Ok(filter_dict) = filter_obj.downcast::<PyDict>() {
-                        if let (Ok(Some(field_any)), Ok(Some(op_any)), Ok(Some(value))) = (
-                            filter_dict.get_item("field"),
-                            filter_dict.get_item("op"),
-                            filter_dict.get_item("value"),
-                        ) {
-                            let field = field_any.extract::<String>().ok();
-                            let op = op_any.extract::<String>().ok();
-                            if field.is_none() || op.is_none() {
-                                continue;
-                            }
-                            let field = field.unwrap();
-                            let op = op.unwrap();
-                            let json_value = pyobject_to_json(value).unwrap_or(serde_json::Value::Null);
-                            let filter = match op.as_str() {
-                                "eq" => koru_delta::query::Filter::eq(field, json_value),
-                                "ne" => koru_delta::query::Filter::ne(field, json_value),
-                                "gt" => koru_delta::query::Filter::gt(field, json_value),
-                                "gte" => koru_delta::query::Filter::gte(field, json_value),
-                                "lt" => koru_delta::query::Filter::lt(field, json_value),
-                                "lte" => koru_delta::query::Filter::lte(field, json_value),
-                                _ => koru_delta::query::Filter::eq(field, json_value),
-                            };
-                            query.filters.push(filter);
-                        }
-                    }
-                }
-            }
-        }
+        query.filters = parse_filters(py, filters);
 
         // Parse sort if provided
         if let Some(sort_obj) = sort {
@@ -604,6 +1014,79 @@ impl PyDatabase {
         })
     }
 
+    /// List the keys of several namespaces in one call
+    ///
+    /// Returns a dict mapping each namespace to its sorted keys; the
+    /// current state is scanned once for all of them.
+    fn list_keys_many<'py>(
+        &self,
+        py: Python<'py>,
+        namespaces: Vec<String>,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+
+        future_into_py(py, async move {
+            let refs: Vec<&str> = namespaces.iter().map(String::as_str).collect();
+            let keys = db.list_keys_many(&refs).await;
+            Python::with_gil(|py| Ok(keys.to_object(py)))
+        })
+    }
+
+    /// Count the current values of a namespace grouped by a top-level field
+    ///
+    /// Returns a dict mapping each field value to its count, computed in
+    /// Rust without fetching the values. Values lacking the field count
+    /// under `default` when given and are skipped otherwise.
+    #[pyo3(signature = (namespace, field, default = None))]
+    fn aggregate_by<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        field: &str,
+        default: Option<String>,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+        let field = field.to_string();
+
+        future_into_py(py, async move {
+            let counts = db.count_by_field(&ns, &field, default.as_deref()).await;
+            Python::with_gil(|py| Ok(counts.to_object(py)))
+        })
+    }
+
+    /// Test a string field of every value in a namespace for a substring
+    ///
+    /// Returns a list of `(key, matched, number)` tuples, one per value
+    /// passing `filters` (as in `query`): whether `field` contains `needle`
+    /// case-insensitively, and `number_field` as a float (None when
+    /// missing). The search runs in Rust, so the values are never
+    /// converted to Python objects.
+    #[pyo3(signature = (namespace, field, needle, number_field, filters = None))]
+    fn filter_contains<'py>(
+        &self,
+        py: Python<'py>,
+        namespace: &str,
+        field: &str,
+        needle: &str,
+        number_field: &str,
+        filters: Option<PyObject>,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = namespace.to_string();
+        let field = field.to_string();
+        let needle = needle.to_lowercase();
+        let number_field = number_field.to_string();
+        let filters = parse_filters(py, filters);
+
+        future_into_py(py, async move {
+            let hits = db
+                .filter_contains(&ns, &field, &needle, &number_field, &filters)
+                .await;
+            Python::with_gil(|py| Ok(hits.to_object(py)))
+        })
+    }
+
     /// List all namespaces
     fn list_namespaces<'py>(
         &self,
@@ -663,6 +1146,7 @@ impl PyDatabase {
                 dict.set_item("key_count", stats.key_count).ok();
                 dict.set_item("total_versions", stats.total_versions).ok();
                 dict.set_item("namespace_count", stats.namespace_count).ok();
+                dict.set_item("per_namespace", stats.per_namespace.to_object(py)).ok();
                 Ok(dict.to_object(py))
             })
         })
@@ -681,6 +1165,31 @@ impl PyDatabase {
         }
     }
 
+    /// Stop background tasks and release the database lock
+    ///
+    /// A persistent database can then be opened again, by this process or
+    /// another one. The handle must not be used afterwards.
+    fn close<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+
+        future_into_py(py, async move {
+            db.close().await.map_err(to_python_error)?;
+            Ok(())
+        })
+    }
+
+    /// Get a handle bound to one namespace
+    ///
+    /// Its methods take only the key. The handle is a convenience: it is
+    /// cheap to create and calls through it cost the same as the
+    /// corresponding `Database` methods.
+    fn namespace(&self, name: &str) -> PyNamespace {
+        PyNamespace {
+            db: self.db.clone(),
+            name: name.to_string(),
+        }
+    }
+
     /// Get identity manager
     fn identities(&self) -> PyIdentityManager {
         PyIdentityManager {
@@ -1007,8 +1516,286 @@ impl PyDatabase {
         let path = std::path::PathBuf::from(path);
         future_into_py(py, async move {
             let db = KoruDelta::start_with_path(&path).await.map_err(to_python_error)?;
-            Ok(PyDatabase { db: Arc::new(db) })
+            Ok(PyDatabase::from_db(db))
+        })
+    }
+}
+
+/// Content-derived agent memory key: the first 16 hex chars of the SHA-256
+/// of `agent_id/content`. Existing databases are keyed this way, so changing
+/// the derivation would file re-remembered content under a second key.
+fn memory_key(agent_id: &str, content: &str) -> String {
+    use sha2::{Digest, Sha256};
+
+    let digest = Sha256::new()
+        .chain_update(agent_id.as_bytes())
+        .chain_update(b"/")
+        .chain_update(content.as_bytes())
+        .finalize();
+    hex::encode(&digest[..8])
+}
+
+/// Parse `[{"field", "op", "value", "default"?}, ...]` query filters, skipping malformed entries
+fn parse_filters(py: Python<'_>, filters: Option<PyObject>) -> Vec<koru_delta::query::Filter> {
+    let mut parsed = Vec::new();
+    if let Some(filters_obj) = filters {
+        if let Ok(filters_list) = filters_obj.downcast::<PyList>(py) {
+            for filter_obj in filters_list.iter() {
+                if let Ok(filter_dict) = filter_obj.downcast::<PyDict>() {
+                    if let (Ok(Some(field_any)), Ok(Some(op_any)), Ok(Some(value))) = (
+                        filter_dict.get_item("field"),
+                        filter_dict.get_item("op"),
+                        filter_dict.get_item("value"),
+                    ) {
+                        let field = field_any.extract::<String>().ok();
+                        let op = op_any.extract::<String>().ok();
+                        if field.is_none() || op.is_none() {
+                            continue;
+                        }
+                        let field = field.unwrap();
+                        let op = op.unwrap();
+                        let json_value = pyobject_to_json(value).unwrap_or(serde_json::Value::Null);
+                        let filter = match op.as_str() {
+                            "eq" => koru_delta::query::Filter::eq(field.clone(), json_value),
+                            "ne" => koru_delta::query::Filter::ne(field.clone(), json_value),
+                            "gt" => koru_delta::query::Filter::gt(field.clone(), json_value),
+                            "gte" => koru_delta::query::Filter::gte(field.clone(), json_value),
+                            "lt" => koru_delta::query::Filter::lt(field.clone(), json_value),
+                            "lte" => koru_delta::query::Filter::lte(field.clone(), json_value),
+                            _ => koru_delta::query::Filter::eq(field.clone(), json_value),
+                        };
+                        // An optional "default" is the value assumed for records
+                        // without the field: they pass if the default would
+                        let filter = match filter_dict.get_item("default") {
+                            Ok(Some(default)) => {
+                                let mut doc = pyobject_to_json(default).unwrap_or(serde_json::Value::Null);
+                                for part in field.rsplit('.') {
+                                    doc = serde_json::json!({ part: doc });
+                                }
+                                if filter.matches_value(&doc) {
+                                    koru_delta::query::Filter::or(vec![
+                                        filter,
+                                        koru_delta::query::Filter::not(koru_delta::query::Filter::exists(field)),
+                                    ])
+                                } else {
+                                    filter
+                                }
+                            }
+                            _ => filter,
+                        };
+                        parsed.push(filter);
+                    }
+                }
+            }
+        }
+    }
+
+    parsed
+}
+
+/// Whether an embedding `dtype` asks for an int8-quantized index entry
+fn parse_dtype(dtype: &str) -> PyResult<bool> {
+    match dtype {
+        "float32" => Ok(false),
+        "int8" => Ok(true),
+        other => Err(PyValueError::new_err(format!(
+            "Unsupported dtype '{}': expected 'float32' or 'int8'",
+            other
+        ))),
+    }
+}
+
+/// Shared body of `Database.embed` and `Namespace.embed`
+#[allow(clippy::too_many_arguments)]
+fn embed_in<'py>(
+    py: Python<'py>,
+    db: Arc<KoruDelta>,
+    ns: String,
+    key: &str,
+    embedding: &'py PyAny,
+    model: &str,
+    metadata: Option<PyObject>,
+    dtype: &str,
+) -> PyResult<&'py PyAny> {
+    let quantize = parse_dtype(dtype)?;
+    let k = key.to_string();
+    let vec = Vector::new(extract_f32_vector(embedding)?, model);
+    let meta = metadata.and_then(|m| pyobject_to_json(m.as_ref(py)).ok());
+
+    future_into_py(py, async move {
+        if quantize {
+            db.embed_quantized(ns, k, vec, meta).await
+        } else {
+            db.embed(ns, k, vec, meta).await
+        }
+        .map_err(to_python_error)?;
+        Ok(())
+    })
+}
+
+/// Shared body of `Database.similar` and `Namespace.similar`
+fn similar_in<'py>(
+    py: Python<'py>,
+    db: Arc<KoruDelta>,
+    ns: Option<String>,
+    query: &'py PyAny,
+    top_k: usize,
+    threshold: f32,
+    model_filter: Option<String>,
+) -> PyResult<&'py PyAny> {
+    let query_vec = Vector::new(extract_f32_vector(query)?, "query");
+
+    let opts = VectorSearchOptions::new()
+        .top_k(top_k)
+        .threshold(threshold);
+
+    let opts = if let Some(filter) = model_filter {
+        opts.model_filter(filter)
+    } else {
+        opts
+    };
+
+    future_into_py(py, async move {
+        let results = db
+            .embed_search(ns.as_deref(), &query_vec, opts)
+            .await
+            .map_err(to_python_error)?;
+
+        Python::with_gil(|py| {
+            let list = PyList::new(py, Vec::<PyObject>::new());
+            for result in results {
+                let dict = PyDict::new(py);
+                dict.set_item("namespace", &result.namespace).ok();
+                dict.set_item("key", &result.key).ok();
+                dict.set_item("score", result.score).ok();
+                list.append(dict).ok();
+            }
+            Ok(list.to_object(py))
         })
+    })
+}
+
+/// Convert a history entry to the dict shape returned by `history()`
+fn history_entry_to_dict(py: Python<'_>, entry: &HistoryEntry) -> PyObject {
+    let dict = PyDict::new(py);
+    dict.set_item("value", json_to_pyobject(py, &entry.value)).ok();
+    dict.set_item("timestamp", entry.timestamp.to_rfc3339()).ok();
+    dict.set_item("version_id", &entry.version_id).ok();
+    dict.to_object(py)
+}
+
+/// Same shape as `history_entry_to_dict`, without cloning the value first
+fn versioned_to_history_dict(py: Python<'_>, versioned: &VersionedValue) -> PyObject {
+    let dict = PyDict::new(py);
+    dict.set_item("value", json_to_pyobject(py, versioned.value())).ok();
+    dict.set_item("timestamp", versioned.timestamp.to_rfc3339()).ok();
+    dict.set_item("version_id", versioned.version_id()).ok();
+    dict.to_object(py)
+}
+
+/// Point-in-time handle returned by `Database.snapshot()` and `snapshot_at()`
+#[pyclass(name = "Snapshot", frozen)]
+pub struct PySnapshot {
+    timestamp: chrono::DateTime<chrono::Utc>,
+}
+
+#[pymethods]
+impl PySnapshot {
+    /// When the snapshot was taken (RFC 3339)
+    #[getter]
+    fn timestamp(&self) -> String {
+        self.timestamp.to_rfc3339()
+    }
+
+    /// String representation
+    fn __repr__(&self) -> String {
+        format!("<Snapshot {}>", self.timestamp.to_rfc3339())
+    }
+}
+
+/// Async iterator over history entries, newest first by default
+///
+/// Holds only the next version to yield, so memory stays constant however
+/// long the history is and the first entry is ready immediately. In
+/// oldest-first mode the walked chain is held in `buffered` instead.
+#[pyclass(name = "HistoryIterator")]
+pub struct PyHistoryIterator {
+    storage: Arc<CausalStorage>,
+    next: Option<VersionedValue>,
+    remaining: usize,
+    buffered: Option<Vec<VersionedValue>>,
+}
+
+impl PyHistoryIterator {
+    /// Yield the next version: popped from the buffer in oldest-first
+    /// mode, otherwise read by stepping back along the chain
+    fn step(&mut self) -> Option<VersionedValue> {
+        if let Some(chain) = self.buffered.as_mut() {
+            return chain.pop();
+        }
+        let current = self.next.take()?;
+        if self.remaining > 0 {
+            self.remaining -= 1;
+            self.next = self.storage.previous(&current);
+        }
+        Some(current)
+    }
+}
+
+#[pymethods]
+impl PyHistoryIterator {
+    fn __aiter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __anext__(&mut self, py: Python<'_>) -> PyResult<Option<PyObject>> {
+        // The entry is already in memory, so hand back a completed
+        // awaitable rather than scheduling a task on the runtime
+        match self.step() {
+            Some(versioned) => {
+                let value = Some(versioned_to_history_dict(py, &versioned));
+                Ok(Some(Py::new(py, Ready { value })?.into_py(py)))
+            }
+            None => Ok(None),
+        }
+    }
+
+    /// Gather the remaining entries into a list, oldest first like `history()`
+    fn collect<'py>(&mut self, py: Python<'py>) -> PyResult<&'py PyAny> {
+        let mut chain = Vec::new();
+        while let Some(versioned) = self.step() {
+            chain.push(versioned);
+        }
+        if self.buffered.is_none() {
+            chain.reverse();
+        }
+        let list = PyList::new(
+            py,
+            chain.iter().map(|v| versioned_to_history_dict(py, v)),
+        );
+        let list: PyObject = list.to_object(py);
+        future_into_py(py, async move { Ok(list) })
+    }
+}
+
+/// An awaitable that is already complete: awaiting it returns `value`
+#[pyclass]
+struct Ready {
+    value: Option<PyObject>,
+}
+
+#[pymethods]
+impl Ready {
+    fn __await__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> IterNextOutput<PyObject, PyObject> {
+        IterNextOutput::Return(self.value.take().unwrap_or_else(|| py.None()))
     }
 }
 
@@ -1165,6 +1952,130 @@ impl PyWorkspace {
 }
 
 
+/// Namespace handle for Python
+///
+/// Returned by `Database.namespace()`; every method operates on the
+/// namespace the handle was created for. This is an ergonomics API: the
+/// name is still passed to the core on every call, as `Database` does.
+#[pyclass(name = "Namespace")]
+pub struct PyNamespace {
+    db: Arc<KoruDelta>,
+    name: String,
+}
+
+#[pymethods]
+impl PyNamespace {
+    /// Name of the namespace
+    #[getter]
+    fn name(&self) -> &str {
+        &self.name
+    }
+
+    /// Store a value in the namespace
+    fn put<'py>(
+        &self,
+        py: Python<'py>,
+        key: &str,
+        value: &'py PyAny,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = self.name.clone();
+        let k = key.to_string();
+        let json_value = pyobject_to_json(value)?;
+
+        future_into_py(py, async move {
+            db.put(ns, k, json_value)
+                .await
+                .map_err(to_python_error)?;
+            Ok(())
+        })
+    }
+
+    /// Retrieve a value from the namespace
+    fn get<'py>(
+        &self,
+        py: Python<'py>,
+        key: &str,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = self.name.clone();
+        let k = key.to_string();
+
+        future_into_py(py, async move {
+            let versioned = db.get(ns, k).await.map_err(to_python_error)?;
+            Python::with_gil(|py| Ok(json_to_pyobject(py, versioned.value())))
+        })
+    }
+
+    /// Get history for a key in the namespace
+    fn history<'py>(
+        &self,
+        py: Python<'py>,
+        key: &str,
+    ) -> PyResult<&'py PyAny> {
+        let db = self.db.clone();
+        let ns = self.name.clone();
+        let k = key.to_string();
+
+        future_into_py(py, async move {
+            let entries = db.history(&ns, &k).await.map_err(to_python_error)?;
+
+            Python::with_gil(|py| {
+                let list = PyList::new(py, entries.iter().map(|e| history_entry_to_dict(py, e)));
+                Ok(list.to_object(py))
+            })
+        })
+    }
+
+    /// Store a vector embedding in the namespace
+    #[pyo3(signature = (key, embedding, model, metadata = None, dtype = "float32"))]
+    fn embed<'py>(
+        &self,
+        py: Python<'py>,
+        key: &str,
+        embedding: &'py PyAny,
+        model: &str,
+        metadata: Option<PyObject>,
+        dtype: &str,
+    ) -> PyResult<&'py PyAny> {
+        embed_in(
+            py,
+            self.db.clone(),
+            self.name.clone(),
+            key,
+            embedding,
+            model,
+            metadata,
+            dtype,
+        )
+    }
+
+    /// Search for similar vectors within the namespace
+    #[pyo3(signature = (query, top_k = 10, threshold = 0.0, model_filter = None))]
+    fn similar<'py>(
+        &self,
+        py: Python<'py>,
+        query: &'py PyAny,
+        top_k: usize,
+        threshold: f32,
+        model_filter: Option<String>,
+    ) -> PyResult<&'py PyAny> {
+        similar_in(
+            py,
+            self.db.clone(),
+            Some(self.name.clone()),
+            query,
+            top_k,
+            threshold,
+            model_filter,
+        )
+    }
+
+    /// String representation
+    fn __repr__(&self) -> String {
+        format!("<Namespace '{}'>", self.name)
+    }
+}
 
 // ============================================================================
 // Cluster Support for Python Bindings
@@ -1237,7 +2148,7 @@ impl PyClusterNode {
             
             Python::with_gil(|py| {
                 let py_node = PyClusterNode { node };
-                let py_db = PyDatabase { db: Arc::new(db_with_cluster) };
+                let py_db = PyDatabase::from_db(db_with_cluster);
                 let tuple = PyTuple::new(py, &[py_node.into_py(py), py_db.into_py(py)]);
                 Ok(tuple.to_object(py))
             })
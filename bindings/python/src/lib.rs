@@ -9,8 +9,9 @@ use pyo3::create_exception;
 
 mod database;
 mod types;
+mod vector;
 
-use database::{PyDatabase, PyIdentityManager, PyWorkspace, PyClusterConfig, PyClusterNode};
+use database::{PyDatabase, PyHistoryIterator, PyIdentityManager, PyNamespace, PySnapshot, PyWorkspace, PyClusterConfig, PyClusterNode};
 
 /// Convert Rust DeltaError to appropriate Python exception
 fn to_python_error(e: koru_delta::DeltaError) -> PyErr {
@@ -59,6 +60,9 @@ fn _internal(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<PyDatabase>()?;
     m.add_class::<PyIdentityManager>()?;
     m.add_class::<PyWorkspace>()?;
+    m.add_class::<PyHistoryIterator>()?;
+    m.add_class::<PyNamespace>()?;
+    m.add_class::<PySnapshot>()?;
     
     // Cluster classes
     m.add_class::<PyClusterConfig>()?;
@@ -2,7 +2,7 @@
 
 use pyo3::prelude::*;
 use pyo3::exceptions::PyTypeError;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyBool, PyDict, PyFloat, PyList, PyString};
 use serde_json::Value;
 
 /// Convert serde_json::Value to Python object
@@ -25,9 +25,13 @@ pub fn json_to_pyobject(py: Python, value: &Value) -> PyObject {
             list.to_object(py)
         }
         Value::Object(map) => {
+            // Field names repeat across records and versions; interning
+            // shares one str object per name instead of allocating a new
+            // one per dict, and makes later key lookups pointer compares
             let dict = PyDict::new(py);
             for (k, v) in map {
-                dict.set_item(k, json_to_pyobject(py, v)).unwrap();
+                dict.set_item(PyString::intern(py, k), json_to_pyobject(py, v))
+                    .unwrap();
             }
             dict.to_object(py)
         }
@@ -35,30 +39,34 @@ pub fn json_to_pyobject(py: Python, value: &Value) -> PyObject {
 }
 
 /// Convert Python object to serde_json::Value
+///
+/// Built-in types are dispatched with type checks, which are cheap; a failed
+/// `extract` builds a Python exception, so the extract chain is only the
+/// fallback for other types (numpy scalars and the like).
 pub fn pyobject_to_json(obj: &PyAny) -> PyResult<Value> {
     if obj.is_none() {
         Ok(Value::Null)
-    } else if let Ok(b) = obj.extract::<bool>() {
-        Ok(Value::Bool(b))
-    } else if let Ok(i) = obj.extract::<i64>() {
-        Ok(Value::Number(i.into()))
-    } else if let Ok(f) = obj.extract::<f64>() {
-        Ok(Value::Number(
-            serde_json::Number::from_f64(f).unwrap_or(0.into()),
-        ))
-    } else if let Ok(s) = obj.extract::<String>() {
-        Ok(Value::String(s))
-    } else if let Ok(list) = obj.downcast::<PyList>() {
-        let arr: Result<Vec<_>, _> = list.iter().map(pyobject_to_json).collect();
-        Ok(Value::Array(arr?))
+    } else if let Ok(b) = obj.downcast::<PyBool>() {
+        Ok(Value::Bool(b.is_true()))
+    } else if let Ok(s) = obj.downcast::<PyString>() {
+        Ok(Value::String(s.to_str()?.to_owned()))
     } else if let Ok(dict) = obj.downcast::<PyDict>() {
-        let mut map = serde_json::Map::new();
+        let mut map = serde_json::Map::with_capacity(dict.len());
         for (k, v) in dict.iter() {
             let key: String = k.extract()?;
             let value = pyobject_to_json(v)?;
             map.insert(key, value);
         }
         Ok(Value::Object(map))
+    } else if let Ok(list) = obj.downcast::<PyList>() {
+        let arr: Result<Vec<_>, _> = list.iter().map(pyobject_to_json).collect();
+        Ok(Value::Array(arr?))
+    } else if obj.is_instance_of::<PyFloat>() {
+        Ok(float_to_json(obj.extract::<f64>()?))
+    } else if let Ok(i) = obj.extract::<i64>() {
+        Ok(Value::Number(i.into()))
+    } else if let Ok(f) = obj.extract::<f64>() {
+        Ok(float_to_json(f))
     } else {
         Err(PyTypeError::new_err(format!(
             "Unsupported type: cannot convert {} to JSON",
@@ -67,6 +75,10 @@ pub fn pyobject_to_json(obj: &PyAny) -> PyResult<Value> {
     }
 }
 
+fn float_to_json(f: f64) -> Value {
+    Value::Number(serde_json::Number::from_f64(f).unwrap_or(0.into()))
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -82,4 +94,40 @@ mod tests {
             assert_eq!(json, back);
         });
     }
+
+    #[test]
+    fn test_json_to_pyobject_interns_field_names() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let a = json_to_pyobject(py, &json!({"currency": "USD"}));
+            let b = json_to_pyobject(py, &json!({"currency": "EUR"}));
+            let key_of = |obj: &PyObject| {
+                let dict: &PyDict = obj.as_ref(py).downcast().unwrap();
+                dict.keys().get_item(0).unwrap().as_ptr()
+            };
+            assert_eq!(key_of(&a), key_of(&b));
+        });
+    }
+
+    #[test]
+    fn test_pyobject_to_json_scalars() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let obj = py
+                .eval(
+                    "{'b': True, 'i': 7, 'f': 1.5, 's': 'x', 'n': None, 'l': [1, 2.5], 'big': 2**70}",
+                    None,
+                    None,
+                )
+                .unwrap();
+            let value = pyobject_to_json(obj).unwrap();
+            assert_eq!(value["b"], json!(true));
+            assert_eq!(value["i"], json!(7));
+            assert_eq!(value["f"], json!(1.5));
+            assert_eq!(value["s"], json!("x"));
+            assert_eq!(value["n"], json!(null));
+            assert_eq!(value["l"], json!([1, 2.5]));
+            assert_eq!(value["big"], json!(2f64.powi(70)));
+        });
+    }
 }
@@ -1,21 +1,25 @@
 //! Vector/embedding utilities for Python
 
 use pyo3::prelude::*;
-use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::exceptions::PyTypeError;
 
 /// Convert Python list or numpy array to Vec<f32>
 pub fn extract_f32_vector(obj: &PyAny) -> PyResult<Vec<f32>> {
-    // Try list first
-    if let Ok(list) = obj.extract::<Vec<f32>>() {
-        return Ok(list);
-    }
-    
-    // Try numpy array
+    // Try numpy array first: a contiguous float32 array is copied in one
+    // memcpy, whereas the sequence path below unboxes every element.
+    // Strided views (`arr[::2]`, a column of a 2-D array) are not
+    // contiguous and are copied element by element instead
     if let Ok(array) = obj.downcast::<numpy::PyArray1<f32>>() {
         let readonly = array.readonly();
-        let slice = readonly.as_slice()
-            .map_err(|e| PyValueError::new_err(format!("Cannot read array: {}", e)))?;
-        return Ok(slice.to_vec());
+        return Ok(match readonly.as_slice() {
+            Ok(slice) => slice.to_vec(),
+            Err(_) => readonly.as_array().iter().copied().collect(),
+        });
+    }
+    
+    // Plain list of floats
+    if let Ok(list) = obj.extract::<Vec<f32>>() {
+        return Ok(list);
     }
     
     // Try converting from other numeric types
@@ -37,6 +41,7 @@ pub fn extract_f32_vector(obj: &PyAny) -> PyResult<Vec<f32>> {
 }
 
 /// Get dimensionality of a vector
+#[allow(dead_code)]
 pub fn get_vector_dim(obj: &PyAny) -> PyResult<usize> {
     if let Ok(list) = obj.downcast::<pyo3::types::PyList>() {
         Ok(list.len())
@@ -0,0 +1,173 @@
+"""Tests for AgentMemory."""
+
+import pytest
+from koru_delta import Database
+from koru_delta.agent_memory import AgentMemory, MemoryType
+
+
+def embed(text):
+    """Toy embedder: one axis per topic word."""
+    text = text.lower()
+    return [text.count("python") + 0.1, text.count("rust") + 0.1, 0.1]
+
+
+async def async_embed(text):
+    return embed(text)
+
+
+@pytest.mark.asyncio
+async def test_keyword_recall_scoring():
+    """Test keyword relevance is 0.25 * match + 0.5 * importance, best first."""
+    async with Database() as db:
+        memory = AgentMemory(db, "bot")
+        await memory.episodes.remember("Asked about Python", importance=0.2)
+        await memory.episodes.remember("Prefers dark mode", importance=0.9)
+        await memory.episodes.remember("Wrote PYTHON bindings", importance=0.6)
+
+        results = await memory.recall("python")
+        assert [(r.content, r.relevance) for r in results] == [
+            ("Wrote PYTHON bindings", pytest.approx(0.55)),
+            ("Prefers dark mode", pytest.approx(0.45)),
+            ("Asked about Python", pytest.approx(0.35)),
+        ]
+        assert all(r.memory_type is MemoryType.EPISODIC for r in results)
+
+        results = await memory.recall("python", limit=1)
+        assert [r.content for r in results] == ["Wrote PYTHON bindings"]
+        assert await memory.recall("python", limit=0) == []
+
+
+@pytest.mark.asyncio
+async def test_keyword_recall_filters():
+    """Test type and min_relevance filters, including records missing fields."""
+    async with Database() as db:
+        memory = AgentMemory(db, "bot")
+        await memory.episodes.remember("python event", importance=0.3)
+        await memory.facts.learn("lang", "python is a language")
+        # Written without type or importance: episodic, importance 0.5
+        await db.put("agent_memory:bot", "bare", {"content": "python bare"})
+
+        results = await memory.recall("python", memory_type=MemoryType.EPISODIC)
+        assert {r.content for r in results} == {"python event", "python bare"}
+
+        results = await memory.recall("python", memory_type=MemoryType.SEMANTIC)
+        assert [r.content for r in results] == ["python is a language"]
+
+        # 0.25 + 0.5 * 0.5 = 0.5 for the bare record; 0.4 for the event
+        results = await memory.recall("python", min_relevance=0.45)
+        assert {r.content for r in results} == {"python is a language", "python bare"}
+        bare = next(r for r in results if r.content == "python bare")
+        assert bare.importance == 0.5
+        assert bare.memory_type is MemoryType.EPISODIC
+
+
+@pytest.mark.asyncio
+async def test_stats():
+    """Test memory counts per type."""
+    async with Database() as db:
+        memory = AgentMemory(db, "bot")
+        await memory.episodes.remember("first event")
+        await memory.episodes.remember("second event")
+        await memory.facts.learn("name", "User is Alice")
+
+        assert await memory.stats() == {
+            "total": 3,
+            "episodic": 2,
+            "semantic": 1,
+            "procedural": 0,
+        }
+
+
+@pytest.mark.asyncio
+async def test_recall_sees_external_writes():
+    """Test cached records are refreshed after writes from elsewhere."""
+    async with Database() as db:
+        memory = AgentMemory(db, "bot")
+        await memory.facts.learn("name", "User is Alice", tags=["user"])
+
+        first = await memory.recall("user")
+        assert first[0].content == "User is Alice"
+        first[0].tags.append("mutated")
+
+        record = await db.get("agent_memory:bot", "name")
+        await db.put("agent_memory:bot", "name", {**record, "content": "User is Bob"})
+
+        second = await memory.recall("user")
+        assert second[0].content == "User is Bob"
+        assert second[0].tags == ["user"]
+
+        await db.delete("agent_memory:bot", "name")
+        assert await memory.recall("user") == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("embedder", [embed, async_embed])
+async def test_vector_recall(embedder):
+    """Test similarity recall with a sync or async embedder."""
+    async with Database() as db:
+        memory = AgentMemory(db, "bot", embedder=embedder)
+        await memory.episodes.remember("rust borrow checker")
+        await memory.episodes.remember("python asyncio python")
+        await memory.facts.learn("lang", "rust ownership rules")
+
+        results = await memory.recall("python", limit=1)
+        assert [r.content for r in results] == ["python asyncio python"]
+        assert results[0].relevance > 0.9
+
+        results = await memory.recall("rust", limit=3)
+        assert {r.content for r in results[:2]} == {
+            "rust borrow checker",
+            "rust ownership rules",
+        }
+
+
+@pytest.mark.asyncio
+async def test_vector_recall_rare_type():
+    """Test a type filter still fills `limit` when that type is rare."""
+    async with Database() as db:
+        memory = AgentMemory(db, "bot", embedder=embed)
+        for i in range(30):
+            await memory.episodes.remember(f"python event {i}")
+        await memory.facts.learn("a", "rust fact")
+        await memory.facts.learn("b", "rust and python fact")
+
+        results = await memory.recall("python", limit=2, memory_type=MemoryType.SEMANTIC)
+        assert {r.content for r in results} == {"rust fact", "rust and python fact"}
+        assert all(r.memory_type is MemoryType.SEMANTIC for r in results)
+
+
+@pytest.mark.asyncio
+async def test_vector_recall_shared_database():
+    """Test another agent's closer vectors do not crowd out this agent's."""
+    async with Database() as db:
+        mine = AgentMemory(db, "mine", embedder=embed)
+        other = AgentMemory(db, "other", embedder=embed)
+        for i in range(20):
+            await other.episodes.remember(f"python python event {i}")
+        await mine.episodes.remember("rust and python")
+        await mine.facts.learn("lang", "rust ownership rules")
+
+        results = await mine.recall("python", limit=2)
+        assert {r.content for r in results} == {
+            "rust and python",
+            "rust ownership rules",
+        }
+
+
+@pytest.mark.asyncio
+async def test_vector_recall_int8():
+    """Test an int8 index ranks like the float32 one."""
+    async with Database() as full, Database() as quantized:
+        memories = [
+            AgentMemory(full, "bot", embedder=embed),
+            AgentMemory(quantized, "bot", embedder=embed, index_dtype="int8"),
+        ]
+        for memory in memories:
+            await memory.episodes.remember("rust borrow checker")
+            await memory.episodes.remember("python asyncio python")
+            await memory.episodes.remember("python and rust")
+
+        expected, results = [await m.recall("python", limit=3) for m in memories]
+        assert [r.content for r in results] == [r.content for r in expected]
+        for r, e in zip(results, expected):
+            assert r.relevance == pytest.approx(e.relevance, abs=0.02)
@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import hashlib
 from koru_delta import Database, KeyNotFoundError
 
 
@@ -49,6 +50,64 @@ async def test_list_keys():
         assert "key2" in keys
 
 
+@pytest.mark.asyncio
+async def test_list_keys_many():
+    """Test listing keys of several namespaces at once."""
+    async with Database() as db:
+        await db.put("features", "search", {"enabled": True})
+        await db.put("features", "checkout", {"enabled": False})
+        await db.put("environments", "prod", {"region": "eu"})
+        
+        keys = await db.list_keys_many(["features", "environments", "empty"])
+        assert keys == {
+            "features": ["checkout", "search"],
+            "environments": ["prod"],
+            "empty": [],
+        }
+
+
+@pytest.mark.asyncio
+async def test_aggregate_by():
+    """Test counting values grouped by a field."""
+    async with Database() as db:
+        await db.put("mem", "a", {"type": "episodic"})
+        await db.put("mem", "b", {"type": "semantic"})
+        await db.put("mem", "c", {"type": "episodic"})
+        await db.put("mem", "d", {"content": "untyped"})
+        
+        assert await db.aggregate_by("mem", "type") == {"episodic": 2, "semantic": 1}
+        assert await db.aggregate_by("mem", "type", default="episodic") == {
+            "episodic": 3,
+            "semantic": 1,
+        }
+        assert await db.aggregate_by("empty", "type") == {}
+
+
+@pytest.mark.asyncio
+async def test_filter_contains():
+    """Test substring matching inside the database."""
+    async with Database() as db:
+        await db.put("mem", "a", {"content": "Knows PYTHON", "importance": 0.8, "type": "semantic"})
+        await db.put("mem", "b", {"content": "Likes dark mode", "importance": 0.3, "type": "episodic"})
+        await db.put("mem", "c", {"content": "python 3.12", "type": "episodic"})
+        
+        hits = sorted(await db.filter_contains("mem", "content", "Python", "importance"))
+        assert hits == [("a", True, 0.8), ("b", False, 0.3), ("c", True, None)]
+        
+        hits = await db.filter_contains(
+            "mem", "content", "python", "importance",
+            filters=[{"field": "type", "op": "eq", "value": "episodic"}],
+        )
+        assert sorted(hits) == [("b", False, 0.3), ("c", True, None)]
+        
+        # Records lacking a field are judged by the filter's default
+        hits = await db.filter_contains(
+            "mem", "content", "python", "importance",
+            filters=[{"field": "importance", "op": "gte", "value": 0.5, "default": 0.5}],
+        )
+        assert sorted(hits) == [("a", True, 0.8), ("c", True, None)]
+
+
 @pytest.mark.asyncio
 async def test_delete():
     """Test delete operation."""
@@ -66,6 +125,7 @@ async def test_stats():
         stats = await db.stats()
         assert "key_count" in stats
         assert "namespace_count" in stats
+        assert stats["per_namespace"] == {"test": 1}
 
 
 @pytest.mark.asyncio
@@ -89,3 +149,361 @@ async def test_put_batch():
         
         product = await db.get("products", "p1")
         assert product["name"] == "Widget"
+
+
+@pytest.mark.asyncio
+async def test_put_many():
+    """Test batch put into a single namespace."""
+    async with Database() as db:
+        items = [
+            ("tx-1", {"status": "pending"}),
+            ("tx-1", {"status": "completed"}),
+            ("tx-2", {"status": "pending"}),
+        ]
+        count = await db.put_many("transactions", items)
+        assert count == 3
+        
+        # Repeated keys become successive versions, last write wins
+        tx1 = await db.get("transactions", "tx-1")
+        assert tx1["status"] == "completed"
+        
+        history = await db.history("transactions", "tx-1")
+        assert len(history) == 2
+
+
+@pytest.mark.asyncio
+async def test_patch():
+    """Test merging partial updates into the current value."""
+    async with Database() as db:
+        await db.put("transactions", "tx-1", {
+            "amount": 100,
+            "status": "pending",
+            "device": "phone",
+        })
+        await db.patch("transactions", "tx-1", {"status": "completed", "device": None})
+        
+        tx = await db.get("transactions", "tx-1")
+        assert tx == {"amount": 100, "status": "completed"}
+        
+        history = await db.history("transactions", "tx-1")
+        assert [h["value"]["status"] for h in history] == ["pending", "completed"]
+
+
+@pytest.mark.asyncio
+async def test_remember():
+    """Test storing agent memory records with derived and explicit keys."""
+    async with Database() as db:
+        key = await db.remember("mem", "agent-1", "likes tea", "episodic", 0.8, ["prefs"])
+        assert key == hashlib.sha256(b"agent-1/likes tea").hexdigest()[:16]
+        
+        record = await db.get("mem", key)
+        assert record["type"] == "episodic"
+        assert record["content"] == "likes tea"
+        assert record["tags"] == ["prefs"]
+        
+        key = await db.remember("mem", "agent-1", "Alice", "semantic", 0.9, [], key="user_name")
+        assert key == "user_name"
+        assert (await db.get("mem", "user_name"))["content"] == "Alice"
+
+
+@pytest.mark.asyncio
+async def test_snapshot():
+    """Test reading values as of a snapshot."""
+    async with Database() as db:
+        await db.put("accounts", "alice", {"balance": 100})
+        before = db.snapshot()
+        await db.put("accounts", "alice", {"balance": 0})
+        
+        old = await db.get_at_snapshot(before, "accounts", "alice")
+        assert old == {"balance": 100}
+        assert await db.get("accounts", "alice") == {"balance": 0}
+        
+        with pytest.raises(KeyNotFoundError):
+            await db.get_at_snapshot(before, "accounts", "bob")
+        
+        pinned = db.snapshot_at(before.timestamp)
+        assert pinned.timestamp == before.timestamp
+        assert await db.get_at_snapshot(pinned, "accounts", "alice") == {"balance": 100}
+        
+        with pytest.raises(ValueError):
+            db.snapshot_at("not-a-time")
+
+
+@pytest.mark.asyncio
+async def test_get_many_and_history_many():
+    """Test bulk reads across several keys."""
+    async with Database() as db:
+        await db.put("users", "alice", {"name": "Alice"})
+        await db.put("users", "alice", {"name": "Alice Smith"})
+        await db.put("users", "bob", {"name": "Bob"})
+        
+        values = await db.get_many("users", ["alice", "bob", "nobody"])
+        assert values == {
+            "alice": {"name": "Alice Smith"},
+            "bob": {"name": "Bob"},
+        }
+        
+        fetched = await db.get_many_versioned("users", ["alice", "bob", "nobody"])
+        assert set(fetched) == {"alice", "bob"}
+        alice_version, alice = fetched["alice"]
+        assert alice == {"name": "Alice Smith"}
+        
+        # A known, current version comes back without its value
+        fetched = await db.get_many_versioned("users", ["alice"], known={"alice": alice_version})
+        assert fetched == {"alice": (alice_version, None)}
+        await db.put("users", "alice", {"name": "Alice Jones"})
+        fetched = await db.get_many_versioned("users", ["alice"], known={"alice": alice_version})
+        assert fetched["alice"][1] == {"name": "Alice Jones"}
+        
+        histories = await db.history_many("users", ["alice", "bob", "nobody"])
+        assert set(histories) == {"alice", "bob"}
+        assert len(histories["alice"]) == 2
+        assert len(histories["bob"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_history_iter():
+    """Test streaming history with async for."""
+    async with Database() as db:
+        for status in ("pending", "authorized", "completed"):
+            await db.put("transactions", "tx-1", {"status": status})
+        
+        statuses = [
+            entry["value"]["status"]
+            async for entry in db.history_iter("transactions", "tx-1")
+        ]
+        assert statuses == ["completed", "authorized", "pending"]
+        
+        statuses = [
+            entry["value"]["status"]
+            async for entry in db.history_iter("transactions", "tx-1", oldest_first=True)
+        ]
+        assert statuses == ["pending", "authorized", "completed"]
+        
+        # collect() matches history() in either mode
+        history = await db.history("transactions", "tx-1")
+        assert await db.history_iter("transactions", "tx-1").collect() == history
+        assert await db.history_iter("transactions", "tx-1", oldest_first=True).collect() == history
+        
+        it = db.history_iter("transactions", "tx-1")
+        first = await it.__anext__()
+        assert first["value"]["status"] == "completed"
+        rest = await it.collect()
+        assert [e["value"]["status"] for e in rest] == ["pending", "authorized"]
+        assert await it.collect() == []
+        with pytest.raises(StopAsyncIteration):
+            await it.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_history_tail():
+    """Test fetching only the most recent history entries."""
+    async with Database() as db:
+        for i in range(5):
+            await db.put("config", "timeout", {"value_ms": i})
+        
+        tail = await db.history_tail("config", "timeout", 2)
+        assert [e["value"]["value_ms"] for e in tail] == [3, 4]
+        
+        everything = await db.history_tail("config", "timeout", 10)
+        assert len(everything) == 5
+
+
+@pytest.mark.asyncio
+async def test_first_version():
+    """Test reading the original value of a key."""
+    async with Database() as db:
+        for ms in (5000, 1000, 5000):
+            await db.put("config", "timeout", {"value_ms": ms})
+        
+        assert await db.first_version("config", "timeout") == {"value_ms": 5000}
+        
+        await db.put("config", "retries", {"value": 3})
+        await db.put("config", "retries", {"value": 5})
+        assert await db.first_version("config", "retries") == {"value": 3}
+        
+        with pytest.raises(KeyNotFoundError):
+            await db.first_version("config", "missing")
+
+
+@pytest.mark.asyncio
+async def test_history_between():
+    """Test fetching history within a time window."""
+    async with Database() as db:
+        await db.put("config", "timeout", {"value_ms": 1})
+        history = await db.history("config", "timeout")
+        start = history[0]["timestamp"]
+        
+        await db.put("config", "timeout", {"value_ms": 2})
+        
+        window = await db.history_between("config", "timeout", start, "9999-01-01T00:00:00Z")
+        assert [e["value"]["value_ms"] for e in window] == [1, 2]
+        
+        empty = await db.history_between("config", "timeout", "2000-01-01T00:00:00Z", start)
+        assert empty == []
+        
+        with pytest.raises(ValueError):
+            await db.history_between("config", "timeout", "not-a-time", start)
+
+
+@pytest.mark.asyncio
+async def test_namespace_handle():
+    """Test namespace-bound handles."""
+    async with Database() as db:
+        conv = db.namespace("conversations")
+        assert conv.name == "conversations"
+        
+        await conv.put("s1", {"topic": "rust"})
+        await conv.put("s1", {"topic": "latency"})
+        assert await conv.get("s1") == {"topic": "latency"}
+        assert await db.get("conversations", "s1") == {"topic": "latency"}
+        assert len(await conv.history("s1")) == 2
+        
+        await conv.embed("e1", embedding=[1.0, 0.0, 0.0], model="test")
+        await db.embed("other", "e2", embedding=[1.0, 0.0, 0.0], model="test")
+        results = await conv.similar(query=[1.0, 0.0, 0.0], top_k=5)
+        assert [r["key"] for r in results] == ["e1"]
+
+
+@pytest.mark.asyncio
+async def test_pool_shares_database():
+    """Test that pooled tasks see the same database."""
+    from koru_delta import create_pool
+    
+    pool = create_pool(max_size=2)
+    
+    async def writer(i):
+        async with pool.acquire() as db:
+            await db.put("pool", f"key{i}", {"i": i})
+    
+    await asyncio.gather(*(writer(i) for i in range(5)))
+    
+    async with pool.acquire() as db:
+        keys = await db.list_keys("pool")
+        assert len(keys) == 5
+    
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pools_share_path_handle(tmp_path):
+    """Test that pools on the same path reuse one open database."""
+    from koru_delta import create_pool
+    
+    first = create_pool(tmp_path / "db")
+    second = create_pool(tmp_path / "db")
+    
+    async with first.acquire() as a, second.acquire() as b:
+        assert a is b
+        await a.put("shared", "k", {"v": 1})
+    
+    # Still open for the second pool after the first closes
+    await first.close()
+    async with second.acquire() as db:
+        assert await db.get("shared", "k") == {"v": 1}
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_connection_factory():
+    """Test that create_pool opens through the factory and closes the handle."""
+    from koru_delta import create_pool
+    
+    opened = []
+    
+    async def factory():
+        db = Database()
+        opened.append(db)
+        return db
+    
+    async with create_pool(connection_factory=factory) as pool:
+        async with pool.acquire() as db:
+            assert db is opened[0]
+            await db.put("pool", "k", {"v": 1})
+    
+    assert len(opened) == 1
+
+
+@pytest.mark.asyncio
+async def test_put_json():
+    """Test storing pre-encoded JSON."""
+    async with Database() as db:
+        await db.put_json("docs", "bytes", b'{"title": "A", "tags": ["x"]}')
+        await db.put_json("docs", "text", '{"title": "B"}')
+        
+        assert await db.get("docs", "bytes") == {"title": "A", "tags": ["x"]}
+        assert (await db.get("docs", "text"))["title"] == "B"
+        
+        with pytest.raises(ValueError):
+            await db.put_json("docs", "bad", b"{not json")
+
+
+@pytest.mark.asyncio
+async def test_embed_similar_numpy():
+    """Test that float32 arrays are accepted for vectors."""
+    np = pytest.importorskip("numpy")
+    async with Database() as db:
+        vec = np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32)
+        await db.embed("docs", "d1", embedding=vec, model="test")
+        await db.embed("docs", "d2", embedding=[0.4, 0.3, 0.2, 0.1], model="test")
+        
+        results = await db.similar("docs", query=vec, top_k=1)
+        assert results[0]["key"] == "d1"
+        
+        # Non-contiguous views are copied rather than rejected
+        strided = np.array([0.4, 9.0, 0.3, 9.0, 0.2, 9.0, 0.1, 9.0], dtype=np.float32)[::2]
+        column = np.array([[0.1, 9.0], [0.2, 9.0], [0.3, 9.0], [0.4, 9.0]], dtype=np.float32)[:, 0]
+        assert not strided.flags["C_CONTIGUOUS"] and not column.flags["C_CONTIGUOUS"]
+        await db.embed("docs", "d3", embedding=strided, model="test")
+        assert (await db.similar("docs", query=column, top_k=1))[0]["key"] == "d1"
+        assert (await db.similar("docs", query=strided, top_k=1))[0]["key"] in ("d2", "d3")
+
+
+@pytest.mark.asyncio
+async def test_embed_int8():
+    """Test int8-quantized embeddings are searchable."""
+    async with Database() as db:
+        await db.embed("docs", "a", embedding=[0.9, 0.1, 0.3], model="test", dtype="int8")
+        await db.embed("docs", "b", embedding=[0.1, 0.9, 0.8], model="test", dtype="int8")
+        
+        results = await db.similar("docs", query=[0.88, 0.12, 0.32], top_k=1)
+        assert results[0]["key"] == "a"
+        assert results[0]["score"] > 0.95
+        
+        with pytest.raises(ValueError):
+            await db.embed("docs", "c", embedding=[1.0], model="test", dtype="float16")
+
+
+@pytest.mark.asyncio
+async def test_embed_many():
+    """Test storing several embeddings in one batch."""
+    async with Database() as db:
+        written = await db.embed_many("docs", [
+            {"key": "a", "embedding": [0.9, 0.1, 0.3], "model": "test",
+             "metadata": {"text": "first"}},
+            {"key": "b", "embedding": [0.1, 0.9, 0.8], "model": "test"},
+        ])
+        assert written == 2
+        
+        results = await db.similar("docs", query=[0.88, 0.12, 0.32], top_k=1)
+        assert results[0]["key"] == "a"
+        
+        with pytest.raises(ValueError):
+            await db.embed_many("docs", [{"key": "c", "model": "test"}])
+
+
+@pytest.mark.asyncio
+async def test_embed_many_int8():
+    """Test int8-quantized batch embeddings are searchable."""
+    async with Database() as db:
+        await db.embed_many("docs", [
+            {"key": "a", "embedding": [0.9, 0.1, 0.3], "model": "test"},
+            {"key": "b", "embedding": [0.1, 0.9, 0.8], "model": "test"},
+        ], dtype="int8")
+        
+        results = await db.similar("docs", query=[0.88, 0.12, 0.32], top_k=1)
+        assert results[0]["key"] == "a"
+        assert results[0]["score"] > 0.95
+        
+        with pytest.raises(ValueError):
+            await db.embed_many("docs", [], dtype="float16")
@@ -342,6 +342,7 @@ async fn main() -> anyhow::Result<()> {
         top_k: 3,
         threshold: 0.0,
         model_filter: None,
+        namespace_filter: None,
     };
     let results = db.embed_search(Some("vectors"), &query_vec, opts).await?;
 
@@ -0,0 +1,68 @@
+#!/bin/bash
+# KoruDelta - Build the Python wheel with PGO + LTO
+# Instruments the extension, runs the examples to collect a profile,
+# then rebuilds with the merged profile (profile: release-pgo)
+# Use: ./scripts/build-python-pgo.sh
+
+set -e
+
+# Colors
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+echo ""
+echo -e "${BLUE}╔══════════════════════════════════════════════════════════════╗${NC}"
+echo -e "${BLUE}║   KoruDelta - Python PGO Build                               ║${NC}"
+echo -e "${BLUE}╚══════════════════════════════════════════════════════════════╝${NC}"
+echo ""
+
+# Navigate to the Python bindings
+cd "$(dirname "$0")/../bindings/python"
+
+# llvm-profdata ships with the llvm-tools rustup component
+SYSROOT=$(rustc --print sysroot)
+LLVM_PROFDATA=$(find "$SYSROOT" -name llvm-profdata -type f | head -1)
+if [ -z "$LLVM_PROFDATA" ]; then
+    echo -e "${RED}Error: llvm-profdata not found${NC}"
+    echo ""
+    echo "Install it with:"
+    echo "  rustup component add llvm-tools-preview"
+    echo ""
+    exit 1
+fi
+
+PGO_DIR="$(pwd)/target/pgo-data"
+rm -rf "$PGO_DIR"
+mkdir -p "$PGO_DIR"
+
+# Create virtual environment if needed
+if [ ! -d "venv" ]; then
+    echo "Creating virtual environment..."
+    python3 -m venv venv
+fi
+
+source venv/bin/activate
+pip install maturin -q
+
+# Step 1: instrumented build
+echo -e "${BLUE}Building instrumented extension...${NC}"
+RUSTFLAGS="-Cprofile-generate=$PGO_DIR" maturin develop --profile release-pgo
+
+# Step 2: collect a profile from representative workloads
+echo -e "${BLUE}Collecting profile from examples...${NC}"
+for example in examples/01_quickstart.py examples/02_ai_agent.py examples/03_audit_trail.py; do
+    KORU_DEMO_VERBOSE=0 python "$example"
+done
+
+"$LLVM_PROFDATA" merge -o "$PGO_DIR/merged.profdata" "$PGO_DIR"
+
+# Step 3: optimized build using the profile
+echo -e "${BLUE}Building optimized wheel...${NC}"
+RUSTFLAGS="-Cprofile-use=$PGO_DIR/merged.profdata -Cllvm-args=-pgo-warn-missing-function" \
+    maturin build --profile release-pgo
+
+echo ""
+echo -e "${GREEN}✓ PGO wheel written to target/wheels/${NC}"
+echo ""
@@ -64,7 +64,7 @@ use crate::lifecycle::{LifecycleAgent, LifecycleConfig};
 use crate::memory::{
     ArchiveAgent, ChronicleAgent, EssenceAgent, TemperatureAgent, TemperatureConfig,
 };
-use crate::query::{HistoryQuery, Query, QueryExecutor, QueryResult};
+use crate::query::{Filter, HistoryQuery, Query, QueryExecutor, QueryResult};
 use crate::roots::RootType;
 use crate::runtime::sync::RwLock;
 use crate::runtime::{DefaultRuntime, Runtime, WatchReceiver, WatchSender};
@@ -74,7 +74,9 @@ use crate::subscriptions::{ChangeEvent, Subscription, SubscriptionAgent, Subscri
 use crate::types::{
     ConnectedDistinction, FullKey, HistoryEntry, RandomCombination, UnconnectedPair, VersionedValue,
 };
-use crate::vector::{Vector, VectorIndex, VectorSearchOptions, VectorSearchResult};
+use crate::vector::{
+    QuantizedVector, Vector, VectorIndex, VectorSearchOptions, VectorSearchResult,
+};
 use crate::views::{PerspectiveAgent, ViewDefinition, ViewInfo};
 
 #[cfg(not(target_arch = "wasm32"))]
@@ -804,12 +806,22 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
         let version_id = versioned.version_id().to_string();
         debug!(version = %version_id, "Value stored");
 
+        self.publish_write(&namespace, &key, &versioned).await;
+
+        info!(version = %version_id, "Put operation completed");
+        Ok(versioned)
+    }
+
+    /// Propagate a version already written to storage: persist it to the
+    /// WAL, broadcast it to the cluster, promote it to hot memory and
+    /// refresh views.
+    async fn publish_write(&self, namespace: &str, key: &str, versioned: &VersionedValue) {
         // Persist to WAL if db_path is set
         #[cfg(not(target_arch = "wasm32"))]
         if let Some(ref db_path) = self.db_path {
             use crate::persistence;
             trace!("Persisting to WAL");
-            if let Err(e) = persistence::append_write(db_path, &namespace, &key, &versioned).await {
+            if let Err(e) = persistence::append_write(db_path, namespace, key, versioned).await {
                 error!(error = %e, "Failed to persist write to WAL");
             } else {
                 trace!("Write persisted to WAL");
@@ -819,7 +831,7 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
         // Broadcast to cluster if configured
         #[cfg(not(target_arch = "wasm32"))]
         if let Some(ref cluster) = self.cluster {
-            let full_key = FullKey::new(&namespace, &key);
+            let full_key = FullKey::new(namespace, key);
             let value_clone = versioned.clone();
             let cluster_clone = Arc::clone(cluster);
             tokio::spawn(async move {
@@ -830,7 +842,7 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
 
         // Promote to hot memory
         {
-            let full_key = FullKey::new(&namespace, &key);
+            let full_key = FullKey::new(namespace, key);
             let hot = self.hot.write().await;
             hot.put(full_key, versioned.clone());
             trace!("Value promoted to hot memory");
@@ -844,9 +856,6 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
                 let _ = views.refresh_stale(chrono::Duration::seconds(0));
             });
         }
-
-        info!(version = %version_id, "Put operation completed");
-        Ok(versioned)
     }
 
     /// Store a value with causal parent links in the graph.
@@ -953,9 +962,16 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
             converted_items.push((namespace, key, json_value));
         }
 
+        // Only the keys are needed after the storage write, so keep those
+        // and hand the values over instead of cloning the whole batch.
+        let keys: Vec<(String, String)> = converted_items
+            .iter()
+            .map(|(ns, key, _)| (ns.clone(), key.clone()))
+            .collect();
+
         // Store in storage (source of truth)
         trace!("Storing batch in CausalStorage");
-        let versioned_values = self.storage.put_batch(converted_items.clone())?;
+        let versioned_values = self.storage.put_batch(converted_items)?;
 
         // Persist to WAL if db_path is set (single fsync for entire batch)
         #[cfg(not(target_arch = "wasm32"))]
@@ -963,10 +979,10 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
             use crate::persistence;
             trace!("Persisting batch to WAL");
 
-            let write_refs: Vec<(&str, &str, &VersionedValue)> = converted_items
+            let write_refs: Vec<(&str, &str, &VersionedValue)> = keys
                 .iter()
                 .zip(versioned_values.iter())
-                .map(|((ns, key, _), versioned)| (ns.as_str(), key.as_str(), versioned))
+                .map(|((ns, key), versioned)| (ns.as_str(), key.as_str(), versioned))
                 .collect();
 
             if let Err(e) = persistence::append_write_batch(db_path, write_refs).await {
@@ -979,9 +995,7 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
         // Broadcast to cluster if configured (fire and forget)
         #[cfg(not(target_arch = "wasm32"))]
         if let Some(ref cluster) = self.cluster {
-            for ((namespace, key, _), versioned) in
-                converted_items.iter().zip(versioned_values.iter())
-            {
+            for ((namespace, key), versioned) in keys.iter().zip(versioned_values.iter()) {
                 let full_key = FullKey::new(namespace, key);
                 let value_clone = versioned.clone();
                 let cluster_clone = Arc::clone(cluster);
@@ -995,9 +1009,7 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
         // Promote all to hot memory
         {
             let hot = self.hot.write().await;
-            for ((namespace, key, _), versioned) in
-                converted_items.iter().zip(versioned_values.iter())
-            {
+            for ((namespace, key), versioned) in keys.iter().zip(versioned_values.iter()) {
                 let full_key = FullKey::new(namespace, key);
                 hot.put(full_key, versioned.clone());
             }
@@ -1052,13 +1064,48 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
             .map(|(key, value)| (namespace.clone(), key, value))
             .collect();
 
-        // Convert to the format expected by storage
-        let mut converted = Vec::with_capacity(batch.len());
-        for (ns, key, value) in batch {
-            converted.push((ns, key, value));
-        }
+        // Route through put_batch so the batch shares one WAL append and
+        // lands in hot memory, exactly like the cross-namespace variant.
+        self.put_batch(batch).await
+    }
 
-        self.storage.put_batch(converted)
+    /// Update a key by merging `delta` into its current value.
+    ///
+    /// Follows JSON Merge Patch (RFC 7386): members of `delta` replace
+    /// those in the current value, nested objects merge recursively and
+    /// `null` removes a member. A missing key starts from an empty object.
+    /// Callers only send the fields that changed; the stored version is
+    /// the full merged value, so `get`, `history` and `get_at` see
+    /// complete values as usual.
+    ///
+    /// # Example
+    ///
+    /// ```ignore
+    /// db.put("tx", "1", json!({"amount": 10, "status": "pending"})).await?;
+    /// db.patch("tx", "1", json!({"status": "completed"})).await?;
+    /// ```
+    pub async fn patch(
+        &self,
+        namespace: impl Into<String>,
+        key: impl Into<String>,
+        delta: serde_json::Value,
+    ) -> DeltaResult<VersionedValue> {
+        let namespace = namespace.into();
+        let key = key.into();
+
+        // The merge runs while storage holds the key's entry, so two
+        // concurrent patches both land instead of one overwriting the other
+        let versioned = self.storage.update(&namespace, &key, |current| {
+            let mut value = current
+                .cloned()
+                .unwrap_or_else(|| serde_json::Value::Object(serde_json::Map::new()));
+            merge_patch(&mut value, delta);
+            value
+        })?;
+        debug!(version = %versioned.version_id(), "Value patched");
+
+        self.publish_write(&namespace, &key, &versioned).await;
+        Ok(versioned)
     }
 
     /// Get the current value for a key.
@@ -1206,6 +1253,32 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
         self.storage.history(namespace, key)
     }
 
+    /// Get the earliest version of a key.
+    pub async fn first_version(&self, namespace: &str, key: &str) -> DeltaResult<VersionedValue> {
+        self.storage.first_version(namespace, key)
+    }
+
+    /// Get the `n` most recent history entries for a key (oldest first).
+    pub async fn history_tail(
+        &self,
+        namespace: &str,
+        key: &str,
+        n: usize,
+    ) -> DeltaResult<Vec<HistoryEntry>> {
+        self.storage.history_tail(namespace, key, n)
+    }
+
+    /// Get the history entries for a key written in `[start, end)`.
+    pub async fn history_between(
+        &self,
+        namespace: &str,
+        key: &str,
+        start: DateTime<Utc>,
+        end: DateTime<Utc>,
+    ) -> DeltaResult<Vec<HistoryEntry>> {
+        self.storage.history_between(namespace, key, start, end)
+    }
+
     /// Query history with filters.
     pub async fn query_history(
         &self,
@@ -1291,6 +1364,90 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
         Ok(versioned)
     }
 
+    /// Store several vector embeddings in one namespace as a single batch.
+    ///
+    /// The values go through `put_batch_in_ns`, so the whole batch shares
+    /// one WAL append instead of one per vector; each vector is then added
+    /// to the search index exactly as `embed` would.
+    pub async fn embed_batch(
+        &self,
+        namespace: impl Into<String>,
+        items: Vec<(String, Vector, Option<serde_json::Value>)>,
+    ) -> DeltaResult<Vec<VersionedValue>> {
+        self.embed_batch_with(namespace.into(), items, false).await
+    }
+
+    /// Store several vector embeddings as one batch, indexing them as int8.
+    ///
+    /// The batched counterpart of `embed_quantized`: stored values keep
+    /// full `f32` precision, only the search index holds quantized copies.
+    pub async fn embed_batch_quantized(
+        &self,
+        namespace: impl Into<String>,
+        items: Vec<(String, Vector, Option<serde_json::Value>)>,
+    ) -> DeltaResult<Vec<VersionedValue>> {
+        self.embed_batch_with(namespace.into(), items, true).await
+    }
+
+    async fn embed_batch_with(
+        &self,
+        namespace: String,
+        items: Vec<(String, Vector, Option<serde_json::Value>)>,
+        quantize: bool,
+    ) -> DeltaResult<Vec<VersionedValue>> {
+        let mut values = Vec::with_capacity(items.len());
+        let mut vectors = Vec::with_capacity(items.len());
+        for (key, vector, metadata) in items {
+            values.push((
+                key.clone(),
+                crate::vector::vector_to_json(&vector, metadata),
+            ));
+            vectors.push((key, vector));
+        }
+
+        let versioned = self.put_batch_in_ns(&namespace, values).await?;
+
+        for (key, vector) in vectors {
+            let full_key = FullKey::new(&namespace, key);
+            if quantize {
+                self.vector_index
+                    .add_quantized(full_key, QuantizedVector::from_vector(&vector));
+            } else {
+                self.vector_index.add(full_key, vector);
+            }
+        }
+
+        debug!(namespace = %namespace, count = versioned.len(), "Vector embeddings stored");
+        Ok(versioned)
+    }
+
+    /// Store a vector embedding, indexing it as int8.
+    ///
+    /// The stored value keeps full `f32` precision (so `get_embed` and time
+    /// travel are unaffected); only the in-memory search index holds the
+    /// quantized form, which is 4x smaller and scanned with integer dot
+    /// products. Scores differ from `embed` by quantization error (~1e-2).
+    pub async fn embed_quantized(
+        &self,
+        namespace: impl Into<String>,
+        key: impl Into<String>,
+        vector: Vector,
+        metadata: Option<serde_json::Value>,
+    ) -> DeltaResult<VersionedValue> {
+        let namespace = namespace.into();
+        let key = key.into();
+
+        let value = crate::vector::vector_to_json(&vector, metadata);
+        let versioned = self.put(&namespace, &key, value).await?;
+
+        let full_key = FullKey::new(&namespace, &key);
+        self.vector_index
+            .add_quantized(full_key, QuantizedVector::from_vector(&vector));
+
+        debug!(namespace = %namespace, key = %key, "Quantized vector embedding stored");
+        Ok(versioned)
+    }
+
     /// Search for similar vectors using cosine similarity.
     ///
     /// Performs approximate nearest neighbor search on stored embeddings.
@@ -1319,18 +1476,14 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
         &self,
         namespace: Option<&str>,
         query: &Vector,
-        options: VectorSearchOptions,
+        mut options: VectorSearchOptions,
     ) -> DeltaResult<Vec<VectorSearchResult>> {
-        // Search the vector index
-        let mut results = self.vector_index.search(query, &options);
-
-        // Filter by namespace if specified
+        // Filter by namespace inside the index, before top_k is taken, so
+        // other namespaces cannot push this one's matches out
         if let Some(ns) = namespace {
-            results.retain(|r| r.namespace == ns);
+            options.namespace_filter = Some(ns.to_string());
         }
-
-        // Re-apply top_k after namespace filtering
-        results.truncate(options.top_k);
+        let results = self.vector_index.search(query, &options);
 
         debug!(results = results.len(), "Vector search completed");
         Ok(results)
@@ -2621,6 +2774,43 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
         self.storage.list_keys(namespace)
     }
 
+    /// List the keys of several namespaces with a single scan.
+    pub async fn list_keys_many(
+        &self,
+        namespaces: &[&str],
+    ) -> std::collections::HashMap<String, Vec<String>> {
+        self.storage.list_keys_many(namespaces)
+    }
+
+    /// Count the current values of a namespace grouped by a top-level field.
+    ///
+    /// See `CausalStorage::count_by_field`; the values are never copied
+    /// out of storage, so this is much cheaper than fetching them to count.
+    pub async fn count_by_field(
+        &self,
+        namespace: &str,
+        field: &str,
+        default: Option<&str>,
+    ) -> std::collections::HashMap<String, usize> {
+        self.storage.count_by_field(namespace, field, default)
+    }
+
+    /// Test a string field of a namespace's values for a lowercase substring.
+    ///
+    /// See `CausalStorage::filter_contains`; returns `(key, matched, number)`
+    /// per value passing `filters`, without copying the values out.
+    pub async fn filter_contains(
+        &self,
+        namespace: &str,
+        field: &str,
+        needle: &str,
+        number_field: &str,
+        filters: &[Filter],
+    ) -> Vec<(String, bool, Option<f64>)> {
+        self.storage
+            .filter_contains(namespace, field, needle, number_field, filters)
+    }
+
     /// List all namespaces.
     pub async fn list_namespaces(&self) -> Vec<String> {
         self.storage.list_namespaces()
@@ -2628,10 +2818,12 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
 
     /// Get database statistics.
     pub async fn stats(&self) -> DatabaseStats {
+        let per_namespace = self.storage.namespace_key_counts();
         DatabaseStats {
             key_count: self.storage.key_count(),
             total_versions: self.storage.total_version_count(),
-            namespace_count: self.storage.list_namespaces().len(),
+            namespace_count: per_namespace.len(),
+            per_namespace,
         }
     }
 
@@ -2828,6 +3020,15 @@ impl<R: Runtime> KoruDeltaGeneric<R> {
 
     /// Shutdown the database.
     pub async fn shutdown(self) -> DeltaResult<()> {
+        self.close().await
+    }
+
+    /// Shut the database down through a shared reference.
+    ///
+    /// Does the work of `shutdown` for callers that hold the database
+    /// behind an `Arc` (such as language bindings) and cannot give up
+    /// ownership. The handle must not be used for writes afterwards.
+    pub async fn close(&self) -> DeltaResult<()> {
         info!("Shutting down KoruDelta");
 
         let _ = self.shutdown_tx.send(true);
@@ -3006,6 +3207,27 @@ pub struct DatabaseStats {
     pub total_versions: usize,
     /// Number of namespaces
     pub namespace_count: usize,
+    /// Number of keys in each namespace
+    pub per_namespace: std::collections::HashMap<String, usize>,
+}
+
+/// Apply a JSON Merge Patch (RFC 7386) to `target` in place.
+fn merge_patch(target: &mut serde_json::Value, patch: serde_json::Value) {
+    let serde_json::Value::Object(patch) = patch else {
+        *target = patch;
+        return;
+    };
+    if !target.is_object() {
+        *target = serde_json::Value::Object(serde_json::Map::new());
+    }
+    let target = target.as_object_mut().expect("target is an object");
+    for (name, value) in patch {
+        if value.is_null() {
+            target.remove(&name);
+        } else {
+            merge_patch(target.entry(name).or_insert(serde_json::Value::Null), value);
+        }
+    }
 }
 
 #[cfg(test)]
@@ -3036,6 +3258,60 @@ mod tests {
         assert_eq!(*retrieved.value(), value);
     }
 
+    #[tokio::test(flavor = "multi_thread", worker_threads = 4)]
+    async fn test_concurrent_patches_all_land() {
+        let db = Arc::new(create_test_db().await);
+
+        let tasks: Vec<_> = (0..20)
+            .map(|i| {
+                let db = Arc::clone(&db);
+                tokio::spawn(async move {
+                    db.patch("tx", "1", json!({ format!("field{}", i): i }))
+                        .await
+                        .unwrap();
+                })
+            })
+            .collect();
+        for task in tasks {
+            task.await.unwrap();
+        }
+
+        let current = db.get("tx", "1").await.unwrap();
+        assert_eq!(current.value().as_object().unwrap().len(), 20);
+    }
+
+    #[tokio::test]
+    async fn test_patch_merges_into_current_value() {
+        let db = create_test_db().await;
+
+        db.put(
+            "tx",
+            "1",
+            json!({"amount": 10, "status": "pending", "meta": {"ip": "a", "risk": 1}}),
+        )
+        .await
+        .unwrap();
+        db.patch(
+            "tx",
+            "1",
+            json!({"status": "completed", "meta": {"risk": null}}),
+        )
+        .await
+        .unwrap();
+
+        let current = db.get("tx", "1").await.unwrap();
+        assert_eq!(
+            *current.value(),
+            json!({"amount": 10, "status": "completed", "meta": {"ip": "a"}})
+        );
+        assert_eq!(db.history("tx", "1").await.unwrap().len(), 2);
+
+        // Patching a missing key starts from an empty object
+        db.patch("tx", "2", json!({"status": "new"})).await.unwrap();
+        let created = db.get("tx", "2").await.unwrap();
+        assert_eq!(*created.value(), json!({"status": "new"}));
+    }
+
     #[tokio::test]
     async fn test_contains_key() {
         let db = create_test_db().await;
@@ -3099,6 +3375,71 @@ mod tests {
         assert_ne!(results[0].version_id(), results[1].version_id());
     }
 
+    #[tokio::test]
+    async fn test_embed_batch() {
+        let db = create_test_db().await;
+
+        let items = vec![
+            (
+                "a".to_string(),
+                Vector::new(vec![1.0, 0.0], "test-model"),
+                Some(json!({"text": "first"})),
+            ),
+            (
+                "b".to_string(),
+                Vector::new(vec![0.0, 1.0], "test-model"),
+                None,
+            ),
+        ];
+        let results = db.embed_batch("docs", items).await.unwrap();
+        assert_eq!(results.len(), 2);
+
+        let hits = db
+            .embed_search(
+                Some("docs"),
+                &Vector::new(vec![1.0, 0.0], "test-model"),
+                VectorSearchOptions::new().top_k(1),
+            )
+            .await
+            .unwrap();
+        assert_eq!(hits[0].key, "a");
+        assert!(db.get_embed("docs", "b").await.unwrap().is_some());
+    }
+
+    #[tokio::test]
+    async fn test_embed_batch_quantized() {
+        let db = create_test_db().await;
+
+        let items = vec![
+            (
+                "a".to_string(),
+                Vector::new(vec![1.0, 0.0], "test-model"),
+                None,
+            ),
+            (
+                "b".to_string(),
+                Vector::new(vec![0.0, 1.0], "test-model"),
+                None,
+            ),
+        ];
+        db.embed_batch_quantized("docs", items).await.unwrap();
+
+        let hits = db
+            .embed_search(
+                Some("docs"),
+                &Vector::new(vec![0.0, 1.0], "test-model"),
+                VectorSearchOptions::new().top_k(1),
+            )
+            .await
+            .unwrap();
+        assert_eq!(hits[0].key, "b");
+        assert!((hits[0].score - 1.0).abs() < 0.05);
+
+        // The stored value keeps full precision
+        let stored = db.get_embed("docs", "a").await.unwrap().unwrap();
+        assert_eq!(stored.as_slice(), &[1.0, 0.0]);
+    }
+
     #[tokio::test]
     async fn test_history() {
         let db = create_test_db().await;
@@ -3180,6 +3521,7 @@ mod tests {
         assert_eq!(stats2.key_count, 2);
         assert_eq!(stats2.total_versions, 3);
         assert_eq!(stats2.namespace_count, 1);
+        assert_eq!(stats2.per_namespace.get("users"), Some(&2));
     }
 
     // =========================================================================
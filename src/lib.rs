@@ -186,7 +186,7 @@ pub use query::{
 pub use views::{PerspectiveAgent, ViewData, ViewDefinition, ViewInfo};
 
 // Vector exports
-pub use vector::{Vector, VectorIndex, VectorSearchOptions, VectorSearchResult};
+pub use vector::{QuantizedVector, Vector, VectorIndex, VectorSearchOptions, VectorSearchResult};
 
 // Workspace exports (causal storage containers)
 pub use memory::{
@@ -34,6 +34,14 @@
 ///
 /// On startup, we replay the log to rebuild the in-memory state.
 ///
+/// # Durability
+///
+/// The log is always in write-ahead mode; there is no rollback journal to
+/// switch away from. Each append is followed by one `sync_data` (data only,
+/// not file metadata), so a single `put` costs one fsync and a batch from
+/// `append_write_batch` also costs one fsync, however many entries it holds.
+/// Batching writes is therefore the way to amortize commit latency.
+///
 /// # Usage
 ///
 /// ```ignore
@@ -205,8 +213,9 @@ pub async fn append_write(
         checksum,
     };
 
-    // Serialize to JSON line
-    let line = serde_json::to_string(&entry)?;
+    // Serialize to JSON line (newline included, so the append is one write)
+    let mut line = serde_json::to_string(&entry)?;
+    line.push('\n');
 
     // Get current segment path
     let segment_path = wal_dir.join(format!("{:06}.wal", metadata.current_segment));
@@ -238,9 +247,6 @@ pub async fn append_write(
     file.write_all(line.as_bytes())
         .await
         .map_err(|e| DeltaError::StorageError(format!("Failed to write WAL: {}", e)))?;
-    file.write_all(b"\n")
-        .await
-        .map_err(|e| DeltaError::StorageError(format!("Failed to write WAL: {}", e)))?;
 
     // Ensure data is flushed to disk
     file.sync_data()
@@ -296,8 +302,8 @@ pub async fn append_write_batch(
     // Get or load metadata
     let mut metadata = load_metadata(&wal_dir).await.unwrap_or_default();
 
-    // Collect all lines to write
-    let mut lines = Vec::with_capacity(writes.len());
+    // Collect all entries into one newline-delimited buffer
+    let mut buffer = String::new();
 
     for (namespace, key, versioned) in writes {
         metadata.last_seq += 1;
@@ -335,15 +341,15 @@ pub async fn append_write_batch(
             checksum,
         };
 
-        let line = serde_json::to_string(&entry)?;
-        lines.push(line);
+        buffer.push_str(&serde_json::to_string(&entry)?);
+        buffer.push('\n');
     }
 
     // Get current segment path
     let segment_path = wal_dir.join(format!("{:06}.wal", metadata.current_segment));
 
     // Check if we need to rotate (estimate size)
-    let estimated_size = lines.iter().map(|l| l.len() + 1).sum::<usize>();
+    let estimated_size = buffer.len();
     let should_rotate = if segment_path.exists() {
         let meta = fs::metadata(&segment_path).await.map_err(|e| {
             DeltaError::StorageError(format!("Failed to read segment metadata: {e}"))
@@ -367,15 +373,11 @@ pub async fn append_write_batch(
         .await
         .map_err(|e| DeltaError::StorageError(format!("Failed to open WAL: {e}")))?;
 
-    // Write all entries
-    for line in lines {
-        file.write_all(line.as_bytes())
-            .await
-            .map_err(|e| DeltaError::StorageError(format!("Failed to write WAL: {e}")))?;
-        file.write_all(b"\n")
-            .await
-            .map_err(|e| DeltaError::StorageError(format!("Failed to write WAL: {e}")))?;
-    }
+    // Write all entries with a single call: one blocking-pool hop and
+    // (typically) one write syscall for the whole batch
+    file.write_all(buffer.as_bytes())
+        .await
+        .map_err(|e| DeltaError::StorageError(format!("Failed to write WAL: {e}")))?;
 
     // Single fsync for entire batch
     file.sync_data()
@@ -555,8 +557,15 @@ async fn replay_segment(
         }
 
         if entry.op == "put" {
-            // Load value from content store
-            if let Some(value) = load_value(values_dir, &entry.value_hash).await? {
+            // Reuse a value already replayed under the same content hash;
+            // only read the content store the first time a hash is seen
+            let value = match storage.shared_value(&entry.value_hash) {
+                Some(value) => Some(value),
+                None => load_value(values_dir, &entry.value_hash)
+                    .await?
+                    .map(Arc::new),
+            };
+            if let Some(value) = value {
                 // Reconstruct versioned value
                 // For replay: write_id = value_hash + timestamp_nanos to match original
                 let write_id = format!(
@@ -565,7 +574,7 @@ async fn replay_segment(
                     entry.timestamp.timestamp_nanos_opt().unwrap_or(0)
                 );
                 let versioned = VersionedValue::new(
-                    Arc::new(value),
+                    value,
                     entry.timestamp,
                     write_id,                 // unique write_id for replay
                     entry.value_hash.clone(), // distinction_id = content hash
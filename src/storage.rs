@@ -13,6 +13,7 @@
 use crate::causal_graph::LineageAgent;
 use crate::error::{DeltaError, DeltaResult};
 use crate::mapper::DocumentMapper;
+use crate::query::Filter;
 use crate::reference_graph::ReferenceGraph;
 use crate::types::{
     CausalWriteResult, FullKey, HistoryEntry, Tombstone, VectorClock, VersionedValue,
@@ -120,7 +121,6 @@ impl CausalStorage {
         value: JsonValue,
     ) -> DeltaResult<VersionedValue> {
         let full_key = FullKey::new(namespace, key);
-        let timestamp = Utc::now();
 
         // Get previous version if it exists (causal parent)
         let previous_version = self
@@ -128,6 +128,57 @@ impl CausalStorage {
             .get(&full_key)
             .map(|v| v.write_id.clone());
 
+        let versioned = self.new_version(value, previous_version)?;
+
+        // Update current state
+        self.current_state.insert(full_key, versioned.clone());
+
+        Ok(versioned)
+    }
+
+    /// Replace a key's value with one computed from its current value,
+    /// atomically.
+    ///
+    /// `f` receives the current value (None when the key does not exist)
+    /// and returns the new one. The key's entry stays locked from the read
+    /// until the new version is in place, so concurrent `update`s and
+    /// `put`s on the key cannot interleave and lose a write.
+    pub fn update(
+        &self,
+        namespace: impl Into<String>,
+        key: impl Into<String>,
+        f: impl FnOnce(Option<&JsonValue>) -> JsonValue,
+    ) -> DeltaResult<VersionedValue> {
+        use dashmap::mapref::entry::Entry;
+
+        match self.current_state.entry(FullKey::new(namespace, key)) {
+            Entry::Occupied(mut entry) => {
+                let value = f(Some(entry.get().value()));
+                let previous_version = Some(entry.get().write_id.clone());
+                let versioned = self.new_version(value, previous_version)?;
+                entry.insert(versioned.clone());
+                Ok(versioned)
+            }
+            Entry::Vacant(entry) => {
+                let versioned = self.new_version(f(None), None)?;
+                entry.insert(versioned.clone());
+                Ok(versioned)
+            }
+        }
+    }
+
+    /// Build and record a new version of a value whose previous write was
+    /// `previous_version`; the caller installs it as the current state.
+    ///
+    /// Touches only the engine, graphs, value store and version store, never
+    /// `current_state`, so it is safe to call while holding a state entry.
+    fn new_version(
+        &self,
+        value: JsonValue,
+        previous_version: Option<String>,
+    ) -> DeltaResult<VersionedValue> {
+        let timestamp = Utc::now();
+
         // Compute distinction via koru-lambda-core (unchanged, respected)
         let distinction = DocumentMapper::json_to_distinction(&value, &self.engine)?;
         let distinction_id = DocumentMapper::store_distinction_id(&distinction);
@@ -174,10 +225,6 @@ impl CausalStorage {
         self.version_store
             .insert(write_id.clone(), versioned.clone());
 
-        // Update current state
-        self.current_state
-            .insert(full_key.clone(), versioned.clone());
-
         Ok(versioned)
     }
 
@@ -225,6 +272,16 @@ impl CausalStorage {
         Ok(results)
     }
 
+    /// Look up an already-stored value by its content hash (distinction ID).
+    ///
+    /// Lets persistence replay reuse a value it has seen before instead of
+    /// reading and parsing it from disk again.
+    pub fn shared_value(&self, distinction_id: &str) -> Option<Arc<JsonValue>> {
+        self.value_store
+            .get(distinction_id)
+            .map(|v| Arc::clone(v.value()))
+    }
+
     /// Insert a versioned value directly (for persistence replay).
     ///
     /// This method preserves the original write_id and distinction_id from the WAL,
@@ -233,7 +290,7 @@ impl CausalStorage {
         &self,
         namespace: impl Into<String>,
         key: impl Into<String>,
-        versioned: VersionedValue,
+        mut versioned: VersionedValue,
     ) -> DeltaResult<()> {
         let full_key = FullKey::new(namespace, key);
         let write_id = versioned.write_id.clone();
@@ -249,10 +306,13 @@ impl CausalStorage {
         // Add to reference graph
         self.reference_graph.add_node(write_id.clone());
 
-        // Store value in value store (content-addressed)
-        self.value_store
+        // Store value in value store (content-addressed), and point the
+        // version at the shared copy so replayed duplicates are not kept twice
+        versioned.value = self
+            .value_store
             .entry(distinction_id)
-            .or_insert_with(|| versioned.value.clone());
+            .or_insert_with(|| Arc::clone(&versioned.value))
+            .clone();
 
         // Store in version store (keyed by write_id)
         self.version_store
@@ -597,9 +657,51 @@ impl CausalStorage {
             })
     }
 
+    /// Follow `previous_version` pointers from `head` back to the first write.
+    ///
+    /// Each step is a single version-store lookup, so walking a key costs
+    /// O(versions of that key) no matter how many other writes exist.
+    /// Versions are visited newest first.
+    fn for_each_version(&self, head: &VersionedValue, mut f: impl FnMut(&VersionedValue)) {
+        self.for_each_version_while(head, |versioned| {
+            f(versioned);
+            true
+        });
+    }
+
+    /// Like [`Self::for_each_version`], but stops as soon as `f` returns false.
+    fn for_each_version_while(
+        &self,
+        head: &VersionedValue,
+        mut f: impl FnMut(&VersionedValue) -> bool,
+    ) {
+        if !f(head) {
+            return;
+        }
+
+        // A chain can never be longer than the version store; the bound
+        // guards against a cyclic chain in imported data
+        let mut remaining = self.version_store.len();
+        let mut next = head.previous_version.clone();
+        while let Some(version_id) = next.take() {
+            if remaining == 0 {
+                break;
+            }
+            remaining -= 1;
+
+            let Some(versioned) = self.version_store.get(&version_id) else {
+                break;
+            };
+            if !f(&*versioned) {
+                break;
+            }
+            next = versioned.previous_version.clone();
+        }
+    }
+
     /// Get the value at a specific point in time (time travel).
     ///
-    /// Traverses the causal graph from current state backward,
+    /// Walks the key's version chain from current state backward,
     /// finding the most recent version at or before the given timestamp.
     pub fn get_at(
         &self,
@@ -609,52 +711,26 @@ impl CausalStorage {
     ) -> DeltaResult<VersionedValue> {
         let full_key = FullKey::new(namespace, key);
 
-        // Get current version's ID
         let current = self
             .current_state
             .get(&full_key)
+            .map(|v| v.clone())
             .ok_or_else(|| DeltaError::KeyNotFound {
                 namespace: full_key.namespace.clone(),
                 key: full_key.key.clone(),
             })?;
 
-        let current_id = current.write_id.clone();
-
-        // Traverse ancestors via causal graph
         // Find the version with the latest timestamp that is <= query timestamp
         let mut best_version: Option<VersionedValue> = None;
-        let mut to_visit = vec![current_id];
-        let mut visited = std::collections::HashSet::new();
-
-        while let Some(version_id) = to_visit.pop() {
-            if !visited.insert(version_id.clone()) {
-                continue;
-            }
-
-            // Get the versioned value from version store
-            if let Some(versioned) = self.version_store.get(&version_id) {
-                if versioned.timestamp <= timestamp {
-                    // This version is at or before the query timestamp
-                    // Keep it if it's the best (latest) so far
-                    match &best_version {
-                        None => best_version = Some(versioned.clone()),
-                        Some(best) => {
-                            if versioned.timestamp > best.timestamp {
-                                best_version = Some(versioned.clone());
-                            }
-                        }
-                    }
-                }
+        self.for_each_version(&current, |versioned| {
+            if versioned.timestamp <= timestamp
+                && best_version
+                    .as_ref()
+                    .is_none_or(|best| versioned.timestamp > best.timestamp)
+            {
+                best_version = Some(versioned.clone());
             }
-
-            // Add parents to visit
-            let parents = self.causal_graph.ancestors(&version_id);
-            for parent in parents {
-                if !visited.contains(&parent) {
-                    to_visit.push(parent);
-                }
-            }
-        }
+        });
 
         best_version.ok_or_else(|| DeltaError::NoValueAtTimestamp {
             namespace: full_key.namespace,
@@ -663,7 +739,7 @@ impl CausalStorage {
         })
     }
 
-    /// Get the complete history for a key via causal graph traversal.
+    /// Get the complete history for a key by walking its version chain.
     ///
     /// Returns all versions in causal order (oldest to newest).
     pub fn history(
@@ -677,39 +753,144 @@ impl CausalStorage {
         let current = self
             .current_state
             .get(&full_key)
+            .map(|v| v.clone())
             .ok_or_else(|| DeltaError::KeyNotFound {
                 namespace: full_key.namespace.clone(),
                 key: full_key.key.clone(),
             })?;
 
-        // Collect all versions via causal graph traversal
+        // Collect all versions by following the previous-version chain
         let mut versions: Vec<VersionedValue> = Vec::new();
-        let mut visited = std::collections::HashSet::new();
-        let mut to_visit = vec![current.write_id.clone()];
+        self.for_each_version(&current, |versioned| versions.push(versioned.clone()));
 
-        while let Some(version_id) = to_visit.pop() {
-            if !visited.insert(version_id.clone()) {
-                continue;
+        // Sort by timestamp (oldest first); the chain is newest first, so
+        // reversing leaves the stable sort little to do
+        versions.reverse();
+        versions.sort_by(|a, b| a.timestamp.cmp(&b.timestamp));
+
+        // Convert to HistoryEntry
+        Ok(versions.iter().map(HistoryEntry::from).collect())
+    }
+
+    /// Get the version written before `versioned`, if any.
+    ///
+    /// A single version-store lookup, so callers can walk a key's history
+    /// newest first one step at a time instead of materializing it.
+    pub fn previous(&self, versioned: &VersionedValue) -> Option<VersionedValue> {
+        let version_id = versioned.previous_version.as_deref()?;
+        self.version_store.get(version_id).map(|v| v.clone())
+    }
+
+    /// Get the earliest version of a key.
+    ///
+    /// Walks the version chain without cloning or converting the versions
+    /// in between, so reading the original value of a key does not cost a
+    /// full `history()`.
+    pub fn first_version(
+        &self,
+        namespace: impl Into<String>,
+        key: impl Into<String>,
+    ) -> DeltaResult<VersionedValue> {
+        let full_key = FullKey::new(namespace, key);
+
+        let current = self
+            .current_state
+            .get(&full_key)
+            .map(|v| v.clone())
+            .ok_or_else(|| DeltaError::KeyNotFound {
+                namespace: full_key.namespace.clone(),
+                key: full_key.key.clone(),
+            })?;
+
+        // Same ordering as history(): earliest timestamp wins, and on a tie
+        // the version further down the chain (the older write) does
+        let mut first_id = current.write_id.clone();
+        let mut first_ts = current.timestamp;
+        self.for_each_version(&current, |versioned| {
+            if versioned.timestamp <= first_ts {
+                first_ts = versioned.timestamp;
+                first_id.clone_from(&versioned.write_id);
             }
+        });
+
+        match self.version_store.get(&first_id) {
+            Some(versioned) => Ok(versioned.clone()),
+            None => Ok(current),
+        }
+    }
+
+    /// Get the `n` most recent versions of a key, oldest to newest.
+    ///
+    /// Stops walking the version chain after `n` steps, so the cost does
+    /// not grow with the length of the key's full history.
+    pub fn history_tail(
+        &self,
+        namespace: impl Into<String>,
+        key: impl Into<String>,
+        n: usize,
+    ) -> DeltaResult<Vec<HistoryEntry>> {
+        let full_key = FullKey::new(namespace, key);
+
+        let current = self
+            .current_state
+            .get(&full_key)
+            .map(|v| v.clone())
+            .ok_or_else(|| DeltaError::KeyNotFound {
+                namespace: full_key.namespace.clone(),
+                key: full_key.key.clone(),
+            })?;
 
-            // Get version from version store
-            if let Some(versioned) = self.version_store.get(&version_id) {
+        let mut versions: Vec<VersionedValue> = Vec::with_capacity(n);
+        if n > 0 {
+            self.for_each_version_while(&current, |versioned| {
                 versions.push(versioned.clone());
-            }
+                versions.len() < n
+            });
+        }
 
-            // Add parents
-            let parents = self.causal_graph.ancestors(&version_id);
-            for parent in parents {
-                if !visited.contains(&parent) {
-                    to_visit.push(parent);
-                }
+        versions.reverse();
+        versions.sort_by(|a, b| a.timestamp.cmp(&b.timestamp));
+
+        Ok(versions.iter().map(HistoryEntry::from).collect())
+    }
+
+    /// Get the versions of a key written in `[start, end)`, oldest to newest.
+    ///
+    /// The version chain is walked newest first, so versions after `end`
+    /// are skipped without being cloned and the walk stops at the first
+    /// version older than `start`.
+    pub fn history_between(
+        &self,
+        namespace: impl Into<String>,
+        key: impl Into<String>,
+        start: DateTime<Utc>,
+        end: DateTime<Utc>,
+    ) -> DeltaResult<Vec<HistoryEntry>> {
+        let full_key = FullKey::new(namespace, key);
+
+        let current = self
+            .current_state
+            .get(&full_key)
+            .map(|v| v.clone())
+            .ok_or_else(|| DeltaError::KeyNotFound {
+                namespace: full_key.namespace.clone(),
+                key: full_key.key.clone(),
+            })?;
+
+        let mut versions: Vec<VersionedValue> = Vec::new();
+        self.for_each_version_while(&current, |versioned| {
+            if versioned.timestamp < start {
+                return false;
             }
-        }
+            if versioned.timestamp < end {
+                versions.push(versioned.clone());
+            }
+            true
+        });
 
-        // Sort by timestamp (oldest first)
+        versions.reverse();
         versions.sort_by(|a, b| a.timestamp.cmp(&b.timestamp));
 
-        // Convert to HistoryEntry
         Ok(versions.iter().map(HistoryEntry::from).collect())
     }
 
@@ -744,6 +925,21 @@ impl CausalStorage {
         namespaces
     }
 
+    /// Count the current keys in each namespace with one pass.
+    pub fn namespace_key_counts(&self) -> std::collections::HashMap<String, usize> {
+        let mut counts = std::collections::HashMap::new();
+        for entry in self.current_state.iter() {
+            let namespace = &entry.key().namespace;
+            match counts.get_mut(namespace) {
+                Some(count) => *count += 1,
+                None => {
+                    counts.insert(namespace.clone(), 1);
+                }
+            }
+        }
+        counts
+    }
+
     /// Get all keys in a specific namespace.
     pub fn list_keys(&self, namespace: &str) -> Vec<String> {
         let mut keys: Vec<String> = self
@@ -757,6 +953,115 @@ impl CausalStorage {
         keys
     }
 
+    /// Get the keys of several namespaces in one pass over the current state.
+    ///
+    /// Every requested namespace appears in the result, with an empty list
+    /// if it has no keys. Keys are sorted, as with `list_keys`.
+    pub fn list_keys_many(
+        &self,
+        namespaces: &[&str],
+    ) -> std::collections::HashMap<String, Vec<String>> {
+        let mut result: std::collections::HashMap<String, Vec<String>> = namespaces
+            .iter()
+            .map(|ns| (ns.to_string(), Vec::new()))
+            .collect();
+
+        for entry in self.current_state.iter() {
+            if let Some(keys) = result.get_mut(&entry.key().namespace) {
+                keys.push(entry.key().key.clone());
+            }
+        }
+
+        for keys in result.values_mut() {
+            keys.sort();
+        }
+        result
+    }
+
+    /// Count the current values of a namespace by one top-level field.
+    ///
+    /// String fields are grouped by their text, other values by their JSON
+    /// encoding. Values without the field are counted under `default` when
+    /// given and skipped otherwise; deleted keys are skipped. Values are
+    /// read in place, so nothing is cloned per entry.
+    pub fn count_by_field(
+        &self,
+        namespace: &str,
+        field: &str,
+        default: Option<&str>,
+    ) -> std::collections::HashMap<String, usize> {
+        let mut counts: std::collections::HashMap<String, usize> = std::collections::HashMap::new();
+        let mut bump = |group: &str| match counts.get_mut(group) {
+            Some(count) => *count += 1,
+            None => {
+                counts.insert(group.to_string(), 1);
+            }
+        };
+
+        for entry in self.current_state.iter() {
+            if entry.key().namespace != namespace {
+                continue;
+            }
+            let value = entry.value().value();
+            if value.is_null() {
+                continue;
+            }
+            match value.get(field) {
+                Some(JsonValue::String(s)) => bump(s),
+                Some(other) => bump(&other.to_string()),
+                None => {
+                    if let Some(default) = default {
+                        bump(default);
+                    }
+                }
+            }
+        }
+        counts
+    }
+
+    /// Test a string field of every current value in a namespace for a
+    /// substring, case-insensitively.
+    ///
+    /// `needle` must already be lowercase. Returns `(key, matched, number)`
+    /// for each value passing `filters`, where `number` is `number_field`
+    /// read as a float; deleted keys are skipped. ASCII fields are folded
+    /// into a reused buffer and searched with a SIMD `memmem`, so values
+    /// are never cloned and no string is allocated per entry.
+    pub fn filter_contains(
+        &self,
+        namespace: &str,
+        field: &str,
+        needle: &str,
+        number_field: &str,
+        filters: &[Filter],
+    ) -> Vec<(String, bool, Option<f64>)> {
+        let finder = memchr::memmem::Finder::new(needle.as_bytes());
+        let mut folded = Vec::new();
+        let mut hits = Vec::new();
+
+        for entry in self.current_state.iter() {
+            if entry.key().namespace != namespace {
+                continue;
+            }
+            let value = entry.value().value();
+            if value.is_null() || !filters.iter().all(|f| f.matches_value(value)) {
+                continue;
+            }
+            let matched = match value.get(field).and_then(JsonValue::as_str) {
+                Some(s) if s.is_ascii() => {
+                    folded.clear();
+                    folded.extend(s.bytes().map(|b| b.to_ascii_lowercase()));
+                    finder.find(&folded).is_some()
+                }
+                Some(s) => finder.find(s.to_lowercase().as_bytes()).is_some(),
+                None => false,
+            };
+            let number = value.get(number_field).and_then(JsonValue::as_f64);
+            hits.push((entry.key().key.clone(), matched, number));
+        }
+        hits
+    }
+
     /// Scan all key-value pairs in a namespace.
     pub fn scan_collection(&self, namespace: &str) -> Vec<(String, VersionedValue)> {
         self.current_state
@@ -801,38 +1106,19 @@ impl CausalStorage {
             .map(|entry| (entry.key().clone(), entry.value().clone()))
             .collect();
 
-        // Build history log from causal graph - traverse and collect all versions
+        // Build history log by walking each key's version chain
         let mut history_log: HashMap<FullKey, Vec<VersionedValue>> = HashMap::new();
 
         for entry in self.current_state.iter() {
             let key = entry.key().clone();
             let current = entry.value().clone();
 
-            // Traverse causal graph to collect all versions
+            // Follow the version chain to collect all versions
             let mut history = Vec::new();
-            let mut visited = std::collections::HashSet::new();
-            let mut to_visit = vec![current.write_id.clone()];
-
-            while let Some(write_id) = to_visit.pop() {
-                if !visited.insert(write_id.clone()) {
-                    continue;
-                }
-
-                // Get the version from version store
-                if let Some(versioned) = self.version_store.get(&write_id) {
-                    history.push(versioned.clone());
-                }
-
-                // Add parents to visit
-                let parents = self.causal_graph.ancestors(&write_id);
-                for parent in parents {
-                    if !visited.contains(&parent) {
-                        to_visit.push(parent);
-                    }
-                }
-            }
+            self.for_each_version(&current, |versioned| history.push(versioned.clone()));
 
             // Sort by timestamp (oldest first) for consistent ordering
+            history.reverse();
             history.sort_by(|a, b| a.timestamp.cmp(&b.timestamp));
             history_log.insert(key, history);
         }
@@ -927,6 +1213,30 @@ mod tests {
         assert_eq!(retrieved.value(), &value);
     }
 
+    #[test]
+    fn test_insert_direct_shares_identical_values() {
+        let storage = create_storage();
+        let v1 = storage
+            .put("accounts", "alice", json!({"balance": 10}))
+            .unwrap();
+
+        // Same content arriving through replay as a separate allocation
+        let replayed = VersionedValue::new(
+            Arc::new(json!({"balance": 10})),
+            v1.timestamp(),
+            format!("{}_replayed", v1.distinction_id()),
+            v1.distinction_id().to_string(),
+            None,
+            VectorClock::new(),
+        );
+        storage.insert_direct("accounts", "bob", replayed).unwrap();
+
+        let bob = storage.get("accounts", "bob").unwrap();
+        assert!(Arc::ptr_eq(&bob.value, &v1.value));
+        assert!(storage.shared_value(v1.distinction_id()).is_some());
+        assert!(storage.shared_value("missing").is_none());
+    }
+
     #[test]
     fn test_get_nonexistent_key() {
         let storage = create_storage();
@@ -958,6 +1268,111 @@ mod tests {
         assert!(storage.causal_graph.contains(v2.write_id()));
     }
 
+    #[test]
+    fn test_history_and_get_at_follow_version_chain() {
+        let storage = create_storage();
+
+        let v1 = storage
+            .put("tx", "a", json!({"status": "pending"}))
+            .unwrap();
+        thread::sleep(Duration::from_millis(5));
+        // Unrelated writes must not show up in another key's history
+        storage.put("tx", "b", json!({"status": "other"})).unwrap();
+        thread::sleep(Duration::from_millis(5));
+        let v2 = storage.put("tx", "a", json!({"status": "done"})).unwrap();
+
+        let history = storage.history("tx", "a").unwrap();
+        let statuses: Vec<_> = history.iter().map(|h| h.value["status"].clone()).collect();
+        assert_eq!(statuses, vec![json!("pending"), json!("done")]);
+
+        let at_v1 = storage.get_at("tx", "a", v1.timestamp()).unwrap();
+        assert_eq!(at_v1.write_id(), v1.write_id());
+        let at_v2 = storage.get_at("tx", "a", v2.timestamp()).unwrap();
+        assert_eq!(at_v2.write_id(), v2.write_id());
+    }
+
+    #[test]
+    fn test_first_version_returns_original_value() {
+        let storage = create_storage();
+
+        for i in 1..=3 {
+            storage.put("test", "key", json!(i)).unwrap();
+            thread::sleep(Duration::from_millis(2));
+        }
+
+        let first = storage.first_version("test", "key").unwrap();
+        assert_eq!(*first.value(), json!(1));
+        assert!(first.previous_version().is_none());
+        assert!(storage.first_version("test", "missing").is_err());
+    }
+
+    #[test]
+    fn test_previous_walks_back_one_version() {
+        let storage = create_storage();
+
+        for i in 1..=3 {
+            storage.put("test", "key", json!(i)).unwrap();
+            thread::sleep(Duration::from_millis(2));
+        }
+
+        let mut values = Vec::new();
+        let mut next = Some(storage.get("test", "key").unwrap());
+        while let Some(versioned) = next {
+            values.push(versioned.value().clone());
+            next = storage.previous(&versioned);
+        }
+        assert_eq!(values, vec![json!(3), json!(2), json!(1)]);
+    }
+
+    #[test]
+    fn test_history_tail_returns_latest_versions() {
+        let storage = create_storage();
+
+        for i in 1..=4 {
+            storage.put("test", "key", json!(i)).unwrap();
+            thread::sleep(Duration::from_millis(2));
+        }
+
+        let tail = storage.history_tail("test", "key", 2).unwrap();
+        let values: Vec<_> = tail.iter().map(|h| h.value.clone()).collect();
+        assert_eq!(values, vec![json!(3), json!(4)]);
+
+        assert_eq!(storage.history_tail("test", "key", 10).unwrap().len(), 4);
+        assert!(storage.history_tail("test", "key", 0).unwrap().is_empty());
+        assert!(storage.history_tail("test", "missing", 2).is_err());
+    }
+
+    #[test]
+    fn test_history_between_returns_window() {
+        let storage = create_storage();
+
+        let mut written = Vec::new();
+        for i in 1..=4 {
+            written.push(storage.put("test", "key", json!(i)).unwrap());
+            thread::sleep(Duration::from_millis(2));
+        }
+
+        // Half-open window: includes the 2nd write, excludes the 4th
+        let window = storage
+            .history_between(
+                "test",
+                "key",
+                written[1].timestamp(),
+                written[3].timestamp(),
+            )
+            .unwrap();
+        let values: Vec<_> = window.iter().map(|h| h.value.clone()).collect();
+        assert_eq!(values, vec![json!(2), json!(3)]);
+
+        let before = written[0].timestamp() - chrono::Duration::seconds(1);
+        assert!(
+            storage
+                .history_between("test", "key", before, written[0].timestamp())
+                .unwrap()
+                .is_empty()
+        );
+    }
+
     #[test]
     fn test_causal_graph_populated() {
         let storage = create_storage();
@@ -1059,6 +1474,128 @@ mod tests {
         assert_eq!(session_keys, vec!["s1"]);
     }
 
+    #[test]
+    fn test_list_keys_many() {
+        let storage = create_storage();
+        storage.put("features", "b", json!(1)).unwrap();
+        storage.put("features", "a", json!(1)).unwrap();
+        storage.put("envs", "prod", json!(1)).unwrap();
+        storage.put("other", "x", json!(1)).unwrap();
+
+        let keys = storage.list_keys_many(&["features", "envs", "empty"]);
+        assert_eq!(keys.len(), 3);
+        assert_eq!(keys["features"], vec!["a", "b"]);
+        assert_eq!(keys["envs"], vec!["prod"]);
+        assert!(keys["empty"].is_empty());
+    }
+
+    #[test]
+    fn test_count_by_field() {
+        let storage = create_storage();
+        storage
+            .put("mem", "a", json!({"type": "episodic"}))
+            .unwrap();
+        storage
+            .put("mem", "b", json!({"type": "semantic"}))
+            .unwrap();
+        storage
+            .put("mem", "c", json!({"type": "episodic"}))
+            .unwrap();
+        storage.put("mem", "d", json!({"other": 1})).unwrap();
+        storage
+            .put("mem", "e", json!({"type": "semantic"}))
+            .unwrap();
+        storage.put("mem", "e", JsonValue::Null).unwrap();
+        storage
+            .put("other", "x", json!({"type": "episodic"}))
+            .unwrap();
+
+        let counts = storage.count_by_field("mem", "type", None);
+        assert_eq!(counts.len(), 2);
+        assert_eq!(counts["episodic"], 2);
+        assert_eq!(counts["semantic"], 1);
+
+        let counts = storage.count_by_field("mem", "type", Some("episodic"));
+        assert_eq!(counts["episodic"], 3);
+    }
+
+    #[test]
+    fn test_filter_contains() {
+        let storage = create_storage();
+        storage
+            .put(
+                "mem",
+                "a",
+                json!({"content": "Likes DARK mode", "importance": 0.9, "type": "episodic"}),
+            )
+            .unwrap();
+        storage
+            .put(
+                "mem",
+                "b",
+                json!({"content": "Knows Python", "importance": 0.4, "type": "semantic"}),
+            )
+            .unwrap();
+        storage
+            .put(
+                "mem",
+                "c",
+                json!({"content": "Écrit en français", "type": "semantic"}),
+            )
+            .unwrap();
+        storage
+            .put("mem", "d", json!({"content": "dark theme"}))
+            .unwrap();
+        storage.put("mem", "d", JsonValue::Null).unwrap();
+
+        let mut hits = storage.filter_contains("mem", "content", "dark", "importance", &[]);
+        hits.sort_by(|x, y| x.0.cmp(&y.0));
+        assert_eq!(
+            hits,
+            vec![
+                ("a".to_string(), true, Some(0.9)),
+                ("b".to_string(), false, Some(0.4)),
+                ("c".to_string(), false, None),
+            ]
+        );
+
+        let hits = storage.filter_contains(
+            "mem",
+            "content",
+            "écrit",
+            "importance",
+            &[Filter::eq("type", "semantic")],
+        );
+        assert_eq!(hits.len(), 2);
+        assert!(hits.iter().any(|(k, matched, _)| k == "c" && *matched));
+    }
+
+    #[test]
+    fn test_concurrent_updates_lose_nothing() {
+        let storage = Arc::new(create_storage());
+        let handles: Vec<_> = (0..8)
+            .map(|_| {
+                let storage = Arc::clone(&storage);
+                thread::spawn(move || {
+                    for _ in 0..50 {
+                        storage
+                            .update("counters", "hits", |current| {
+                                json!(current.and_then(JsonValue::as_i64).unwrap_or(0) + 1)
+                            })
+                            .unwrap();
+                    }
+                })
+            })
+            .collect();
+        for handle in handles {
+            handle.join().unwrap();
+        }
+
+        let current = storage.get("counters", "hits").unwrap();
+        assert_eq!(*current.value(), json!(400));
+        assert_eq!(storage.history("counters", "hits").unwrap().len(), 400);
+    }
+
     #[test]
     fn test_concurrent_writes() {
         let storage = Arc::new(create_storage());
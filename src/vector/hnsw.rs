@@ -681,10 +681,12 @@ impl super::index::AnnIndex for HnswIndex {
         opts: &super::types::VectorSearchOptions,
     ) -> Vec<VectorSearchResult> {
         let results = self.search(query, opts.top_k, self.config.ef_search);
-        // Filter by threshold
+        // Filter by threshold and namespace. The graph spans every
+        // namespace, so a namespace filter here is applied after the walk
+        // and may return fewer than top_k
         results
             .into_iter()
-            .filter(|r| r.score >= opts.threshold)
+            .filter(|r| r.score >= opts.threshold && opts.matches_namespace(&r.namespace))
             .collect()
     }
 
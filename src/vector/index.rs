@@ -6,7 +6,7 @@
 //!
 //! Future: HNSW or IVF indexes for larger datasets.
 
-use super::types::{Vector, VectorSearchOptions, VectorSearchResult};
+use super::types::{QuantizedVector, Vector, VectorSearchOptions, VectorSearchResult};
 use crate::types::FullKey;
 use dashmap::DashMap;
 use std::sync::Arc;
@@ -19,6 +19,14 @@ pub trait AnnIndex: Send + Sync {
     /// Add a vector to the index.
     fn add(&self, key: FullKey, vector: Vector);
 
+    /// Add an int8-quantized vector to the index.
+    ///
+    /// Indexes without a quantized representation store the dequantized
+    /// vector instead.
+    fn add_quantized(&self, key: FullKey, vector: QuantizedVector) {
+        self.add(key, vector.dequantize());
+    }
+
     /// Remove a vector from the index.
     fn remove(&self, namespace: &str, key: &str);
 
@@ -51,6 +59,8 @@ pub trait AnnIndex: Send + Sync {
 pub struct FlatIndex {
     /// namespace -> (key -> Vector)
     vectors: DashMap<String, DashMap<String, Vector>>,
+    /// namespace -> (key -> QuantizedVector), for int8 embeddings
+    quantized: DashMap<String, DashMap<String, QuantizedVector>>,
 }
 
 impl FlatIndex {
@@ -58,6 +68,7 @@ impl FlatIndex {
     pub fn new() -> Self {
         Self {
             vectors: DashMap::new(),
+            quantized: DashMap::new(),
         }
     }
 
@@ -77,19 +88,21 @@ impl Default for FlatIndex {
 
 impl AnnIndex for FlatIndex {
     fn add(&self, key: FullKey, vector: Vector) {
+        // A key lives in exactly one representation
+        remove_from(&self.quantized, &key.namespace, &key.key);
         let namespace_entry = self.vectors.entry(key.namespace).or_default();
         namespace_entry.insert(key.key, vector);
     }
 
+    fn add_quantized(&self, key: FullKey, vector: QuantizedVector) {
+        remove_from(&self.vectors, &key.namespace, &key.key);
+        let namespace_entry = self.quantized.entry(key.namespace).or_default();
+        namespace_entry.insert(key.key, vector);
+    }
+
     fn remove(&self, namespace: &str, key: &str) {
-        if let Some(namespace_entry) = self.vectors.get(namespace) {
-            namespace_entry.remove(key);
-            // Clean up empty namespaces
-            if namespace_entry.is_empty() {
-                drop(namespace_entry);
-                self.vectors.remove(namespace);
-            }
-        }
+        remove_from(&self.vectors, namespace, key);
+        remove_from(&self.quantized, namespace, key);
     }
 
     fn search(&self, query: &Vector, opts: &VectorSearchOptions) -> Vec<VectorSearchResult> {
@@ -99,6 +112,11 @@ impl AnnIndex for FlatIndex {
         for namespace_entry in self.vectors.iter() {
             let namespace = namespace_entry.key();
 
+            // Skip other namespaces before anything is ranked
+            if !opts.matches_namespace(namespace) {
+                continue;
+            }
+
             for vector_entry in namespace_entry.value().iter() {
                 let key = vector_entry.key();
                 let vector = vector_entry.value();
@@ -130,6 +148,41 @@ impl AnnIndex for FlatIndex {
             }
         }
 
+        // Scan int8 vectors with a quantized copy of the query; only the
+        // survivors are dequantized for the result
+        if !self.quantized.is_empty() {
+            let quantized_query = QuantizedVector::from_vector(query);
+
+            for namespace_entry in self.quantized.iter() {
+                let namespace = namespace_entry.key();
+
+                if !opts.matches_namespace(namespace) {
+                    continue;
+                }
+
+                for vector_entry in namespace_entry.value().iter() {
+                    let vector = vector_entry.value();
+
+                    if let Some(ref model_filter) = opts.model_filter {
+                        if vector.model() != model_filter {
+                            continue;
+                        }
+                    }
+
+                    if let Some(similarity) = quantized_query.cosine_similarity(vector) {
+                        if similarity >= opts.threshold {
+                            results.push(VectorSearchResult::new(
+                                namespace.clone(),
+                                vector_entry.key().clone(),
+                                similarity,
+                                vector.dequantize(),
+                            ));
+                        }
+                    }
+                }
+            }
+        }
+
         // Sort by similarity (highest first)
         results.sort_by(|a, b| {
             b.score
@@ -144,15 +197,36 @@ impl AnnIndex for FlatIndex {
     }
 
     fn len(&self) -> usize {
-        self.vectors.iter().map(|entry| entry.value().len()).sum()
+        self.vectors
+            .iter()
+            .map(|entry| entry.value().len())
+            .sum::<usize>()
+            + self
+                .quantized
+                .iter()
+                .map(|entry| entry.value().len())
+                .sum::<usize>()
     }
 
     fn is_empty(&self) -> bool {
-        self.vectors.is_empty()
+        self.vectors.is_empty() && self.quantized.is_empty()
     }
 
     fn clear(&self) {
         self.vectors.clear();
+        self.quantized.clear();
+    }
+}
+
+/// Remove a key from a namespaced map, dropping the namespace once empty.
+fn remove_from<V>(map: &DashMap<String, DashMap<String, V>>, namespace: &str, key: &str) {
+    if let Some(namespace_entry) = map.get(namespace) {
+        namespace_entry.remove(key);
+        // Clean up empty namespaces
+        if namespace_entry.is_empty() {
+            drop(namespace_entry);
+            map.remove(namespace);
+        }
     }
 }
 
@@ -183,6 +257,11 @@ impl VectorIndex {
         self.inner.add(key, vector);
     }
 
+    /// Add an int8-quantized vector to the index.
+    pub fn add_quantized(&self, key: FullKey, vector: QuantizedVector) {
+        self.inner.add_quantized(key, vector);
+    }
+
     /// Remove a vector from the index.
     pub fn remove(&self, namespace: &str, key: &str) {
         self.inner.remove(namespace, key);
@@ -288,6 +367,33 @@ mod tests {
         assert_eq!(results[0].key, "doc1");
     }
 
+    #[test]
+    fn test_flat_index_namespace_filter() {
+        let index = FlatIndex::new();
+
+        // Closer matches in another namespace must not crowd out "mine"
+        for i in 0..5 {
+            let v = Vector::new(vec![1.0, 0.0], "test");
+            index.add(FullKey::new("other", format!("doc{}", i)), v);
+        }
+        index.add(
+            FullKey::new("mine", "doc"),
+            Vector::new(vec![0.5, 0.5], "test"),
+        );
+        index.add_quantized(
+            FullKey::new("mine", "q"),
+            QuantizedVector::from_vector(&Vector::new(vec![0.2, 0.8], "test")),
+        );
+
+        let query = Vector::new(vec![1.0, 0.0], "test");
+        let opts = VectorSearchOptions::new().top_k(2).namespace_filter("mine");
+        let results = index.search(&query, &opts);
+
+        assert_eq!(results.len(), 2);
+        assert!(results.iter().all(|r| r.namespace == "mine"));
+        assert_eq!(results[0].key, "doc");
+    }
+
     #[test]
     fn test_flat_index_remove() {
         let index = FlatIndex::new();
@@ -316,6 +422,34 @@ mod tests {
         assert!(results.is_empty());
     }
 
+    #[test]
+    fn test_flat_index_quantized() {
+        let index = FlatIndex::new();
+
+        let v1 = Vector::new(vec![1.0, 0.0, 0.0], "test");
+        let v2 = Vector::new(vec![0.0, 1.0, 0.0], "test");
+
+        index.add_quantized(
+            FullKey::new("docs", "doc1"),
+            QuantizedVector::from_vector(&v1),
+        );
+        index.add(FullKey::new("docs", "doc2"), v2);
+        assert_eq!(index.len(), 2);
+
+        let query = Vector::new(vec![0.9, 0.1, 0.0], "test");
+        let results = index.search(&query, &VectorSearchOptions::new().top_k(2));
+        assert_eq!(results[0].key, "doc1");
+        assert!(results[0].score > 0.9);
+
+        // Re-adding as f32 replaces the quantized copy
+        index.add(FullKey::new("docs", "doc1"), v1);
+        assert_eq!(index.len(), 2);
+
+        index.remove("docs", "doc1");
+        index.remove("docs", "doc2");
+        assert!(index.is_empty());
+    }
+
     #[test]
     fn test_vector_index_wrapper() {
         let index = VectorIndex::new_flat();
@@ -52,7 +52,7 @@ pub use snsw::{
     SearchResult, SearchTier, SynthesisEdge, SynthesisExplanation, SynthesisGraph, SynthesisNode,
     SynthesisPath, SynthesisProximity, SynthesisType,
 };
-pub use types::{Vector, VectorSearchOptions, VectorSearchResult};
+pub use types::{QuantizedVector, Vector, VectorSearchOptions, VectorSearchResult};
 
 // Re-export snsw module for advanced usage
 pub use snsw as synthesis_navigable;
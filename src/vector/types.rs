@@ -337,6 +337,120 @@ impl fmt::Display for Vector {
     }
 }
 
+/// An int8-quantized vector for compact similarity scans.
+///
+/// Each component is stored as `round(x / scale)` with a symmetric
+/// per-vector `scale = max(|x|) / 127`, so the vector takes a quarter of
+/// the memory of its `f32` form. Cosine similarity is scale-invariant, so
+/// two quantized vectors are compared with an integer dot product alone.
+///
+/// # Example
+///
+/// ```ignore
+/// let v = Vector::new(vec![0.1, 0.2, 0.3], "text-embedding-3-small");
+/// let q = QuantizedVector::from_vector(&v);
+/// let sim = q.cosine_similarity(&QuantizedVector::from_vector(&v));
+/// ```
+#[derive(Debug, Clone)]
+pub struct QuantizedVector {
+    /// Quantized components
+    data: Arc<[i8]>,
+    /// Multiplier that maps a quantized component back to f32
+    scale: f32,
+    /// The embedding model used to generate this vector
+    model: String,
+    /// Pre-computed squared magnitude in quantized units
+    norm_sq: i64,
+}
+
+impl QuantizedVector {
+    /// Quantize an `f32` vector with a symmetric per-vector scale.
+    pub fn from_vector(vector: &Vector) -> Self {
+        let max_abs = vector
+            .as_slice()
+            .iter()
+            .fold(0.0f32, |acc, &x| acc.max(x.abs()));
+        let scale = if max_abs > 0.0 { max_abs / 127.0 } else { 1.0 };
+
+        let data: Vec<i8> = vector
+            .as_slice()
+            .iter()
+            .map(|&x| (x / scale).round().clamp(-127.0, 127.0) as i8)
+            .collect();
+        let norm_sq = data.iter().map(|&q| i64::from(q) * i64::from(q)).sum();
+
+        Self {
+            data: Arc::from(data.into_boxed_slice()),
+            scale,
+            model: vector.model().to_string(),
+            norm_sq,
+        }
+    }
+
+    /// Get the quantized components.
+    pub fn as_slice(&self) -> &[i8] {
+        &self.data
+    }
+
+    /// Get the dequantization scale.
+    pub fn scale(&self) -> f32 {
+        self.scale
+    }
+
+    /// Get the number of dimensions.
+    pub fn dimensions(&self) -> usize {
+        self.data.len()
+    }
+
+    /// Get the embedding model identifier.
+    pub fn model(&self) -> &str {
+        &self.model
+    }
+
+    /// Reconstruct an approximate `f32` vector.
+    pub fn dequantize(&self) -> Vector {
+        let data = self
+            .data
+            .iter()
+            .map(|&q| f32::from(q) * self.scale)
+            .collect();
+        Vector::new(data, self.model.clone())
+    }
+
+    /// Compute cosine similarity with another quantized vector.
+    ///
+    /// The dot product is accumulated in `i32` lanes (each product is at
+    /// most 127², so chunks of 4096 cannot overflow), which the compiler
+    /// vectorizes into widening integer multiply-adds.
+    ///
+    /// Returns None if dimensions don't match.
+    pub fn cosine_similarity(&self, other: &QuantizedVector) -> Option<f32> {
+        if self.dimensions() != other.dimensions() {
+            return None;
+        }
+
+        if self.norm_sq == 0 || other.norm_sq == 0 {
+            return Some(0.0);
+        }
+
+        let dot: i64 = self
+            .data
+            .chunks(4096)
+            .zip(other.data.chunks(4096))
+            .map(|(a, b)| {
+                let partial: i32 = a
+                    .iter()
+                    .zip(b.iter())
+                    .map(|(&x, &y)| i32::from(x) * i32::from(y))
+                    .sum();
+                i64::from(partial)
+            })
+            .sum();
+
+        Some((dot as f64 / ((self.norm_sq as f64) * (other.norm_sq as f64)).sqrt()) as f32)
+    }
+}
+
 /// A search result containing a vector and its similarity score.
 #[derive(Debug, Clone)]
 pub struct VectorSearchResult {
@@ -376,6 +490,8 @@ pub struct VectorSearchOptions {
     pub threshold: f32,
     /// Filter by model (optional)
     pub model_filter: Option<String>,
+    /// Restrict the search to one namespace (optional)
+    pub namespace_filter: Option<String>,
 }
 
 impl VectorSearchOptions {
@@ -385,11 +501,13 @@ impl VectorSearchOptions {
     /// - top_k: 10
     /// - threshold: 0.0 (no filtering)
     /// - model_filter: None
+    /// - namespace_filter: None
     pub fn new() -> Self {
         Self {
             top_k: 10,
             threshold: 0.0,
             model_filter: None,
+            namespace_filter: None,
         }
     }
 
@@ -410,6 +528,22 @@ impl VectorSearchOptions {
         self.model_filter = Some(model.into());
         self
     }
+
+    /// Only search vectors stored in `namespace`.
+    ///
+    /// The filter is applied while scanning, before `top_k` is taken, so
+    /// vectors in other namespaces never crowd out matches in this one.
+    pub fn namespace_filter(mut self, namespace: impl Into<String>) -> Self {
+        self.namespace_filter = Some(namespace.into());
+        self
+    }
+
+    /// Whether vectors in `namespace` pass the namespace filter.
+    pub fn matches_namespace(&self, namespace: &str) -> bool {
+        self.namespace_filter
+            .as_deref()
+            .is_none_or(|filter| filter == namespace)
+    }
 }
 
 impl Default for VectorSearchOptions {
@@ -541,6 +675,41 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_quantized_similarity_tracks_f32() {
+        let v1 = Vector::new(vec![0.9, 0.1, 0.3, 0.8, 0.2], "test");
+        let v2 = Vector::new(vec![0.85, 0.15, 0.35, 0.75, 0.25], "test");
+        let exact = v1.cosine_similarity(&v2).unwrap();
+
+        let q1 = QuantizedVector::from_vector(&v1);
+        let q2 = QuantizedVector::from_vector(&v2);
+        let approx = q1.cosine_similarity(&q2).unwrap();
+
+        assert!((exact - approx).abs() < 0.01);
+        assert_eq!(q1.model(), "test");
+        assert_eq!(q1.as_slice()[0], 127);
+    }
+
+    #[test]
+    fn test_quantized_dequantize_and_zero_vector() {
+        let v = Vector::new(vec![-2.0, 1.0, 0.0], "test");
+        let restored = QuantizedVector::from_vector(&v).dequantize();
+        for (a, b) in v.as_slice().iter().zip(restored.as_slice()) {
+            assert!((a - b).abs() < 0.02);
+        }
+
+        let zero = QuantizedVector::from_vector(&Vector::new(vec![0.0, 0.0, 0.0], "test"));
+        let q = QuantizedVector::from_vector(&v);
+        assert_eq!(q.cosine_similarity(&zero), Some(0.0));
+        assert!(
+            q.cosine_similarity(&QuantizedVector::from_vector(&Vector::new(
+                vec![1.0],
+                "test"
+            )))
+            .is_none()
+        );
+    }
+
     #[test]
     fn test_vector_display() {
         let v = Vector::new(vec![1.0, 2.0, 3.0], "test-model");